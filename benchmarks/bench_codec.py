@@ -0,0 +1,85 @@
+"""Redis 값 코덱 크기/지연 벤치마크 (keyword.yaml 실제 키워드 기준)
+
+실행:
+    python -m benchmarks.bench_codec [반복 횟수]
+"""
+
+import sys
+import json
+import time
+from typing import Any, Iterable
+
+from benchmarks.bench_keyword_seeding import make_country
+from databases.cache.codec import JSON_CODEC, ValueCodec
+from databases.keyword_generator import iter_canonical_pairs, load_countries_from_yaml
+
+
+class LegacyMemberCodec:
+    """기존 store_stream/store_sharded 멤버 형식 (모든 값을 JSON 으로)"""
+
+    def encode(self, value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    def decode(self, value: bytes) -> Any:
+        return json.loads(value)
+
+
+# 이름 -> (값 하나로 저장할 때, 멤버로 저장할 때)
+CODECS = {
+    "json (기존)": (JSON_CODEC, LegacyMemberCodec()),
+    "msgpack": (ValueCodec(compression=None),) * 2,
+    # 기본 설정 (512 byte 이상만 압축, 짧은 멤버는 msgpack 그대로)
+    "msgpack+zstd": (ValueCodec(),) * 2,
+}
+
+
+def keyword_sets() -> dict[str, list[Any]]:
+    """저장되는 형태 그대로의 키워드 집합"""
+    country = load_countries_from_yaml()["KR"]
+    return {
+        "KR:question": list(country.iter_question_templates()),
+        "korea_combination": [
+            list(pair) for pair in iter_canonical_pairs(country.core_keywords, synonyms=country.synonyms)
+        ],
+        "mixin_combination": [list(pair) for pair in country.iter_search_queries()],
+        "BENCH:question (100x100)": list(make_country(100).iter_question_templates()),
+    }
+
+
+def measure(codec: Any, values: Iterable[Any], repeat: int) -> tuple[int, float, float]:
+    """(저장 바이트 수, 인코딩 us, 디코딩 us) - repeat 회 평균"""
+    values = list(values)
+    encoded = [codec.encode(value) for value in values]
+    size = sum(len(v.encode("utf-8") if isinstance(v, str) else v) for v in encoded)
+    # Redis 에서 읽으면 bytes 로 오므로 디코딩도 bytes 기준
+    raw = [v.encode("utf-8") if isinstance(v, str) else v for v in encoded]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in values:
+            codec.encode(value)
+    encode_us = (time.perf_counter() - start) / repeat * 1e6
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in raw:
+            codec.decode(value)
+    decode_us = (time.perf_counter() - start) / repeat * 1e6
+    return size, encode_us, decode_us
+
+
+def run(repeat: int = 20) -> None:
+    for name, items in keyword_sets().items():
+        print(f"\n{name} ({len(items):,}건)")
+        print(f"  {'codec':<14}{'형태':<8}{'bytes':>12}{'encode us':>12}{'decode us':>12}")
+        for codec_name, (blob_codec, member_codec) in CODECS.items():
+            # 목록 전체를 값 하나로 (store_data / fetch_data)
+            blob = measure(blob_codec, [items], repeat)
+            # 항목별 (store_stream / store_sharded 멤버)
+            members = measure(member_codec, items, repeat)
+            for shape, (size, enc, dec) in (("blob", blob), ("member", members)):
+                print(f"  {codec_name:<14}{shape:<8}{size:>12,}{enc:>12,.0f}{dec:>12,.0f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
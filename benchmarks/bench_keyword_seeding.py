@@ -0,0 +1,49 @@
+"""질문 키워드 생성 + Redis 청크 저장 벤치마크
+
+실행:
+    python -m benchmarks.bench_keyword_seeding [키워드 수]          # 생성만 측정
+    python -m benchmarks.bench_keyword_seeding [키워드 수] --redis  # database.yaml 클러스터에 저장
+"""
+
+import sys
+import time
+import tracemalloc
+
+from databases.keyword_generator import BaseCountry, load_countries_from_yaml
+
+
+def make_country(size: int) -> BaseCountry:
+    """keyword.yaml 템플릿에 size x size 키워드를 채운 가상 국가"""
+    templates = load_countries_from_yaml()["KR"].templates
+    return BaseCountry(
+        name="BENCH",
+        core_keywords=[f"핵심{i}" for i in range(size)],
+        context_keywords=[f"산업{i}" for i in range(size)],
+        templates=templates,
+    )
+
+
+def run(size: int = 500, redis: bool = False) -> None:
+    country = make_country(size)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    if redis:
+        from databases.cache.redis_cluster_manager import RedisClusterManager
+
+        count = RedisClusterManager().store_stream(
+            "BENCH:question", country.iter_question_templates()
+        )
+    else:
+        count = sum(1 for _ in country.iter_question_templates())
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"questions : {count:,}")
+    print(f"elapsed   : {elapsed:.2f}s (tracemalloc 포함)")
+    print(f"peak mem  : {peak / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500, "--redis" in sys.argv)
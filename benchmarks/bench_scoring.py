@@ -0,0 +1,67 @@
+"""NewsWeightScoring 기사별 계산 vs 배치 계산 벤치마크
+
+실행:
+    python -m benchmarks.bench_scoring [기사 수]
+"""
+
+import sys
+import time
+import random
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from utils.keyword_matcher import KeywordMatcher
+from utils.search_util import NewsWeightScoring
+
+
+KEYWORDS = ["인공지능", "생성형 인공지능", "딥러닝", "LLM", "AI", "강화학습", "지피티"]
+FILLER = ["기술", "산업", "발표", "모델", "시장", "연구", "서비스", "확대", "투자"]
+
+
+def make_articles(count: int, seed: int = 0) -> pd.DataFrame:
+    """벤치마크용 가상 기사 생성"""
+    rng = random.Random(seed)
+    now = datetime(2025, 1, 1)
+    words = KEYWORDS + FILLER * 4
+    rows = []
+    for _ in range(count):
+        sentences = (
+            " ".join(rng.choice(words) for _ in range(rng.randint(5, 20)))
+            for _ in range(rng.randint(5, 30))
+        )
+        rows.append(
+            {
+                "content": ". ".join(sentences),
+                "published_date": now - timedelta(days=rng.randint(0, 720)),
+                "timestamp": now,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def run(count: int = 10_000) -> None:
+    frame = make_articles(count)
+    matcher = KeywordMatcher(KEYWORDS)
+
+    start = time.perf_counter()
+    expected = [
+        NewsWeightScoring(
+            row.content, row.published_date, row.timestamp, matcher=matcher
+        ).calculate_total_weight()
+        for row in frame.itertuples()
+    ]
+    per_article = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scored = NewsWeightScoring.score_frame(frame, matcher=matcher)
+    batch = time.perf_counter() - start
+
+    assert scored["score"].tolist() == expected
+    print(f"articles    : {count}")
+    print(f"per-article : {per_article:.3f}s")
+    print(f"batch       : {batch:.3f}s ({count / batch:,.0f} articles/s)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,472 @@
+"""Selenium 브라우저 풀 (미리 띄운 headless 브라우저 + 브라우저당 여러 탭 재사용)
+
+키워드마다 드라이버를 새로 띄우고 quit 하던 것을
+    - 드라이버 바이너리 경로는 프로세스당 한 번만 조회 (chromedriver_path)
+    - 브라우저는 size 개까지 띄워 두고 재사용
+    - 동시에 들어온 키워드는 브라우저의 탭(window handle)에 나눠 배정
+    - max_pages 페이지를 열었거나 상태 확인에 실패한 브라우저는 교체
+    - 탭마다 사이트별 네트워크 차단을 적용하고 페이지 지표를 기록 (common/network_policy.py)
+    >>> with get_browser_pool().tab() as driver:
+    ...     driver.get(url)
+    ...     html = driver.page_source
+"""
+
+from __future__ import annotations
+
+import time
+import atexit
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache, partial
+from typing import Any, Callable, Iterator, TypeVar
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from common.network_policy import PAGE_METRICS_JS, NetworkPolicy
+from configs.settings import get_crawler_settings
+
+
+logger = logging.getLogger("browser_pool")
+
+T = TypeVar("T")
+
+
+@dataclass
+class BrowserPoolConfig:
+    """
+    풀 설정 (crawler_settings.yaml 의 browser_pool)
+    Args:
+        enabled (bool): main 크롤링에서 Selenium 크롤러(구글/다음)도 함께 실행할지 여부
+        size (int): 최대 브라우저 수
+        tabs_per_browser (int): 브라우저당 동시에 쓰는 탭 수
+        max_pages (int): 브라우저 하나가 이만큼 페이지를 열면 교체
+        health_check_interval (float): 이 시간(초) 이상 쉬었던 브라우저는 빌려주기 전에 상태 확인
+        acquire_timeout (float): 빈 탭을 기다리는 최대 시간 (초)
+        extraction (str): 크롤러의 결과 추출 방식 (script: execute_script 로 새 항목만 / html: page_source 파싱)
+        ready_timeout (float): get 후 문서가 interactive 가 될 때까지 기다리는 최대 시간 (초)
+    """
+
+    enabled: bool = False
+    size: int = 2
+    tabs_per_browser: int = 4
+    max_pages: int = 50
+    health_check_interval: float = 30.0
+    acquire_timeout: float = 120.0
+    extraction: str = "script"
+    ready_timeout: float = 10.0
+
+    @classmethod
+    def from_settings(cls) -> BrowserPoolConfig:
+        data: dict = get_crawler_settings().get("browser_pool") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+class PooledBrowser:
+    """
+    풀이 관리하는 브라우저 하나 (WebDriver 명령은 탭 전환과 함께 lock 안에서 실행)
+    Args:
+        driver (Any): WebDriver
+        number (int): 로그용 번호
+    """
+
+    def __init__(self, driver: Any, number: int) -> None:
+        self.driver = driver
+        self.number = number
+        self.lock = threading.RLock()
+        self.free_handles: list[str] = [driver.current_window_handle]
+        # 탭별로 적용돼 있는 네트워크 차단 목록 (같은 사이트면 CDP 를 다시 호출하지 않음)
+        self.blocked: dict[str, tuple[str, ...] | None] = {}
+        self.handles = 1
+        self.active = 0
+        self.pages = 0
+        self.broken = False
+        self.retiring = False
+        self.last_used = time.monotonic()
+
+    def open_handle(self) -> str:
+        """새 탭 열기"""
+        with self.lock:
+            self.driver.switch_to.new_window("tab")
+            self.handles += 1
+            return self.driver.current_window_handle
+
+    def healthy(self) -> bool:
+        """세션이 살아 있는지 확인"""
+        try:
+            with self.lock:
+                self.driver.execute_script("return 1")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ 브라우저 {self.number} 상태 확인 실패: {e}")
+            return False
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"⚠️ 브라우저 {self.number} 종료 실패: {e}")
+
+
+class Tab:
+    """
+    브라우저 탭 하나를 WebDriver 처럼 쓰는 프록시
+        - 명령마다 브라우저 lock 을 잡고 자기 탭으로 전환한 뒤 실행
+        - 반환된 WebElement 도 같은 방식으로 감쌈 (다른 탭 전환 후에도 안전)
+        - get 은 사이트별 차단 목록을 맞춘 뒤 이동하고, 떠나는 페이지의 지표를 기록
+        - 페이지 로드 대기는 lock 밖에서 (pageLoadStrategy none), 같은 브라우저의 다른 탭도 동시에 로드
+        - implicitly_wait 는 무시 (세션 implicit wait 는 0, 요소 대기는 WebDriverWait 폴링으로 lock 밖에서)
+    Args:
+        browser (PooledBrowser): 소속 브라우저
+        handle (str): window handle
+        network (NetworkPolicy | None): 네트워크 차단 정책 (None이면 적용하지 않음)
+        ready_timeout (float): get 후 문서 준비를 기다리는 최대 시간 (초)
+    """
+
+    READY_POLL = 0.05
+
+    def __init__(
+        self,
+        browser: PooledBrowser,
+        handle: str,
+        network: NetworkPolicy | None = None,
+        ready_timeout: float = 10.0,
+    ) -> None:
+        self._browser = browser
+        self._handle = handle
+        self._network = network
+        self._ready_timeout = ready_timeout
+        self._url: str | None = None
+
+    @property
+    def window_handle(self) -> str:
+        return self._handle
+
+    def _switch(self) -> None:
+        """자기 탭으로 전환 (브라우저 lock 안에서 호출)"""
+        if self._browser.driver.current_window_handle != self._handle:
+            self._browser.driver.switch_to.window(self._handle)
+
+    def _call(self, target: Any, name: str, *args, **kwargs) -> Any:
+        with self._browser.lock:
+            self._switch()
+            result = getattr(target, name)(*map(_unwrap, args), **kwargs)
+        return self._wrap(result)
+
+    def _read(self, target: Any, name: str) -> Any:
+        with self._browser.lock:
+            self._switch()
+            return self._wrap(getattr(target, name))
+
+    def get(self, url: str) -> None:
+        """사이트별 차단 목록을 맞추고 이동 (lock 은 이동 시작까지만, 로드 대기는 lock 밖에서)"""
+        browser = self._browser
+        with browser.lock:
+            self._switch()
+            self.record_page()
+            if self._network is not None:
+                browser.blocked[self._handle] = self._network.prepare(
+                    browser.driver, browser.blocked.get(self._handle), url
+                )
+            browser.driver.get(url)
+            browser.pages += 1
+            self._url = url
+        self.wait_ready()
+
+    def wait_ready(self) -> bool:
+        """
+        문서가 interactive/complete 가 될 때까지 대기 (확인할 때만 lock 을 잡음)
+        Returns:
+            bool: 시간 안에 준비됐는지 (넘기면 경고만 남기고 진행, 요소 대기는 크롤러가)
+        """
+        deadline = time.monotonic() + self._ready_timeout
+        while True:
+            state = self._call(self._browser.driver, "execute_script", "return document.readyState")
+            if state in ("interactive", "complete"):
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"⚠️ {self._url} 로드 대기 시간 초과 ({self._ready_timeout}초)")
+                return False
+            time.sleep(self.READY_POLL)
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        """
+        세션에 전달하지 않음 (implicit wait 가 있으면 없는 요소를 찾는 동안 lock 을 잡고 기다려
+        같은 브라우저의 다른 탭이 모두 멈춤)
+        """
+
+    def record_page(self) -> None:
+        """현재 페이지 지표 기록 (차단 설정이 있는 사이트만, 실패해도 크롤링은 계속)"""
+        network, browser = self._network, self._browser
+        if network is None or self._url is None or network.profile_for(self._url) is None:
+            return
+        try:
+            with browser.lock:
+                self._switch()
+                metrics = browser.driver.execute_script(PAGE_METRICS_JS)
+        except Exception as e:
+            logger.debug(f"페이지 지표 조회 실패: {e}")
+            return
+        finally:
+            self._url = None
+        network.record(metrics, browser.blocked.get(self._handle))
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, WebElement):
+            return TabElement(self, value)
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        return value
+
+    def quit(self) -> None:
+        """탭 사용자는 브라우저를 종료하지 않음 (풀이 관리)"""
+
+    close = quit
+
+    def __getattr__(self, name: str) -> Any:
+        driver = self._browser.driver
+        if callable(getattr(type(driver), name, None)):
+            return lambda *args, **kwargs: self._call(driver, name, *args, **kwargs)
+        return self._read(driver, name)
+
+
+class TabElement:
+    """Tab 에서 찾은 WebElement 프록시 (명령 전에 해당 탭으로 전환)"""
+
+    def __init__(self, tab: Tab, element: Any) -> None:
+        self._tab = tab
+        self._element = element
+
+    def __getattr__(self, name: str) -> Any:
+        element = self._element
+        if callable(getattr(type(element), name, None)):
+            return lambda *args, **kwargs: self._tab._call(element, name, *args, **kwargs)
+        return self._tab._read(element, name)
+
+
+def _unwrap(value: Any) -> Any:
+    """execute_script 인자 등으로 넘길 때는 원래 WebElement 로"""
+    return value._element if isinstance(value, TabElement) else value
+
+
+class BrowserPool:
+    """
+    여러 스레드(키워드)가 나눠 쓰는 브라우저 풀
+    Args:
+        factory (Callable[[], Any] | None): WebDriver 생성 함수 (None이면 chrome_option_setting(prefs))
+        config (BrowserPoolConfig | None): 풀 설정 (None이면 crawler_settings.yaml)
+        network (NetworkPolicy | None): 사이트별 네트워크 차단 (None이면 sites.yaml)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any] | None = None,
+        config: BrowserPoolConfig | None = None,
+        network: NetworkPolicy | None = None,
+    ) -> None:
+        self.factory = factory or _chrome_factory
+        self.config = config or BrowserPoolConfig.from_settings()
+        self.network = network or NetworkPolicy.from_settings()
+        self.browsers: list[PooledBrowser] = []
+        self.created = 0
+        self.recycled = 0
+        self._starting = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __enter__(self) -> BrowserPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def warm(self, count: int | None = None) -> None:
+        """브라우저를 미리 띄워 둠 (첫 키워드의 시작 지연 제거)"""
+        count = min(count or self.config.size, self.config.size)
+        threads = [
+            threading.Thread(target=self._add_browser) for _ in range(count - len(self.browsers))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _add_browser(self) -> PooledBrowser | None:
+        """브라우저 하나 생성 (풀이 가득 찼으면 None)"""
+        with self._condition:
+            if self._closed or len(self.browsers) + self._starting >= self.config.size:
+                return None
+            self._starting += 1
+            self.created += 1
+            number = self.created
+        browser = None
+        try:
+            browser = PooledBrowser(self.factory(), number)
+        finally:
+            with self._condition:
+                self._starting -= 1
+                closed = self._closed
+                if browser is not None and not closed:
+                    self.browsers.append(browser)
+                self._condition.notify_all()
+        if closed:
+            browser.quit()
+            return None
+        logger.info(f"✅ 브라우저 {number} 시작")
+        return browser
+
+    def _pick(self) -> PooledBrowser | None:
+        """빈 탭이 있는 브라우저 중 가장 한가한 것"""
+        usable = [
+            browser
+            for browser in self.browsers
+            if not (browser.broken or browser.retiring)
+            and browser.active < self.config.tabs_per_browser
+        ]
+        return min(usable, key=lambda browser: browser.active, default=None)
+
+    def _acquire(self) -> tuple[PooledBrowser, str]:
+        deadline = time.monotonic() + self.config.acquire_timeout
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("❌ 브라우저 풀이 닫혔습니다.")
+                browser = self._pick()
+                # 빈 탭이 없고 브라우저를 더 띄울 수 있으면 새로 띄움 (lock 밖에서)
+                can_grow = len(self.browsers) + self._starting < self.config.size
+                if browser is None and not can_grow:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("❌ 빈 브라우저 탭을 기다리다 시간 초과")
+                    self._condition.wait(remaining)
+                    continue
+                if browser is not None:
+                    browser.active += 1
+                    handle = browser.free_handles.pop() if browser.free_handles else None
+            if browser is None:
+                self._add_browser()
+                continue
+
+            idle = time.monotonic() - browser.last_used
+            if idle >= self.config.health_check_interval and not browser.healthy():
+                self._discard(browser)
+                continue
+            try:
+                return browser, handle or browser.open_handle()
+            except Exception:
+                self._discard(browser)
+                raise
+
+    def _discard(self, browser: PooledBrowser) -> None:
+        """빌려주려다 실패한 브라우저를 교체 대상으로"""
+        with self._condition:
+            browser.active -= 1
+            browser.broken = True
+            retired = self._retire_if_idle(browser)
+        if retired:
+            browser.quit()
+
+    def _release(self, browser: PooledBrowser, handle: str) -> None:
+        with self._condition:
+            browser.active -= 1
+            browser.last_used = time.monotonic()
+            if not browser.broken:
+                browser.free_handles.append(handle)
+            if browser.pages >= self.config.max_pages:
+                browser.retiring = True
+            retired = self._retire_if_idle(browser)
+            self._condition.notify_all()
+        if retired:
+            browser.quit()
+
+    def _retire_if_idle(self, browser: PooledBrowser) -> bool:
+        """교체 대상이고 쓰는 탭이 없으면 풀에서 뺌 (lock 안에서 호출, 종료는 호출한 쪽이 lock 밖에서)"""
+        if (
+            (browser.broken or browser.retiring)
+            and browser.active == 0
+            and browser in self.browsers
+        ):
+            self.browsers.remove(browser)
+            self.recycled += 1
+            reason = "오류" if browser.broken else f"{browser.pages}페이지 사용"
+            logger.info(f"♻️ 브라우저 {browser.number} 교체 ({reason})")
+            self._condition.notify_all()
+            return True
+        return False
+
+    @cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        """Selenium 세션 전용 스레드 풀 (동시에 빌릴 수 있는 탭 수만큼)"""
+        return ThreadPoolExecutor(
+            max_workers=self.config.size * self.config.tabs_per_browser,
+            thread_name_prefix="selenium",
+        )
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        블로킹 Selenium 작업을 전용 스레드에서 실행하고 결과를 기다림 (이벤트 루프는 막지 않음)
+        Args:
+            func (Callable[..., T]): 탭을 빌려 쓰는 동기 함수
+        Returns:
+            T: func 의 결과 (예외도 그대로 전달)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    @contextmanager
+    def tab(self) -> Iterator[Tab]:
+        """
+        탭 하나 빌리기
+        Yields:
+            Tab: WebDriver 처럼 쓸 수 있는 탭 (quit 은 무시됨)
+        """
+        browser, handle = self._acquire()
+        tab = Tab(browser, handle, self.network, self.config.ready_timeout)
+        try:
+            yield tab
+            tab.record_page()
+        except Exception:
+            # 크롤링 오류가 브라우저 문제인지 확인 (세션이 죽었으면 교체)
+            browser.broken = browser.broken or not browser.healthy()
+            raise
+        finally:
+            self._release(browser, handle)
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "browsers": len(self.browsers),
+                "active_tabs": sum(browser.active for browser in self.browsers),
+                "pages": {browser.number: browser.pages for browser in self.browsers},
+                "created": self.created,
+                "recycled": self.recycled,
+                "network": self.network.summary(),
+            }
+
+    def close(self) -> None:
+        """모든 브라우저 종료 (실행 중인 Selenium 작업은 끝날 때까지 기다림)"""
+        if "executor" in self.__dict__:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        with self._condition:
+            self._closed = True
+            browsers, self.browsers = self.browsers, []
+            self._condition.notify_all()
+        for browser in browsers:
+            browser.quit()
+
+
+def _chrome_factory() -> Any:
+    from common.selenium_utils import chrome_option_setting, prefs
+
+    return chrome_option_setting(prefs)
+
+
+@lru_cache(maxsize=1)
+def get_browser_pool() -> BrowserPool:
+    """프로세스 공용 브라우저 풀 (종료 시 브라우저 정리)"""
+    pool = BrowserPool()
+    atexit.register(pool.close)
+    return pool
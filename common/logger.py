@@ -1,10 +1,29 @@
+"""프로세스 공용 로깅 (큐 하나 + 리스너 스레드 하나)
+
+AsyncLogger 를 만들 때마다 큐/FileHandler/QueueListener 스레드를 새로 만들던 것을
+    - 큐와 리스너는 프로세스에 하나 (get_log_hub)
+    - 대상(target, 로그 파일)별 로거는 캐시해 두고 재사용 (같은 파일은 핸들러 하나)
+    - 호출한 쪽은 레코드를 큐에 넣기만 하고 (블로킹 없음), 포맷/쓰기는 리스너가 배치로
+    - 파일은 JSON lines (structured) 로, 배치마다 한 번 flush
+    >>> AsyncLogger("daum", "daum_crawling.log").log_message_sync(logging.INFO, "시작", pages=3)
+"""
+
 from __future__ import annotations
-from pathlib import Path
 
-import asyncio
-import logging
+import json
 import queue
-from logging.handlers import QueueHandler, QueueListener
+import atexit
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from logging.handlers import QueueHandler
+from typing import Any
+
+from configs.settings import get_crawler_settings
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 
 def ensure_file_exists(file_path: str) -> None:
@@ -25,93 +44,233 @@ def ensure_file_exists(file_path: str) -> None:
         folder_path.mkdir(parents=True, exist_ok=True)
 
 
-class AsyncLogger:
-    def __init__(self, target: str | None = None, log_file: str | None = None) -> None:
-        """
-        로그 수집기 초기화
+@dataclass
+class LoggingConfig:
+    """
+    공용 로깅 설정 (crawler_settings.yaml 의 logging)
+    Args:
+        batch_size (int): 리스너가 한 번에 꺼내 쓰는 최대 레코드 수
+        structured (bool): 파일을 JSON lines 로 기록 (False면 기존 텍스트 형식)
+        console (bool): 콘솔에도 출력
+        level (str): 대상 로거 레벨
+    """
 
-        Args:
-            log_file ([str]): 기본 매개변수로 두었으나 파일명 변경 가능
-        """
-        self.log_queue = queue.Queue()
-        self.target = target
-        self.log_file = f"logs/{target}/{log_file}" if target and log_file else None
-        ensure_file_exists(self.log_file)
+    batch_size: int = 512
+    structured: bool = True
+    console: bool = True
+    level: str = "DEBUG"
 
-        # handle 초기화
-        self.queue_handler = self._setup_queue_handler()
-        self.console_handler, self.file_handler = self._setup_handlers()
-        self.formatter = self._setup_formatter()
+    @classmethod
+    def from_settings(cls) -> LoggingConfig:
+        data: dict = get_crawler_settings().get("logging") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
 
-        self.queue_listener = self._setup_queue_listener()
-        self.queue_listener.start()
 
-        self.logger = self._setup_logger()
-        # self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+class JsonLineFormatter(logging.Formatter):
+    """레코드 하나를 JSON 한 줄로 (log_message_sync 의 추가 필드 포함)"""
 
-    def _setup_queue_handler(self) -> QueueHandler:
-        """
-        QueueHandler 초기화
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            **(getattr(record, "fields", None) or {}),
+        }
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
 
-        Returns:
-            - QueueHandler: QueueHandler 인스턴스
-        """
-        return QueueHandler(self.log_queue)
 
-    def _setup_handlers(
-        self,
-    ) -> tuple[logging.StreamHandler, logging.FileHandler | None]:
-        """
-        콘솔 및 파일 핸들러 초기화
+class _EnqueueHandler(QueueHandler):
+    """호출한 쪽에서는 큐에 넣기만 (포맷은 리스너 스레드에서)"""
 
-        Returns:
-            - [logging.StreamHandler, logging.FileHandler | None]: 콘솔 및 파일 핸들러 인스턴스
-        """
-        console_handler: logging.StreamHandler = logging.StreamHandler()
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg, record.args = record.getMessage(), None
+        return record
 
-        if self.log_file:
-            file_handler: logging.FileHandler = logging.FileHandler(self.log_file)
-        else:
-            file_handler = None
 
-        return console_handler, file_handler
+class _DeferredFlush:
+    """emit 마다 flush 하지 않음 (리스너가 배치 끝에서 한 번)"""
 
-    def _setup_formatter(self) -> logging.Formatter:
-        """
-        로그 포맷터 초기화
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
 
-        Returns:
-            - logging.Formatter: Formatter 인스턴스
-        """
-        formatter: logging.Formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        if self.console_handler:
-            self.console_handler.setFormatter(formatter)
-        if self.file_handler:
-            self.file_handler.setFormatter(formatter)
-        return formatter
-
-    def _setup_queue_listener(self) -> QueueListener:
-        """
-        QueueListener 초기화
 
+class _BatchStreamHandler(_DeferredFlush, logging.StreamHandler):
+    pass
+
+
+class _BatchFileHandler(_DeferredFlush, logging.FileHandler):
+    pass
+
+
+class LogHub:
+    """
+    프로세스 공용 로그 큐와 리스너 스레드
+    Args:
+        config (LoggingConfig | None): 설정 (None이면 crawler_settings.yaml)
+    """
+
+    def __init__(self, config: LoggingConfig | None = None) -> None:
+        self.config = config or LoggingConfig.from_settings()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handler = _EnqueueHandler(self.queue)
+        self.console = _BatchStreamHandler() if self.config.console else None
+        if self.console:
+            self.console.setFormatter(logging.Formatter(TEXT_FORMAT))
+        self.loggers: dict[str, logging.Logger] = {}
+        self.files: dict[str, _BatchFileHandler] = {}
+        self.routes: dict[str, _BatchFileHandler] = {}
+        self.written = 0
+        self.batches = 0
+        self.max_batch = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-hub", daemon=True)
+        self._thread.start()
+
+    def logger(self, target: str | None, log_file: str | None = None) -> logging.Logger:
+        """
+        대상별 로거 (처음 한 번만 만들고 이후에는 캐시)
+        Args:
+            target (str | None): 대상 이름
+            log_file (str | None): 로그 파일 경로 (None이면 콘솔만)
         Returns:
-            - QueueListener: QueueListener 인스턴스
+            logging.Logger: 큐로만 보내는 로거
         """
-        return QueueListener(self.log_queue, self.console_handler, self.file_handler)
+        name = f"AsyncLogger-{target}" + (f".{Path(log_file).stem}" if log_file else "")
+        logger = self.loggers.get(name)
+        if logger is not None:
+            return logger
+        with self._lock:
+            if name in self.loggers:
+                return self.loggers[name]
+            logger = logging.getLogger(name)
+            logger.setLevel(self.config.level)
+            logger.propagate = False
+            logger.handlers = [self.handler]
+            if log_file:
+                self.routes[name] = self._file_handler(log_file)
+            self.loggers[name] = logger
+            return logger
+
+    def _file_handler(self, log_file: str) -> _BatchFileHandler:
+        handler = self.files.get(log_file)
+        if handler is None:
+            ensure_file_exists(log_file)
+            handler = _BatchFileHandler(log_file, encoding="utf-8")
+            handler.setFormatter(
+                JsonLineFormatter() if self.config.structured else logging.Formatter(TEXT_FORMAT)
+            )
+            self.files[log_file] = handler
+        return handler
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.config.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if self._write(batch):
+                return
+
+    def _write(self, batch: list[Any]) -> bool:
+        """배치 기록 (flush 요청 Event 는 기록 후 set, None 은 종료 신호)"""
+        touched: set[logging.Handler] = set()
+        waiters: list[threading.Event] = []
+        stop = False
+        records = 0
+        for record in batch:
+            if record is None:
+                stop = True
+            elif isinstance(record, threading.Event):
+                waiters.append(record)
+            else:
+                records += 1
+                handler = self.routes.get(record.name)
+                if handler is not None:
+                    handler.emit(record)
+                    touched.add(handler)
+                if self.console is not None:
+                    self.console.emit(record)
+                    touched.add(self.console)
+        for handler in touched:
+            handler.flush()
+        self.written += records
+        self.batches += 1
+        self.max_batch = max(self.max_batch, records)
+        for waiter in waiters:
+            waiter.set()
+        return stop
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """지금까지 넣은 레코드가 모두 기록될 때까지 대기"""
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self.queue.put_nowait(done)
+        return done.wait(timeout)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "written": self.written,
+            "pending": self.queue.qsize(),
+            "batches": self.batches,
+            "max_batch": self.max_batch,
+            "loggers": len(self.loggers),
+            "files": len(self.files),
+        }
+
+    def stop(self) -> None:
+        """남은 레코드 기록 후 리스너 종료, 파일 닫기"""
+        if self._thread.is_alive():
+            self.queue.put_nowait(None)
+            self._thread.join()
+        for handler in self.files.values():
+            handler.close()
+
+
+def enqueue(logger: logging.Logger, level: int, message: str, fields: dict | None = None) -> None:
+    """
+    레코드를 만들어 바로 큐로 (호출 위치 탐색 findCaller 를 건너뛰는 핫 패스)
+    Args:
+        logger (logging.Logger): LogHub.logger 로 만든 로거
+        level (int): 로그 레벨
+        message (str): 메시지
+        fields (dict | None): JSON 로그에 함께 남길 값
+    """
+    if logger.isEnabledFor(level):
+        record = logger.makeRecord(logger.name, level, "", 0, message, None, None)
+        record.fields = fields
+        logger.handle(record)
 
-    def _setup_logger(self) -> logging.Logger:
-        """로거 초기화"""
-        logger = logging.getLogger(f"AsyncLogger-{self.target}")
-        logger.setLevel(logging.DEBUG)
 
-        # 기존 핸들러 제거
-        if logger.hasHandlers():
-            logger.handlers.clear()
+@lru_cache(maxsize=1)
+def get_log_hub() -> LogHub:
+    """프로세스 공용 로그 허브 (종료 시 남은 로그 기록)"""
+    hub = LogHub()
+    atexit.register(hub.stop)
+    return hub
+
+
+class AsyncLogger:
+    def __init__(self, target: str | None = None, log_file: str | None = None) -> None:
+        """
+        대상별 로거 (큐/리스너 스레드는 프로세스 공용, 같은 대상은 캐시된 로거 재사용)
 
-        logger.addHandler(self.queue_handler)
-        return logger
+        Args:
+            target (str | None): 대상 이름 (logs/{target}/ 아래에 기록)
+            log_file (str | None): 파일명
+        """
+        self.target = target
+        self.log_file = f"logs/{target}/{log_file}" if target and log_file else None
+        self.logger = get_log_hub().logger(target, self.log_file)
 
     def get_logger(self) -> logging.Logger:
         """
@@ -122,47 +281,34 @@ class AsyncLogger:
         """
         return self.logger
 
-    # async def log_message_async(self, level: int, message: str) -> None:
-    #     """
-    #     비동기적으로 메시지 로그
-
-    #     Args:
-    #         - level (int): 로그 레벨 (예: logging.INFO)
-    #         - message (str): 로그할 메시지
-    #     """
-    #     await self.loop.run_in_executor(None, self._log_message, level, message)
-
-    def log_message_sync(self, level: int, message: str) -> None:
+    def log_message_sync(self, level: int, message: str, **fields: Any) -> None:
         """
-        동기 로그
+        로그 (큐에 넣기만 하고 바로 반환)
 
         Args:
             - level (int): 로그 레벨 (예: logging.INFO)
             - message (str): 로그할 메시지
+            - fields (Any): JSON 로그에 함께 남길 값 (ex. pages=3)
         """
-        self._log_message(level, message)
-
-    def _log_message(self, level: int, message: str) -> None:
-        """
-        동기적으로 메시지 로그. 별도 스레드에서 실행됨
-
-        Args:
-            level (int): 로그 레벨 (예: logging.INFO)
-            message (str): 로그할 메시지
+        self._log_message(level, message, **fields)
 
-        Returns:
-            - 작성 방식 \n
-                >>> await async_logger.log_message(logging.INFO, "Starting the crawling process")
-        """
-        logger: logging.Logger = self.get_logger()
-        logger.log(level, message)
+    def _log_message(self, level: int, message: str, **fields: Any) -> None:
+        enqueue(self.logger, level, message, fields)
 
     def stop(self) -> None:
-        """
-        QueueListener 중지 및 리소스 정리
-        """
-        self.queue_listener.stop()
-
-    def __del__(self) -> None:
-        """리소스 정리"""
-        self.stop()
+        """공용 리스너는 프로세스 종료 시 정리 (인스턴스별로 멈출 것 없음)"""
+
+
+if __name__ == "__main__":
+    import time
+
+    # 호출한 쪽(핫 패스) 비용: 레코드 생성 + 큐에 넣기
+    hub = LogHub(LoggingConfig(console=False))
+    logger = hub.logger("bench", "logs/bench/bench.log")
+    count = 100_000
+    started = time.perf_counter()
+    for i in range(count):
+        enqueue(logger, logging.INFO, "hot path", {"i": i})
+    elapsed = time.perf_counter() - started
+    hub.stop()
+    print(f"enqueue {elapsed / count * 1e6:.2f} µs/record", hub.stats())
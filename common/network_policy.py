@@ -0,0 +1,199 @@
+"""Selenium 페이지 로드 시 사이트별 네트워크 차단 (CDP Network.setBlockedURLs) 과 페이지 지표
+
+sites.yaml 의 사이트별 설정
+    - match: 이 문자열이 URL 호스트에 들어 있으면 해당 사이트
+    - block: 차단할 URL 패턴 (CDP 와일드카드 "*", 폰트/CSS/광고/추적 스크립트 등)
+    - allow: 파서가 실제로 쓰는 리소스 패턴. 이와 겹치는 block 패턴은 적용하지 않음
+default 의 block/allow 는 모든 사이트에 더해진다.
+
+지표는 페이지를 떠날 때 Performance API 로 읽는다 (전송 byte, DOMContentLoaded 까지 ms).
+baseline_every 페이지마다 한 번은 차단 없이 열어 사이트별 기준 byte 를 잡고,
+차단한 페이지의 절감량 = 기준 평균 - 해당 페이지 byte 로 계산한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from fnmatch import fnmatchcase
+from urllib.parse import urlparse
+from dataclasses import dataclass, field
+from typing import Any
+
+from configs.settings import get_site_settings
+
+
+logger = logging.getLogger("network_policy")
+
+# 교차 출처 리소스는 Timing-Allow-Origin 이 없으면 transferSize 가 0 이라 실제보다 작게 잡힘
+PAGE_METRICS_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    url: location.href,
+    bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    requests: resources.length + (nav ? 1 : 0),
+    ready_ms: nav && nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd : null,
+};
+"""
+
+
+def _overlaps(block: str, allow: str) -> bool:
+    """allow 패턴에 해당하는 URL 이 block 패턴에 걸리는지 (와일드카드는 임의 문자로 보고 확인)"""
+    return fnmatchcase(allow.replace("*", "x"), block) or fnmatchcase(
+        block.replace("*", "x"), allow
+    )
+
+
+@dataclass(frozen=True)
+class SiteProfile:
+    """
+    사이트 하나의 차단 설정
+    Args:
+        name (str): 사이트 이름 (sites.yaml 키)
+        match (tuple[str, ...]): 호스트에 들어 있으면 이 사이트로 보는 문자열
+        blocked (tuple[str, ...]): allow 와 겹치는 패턴을 뺀 최종 차단 패턴
+    """
+
+    name: str
+    match: tuple[str, ...]
+    blocked: tuple[str, ...]
+
+    @classmethod
+    def build(cls, name: str, match: list[str], block: list[str], allow: list[str]) -> SiteProfile:
+        blocked = []
+        for pattern in dict.fromkeys(block):
+            conflicts = [a for a in allow if _overlaps(pattern, a)]
+            if conflicts:
+                logger.warning(
+                    f"⚠️ {name}: {pattern} 는 허용 목록 {conflicts} 와 겹쳐 차단하지 않습니다"
+                )
+                continue
+            blocked.append(pattern)
+        return cls(name=name, match=tuple(match), blocked=tuple(blocked))
+
+
+@dataclass
+class SiteNetworkStats:
+    """사이트별 페이지 지표 누적"""
+
+    loads: int = 0  # prepare 에서 센 이동 횟수 (기준 측정 순번)
+    pages: int = 0
+    bytes: int = 0
+    requests: int = 0
+    ready_ms: list[float] = field(default_factory=list)
+    baseline_pages: int = 0
+    baseline_bytes: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def baseline_avg(self) -> float | None:
+        return self.baseline_bytes / self.baseline_pages if self.baseline_pages else None
+
+    def summary(self) -> dict[str, Any]:
+        ready = sorted(self.ready_ms)
+        return {
+            "pages": self.pages,
+            "avg_bytes": self.bytes / self.pages if self.pages else None,
+            "baseline_avg_bytes": self.baseline_avg,
+            "bytes_saved": self.bytes_saved,
+            "p50_ready_ms": ready[len(ready) // 2] if ready else None,
+        }
+
+
+class NetworkPolicy:
+    """
+    탭마다 사이트에 맞는 차단 목록을 적용하고 페이지 지표를 기록
+    Args:
+        profiles (list[SiteProfile]): 사이트 설정
+        baseline_every (int): 사이트별로 이 페이지마다 한 번은 차단 없이 로드 (0이면 하지 않음)
+    """
+
+    def __init__(self, profiles: list[SiteProfile], baseline_every: int = 0) -> None:
+        self.profiles = profiles
+        self.baseline_every = baseline_every
+        self.stats: dict[str, SiteNetworkStats] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> NetworkPolicy:
+        """sites.yaml 로 생성 (설정이 비어 있으면 차단하지 않음)"""
+        config = dict(get_site_settings())
+        options = config.pop("options", None) or {}
+        default = config.pop("default", None) or {}
+        profiles = [
+            SiteProfile.build(
+                name,
+                site.get("match") or [name],
+                (default.get("block") or []) + (site.get("block") or []),
+                (default.get("allow") or []) + (site.get("allow") or []),
+            )
+            for name, site in config.items()
+        ]
+        return cls(profiles, baseline_every=options.get("baseline_every", 0))
+
+    def profile_for(self, url: str) -> SiteProfile | None:
+        host = urlparse(url).hostname or ""
+        return next((p for p in self.profiles if any(m in host for m in p.match)), None)
+
+    def prepare(
+        self, driver: Any, applied: tuple[str, ...] | None, url: str
+    ) -> tuple[str, ...] | None:
+        """
+        이동 전에 탭의 차단 목록을 맞춤 (바뀐 경우에만 CDP 호출)
+        Args:
+            driver (Any): WebDriver (현재 탭이 대상)
+            applied (tuple[str, ...] | None): 이 탭에 적용돼 있는 차단 목록 (처음이면 None)
+            url (str): 이동할 URL
+        Returns:
+            tuple[str, ...] | None: 이 탭에 적용돼 있는 차단 목록
+        """
+        profile = self.profile_for(url)
+        blocked = profile.blocked if profile else ()
+        if profile and self.baseline_every:
+            # 지표는 페이지를 떠날 때 기록되므로 순번은 이동 시점에 잠금 안에서 잡음 (탭 동시 이동)
+            with self._lock:
+                stats = self._stats(profile.name)
+                baseline = stats.loads % self.baseline_every == 0
+                stats.loads += 1
+            if baseline:
+                blocked = ()
+        if blocked == (applied or ()):
+            return applied
+        if applied is None:
+            driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(blocked)})
+        return blocked
+
+    def _stats(self, name: str) -> SiteNetworkStats:
+        return self.stats.setdefault(name, SiteNetworkStats())
+
+    def record(self, metrics: Any, blocked: tuple[str, ...] | None) -> None:
+        """
+        떠나는 페이지의 지표 기록
+        Args:
+            metrics (Any): PAGE_METRICS_JS 결과 (dict 가 아니면 무시)
+            blocked (tuple[str, ...] | None): 그 페이지에 적용했던 차단 목록
+        """
+        if not isinstance(metrics, dict) or not metrics.get("url"):
+            return
+        profile = self.profile_for(metrics["url"])
+        if profile is None:
+            return
+        with self._lock:
+            stats = self._stats(profile.name)
+            if profile.blocked and not blocked:
+                stats.baseline_pages += 1
+                stats.baseline_bytes += metrics["bytes"]
+                return
+            stats.pages += 1
+            stats.bytes += metrics["bytes"]
+            stats.requests += metrics["requests"]
+            if metrics.get("ready_ms") is not None:
+                stats.ready_ms.append(metrics["ready_ms"])
+            if stats.baseline_avg is not None:
+                stats.bytes_saved += max(int(stats.baseline_avg - metrics["bytes"]), 0)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {name: stats.summary() for name, stats in self.stats.items()}
@@ -1,10 +1,24 @@
+from functools import lru_cache
+
 import undetected_chromedriver as uc
 from fake_useragent import UserAgent
 from selenium_stealth import stealth
-from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 
 
-ua = UserAgent()
+@lru_cache(maxsize=1)
+def user_agent() -> UserAgent:
+    """UserAgent 는 생성 시 데이터 파일을 읽으므로 처음 쓸 때 한 번만 만든다"""
+    return UserAgent()
+
+
+@lru_cache(maxsize=1)
+def chromedriver_path() -> str:
+    """ChromeDriverManager().install() 은 버전 조회/다운로드를 하므로 프로세스당 한 번만"""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
+
 # xpath 와 셀레니움 관련 설정
 PAGE_LOAD_DELEY = 2
 WITH_TIME = 10
@@ -48,17 +62,15 @@ def chrome_option_setting(prefs: dict[str, dict[str, int]] = None) -> uc.Chrome:
     option_chrome.add_argument("--disable-extensions")
     option_chrome.add_argument("--no-sandbox")
     option_chrome.add_argument("--disable-dev-shm-usage")
-    option_chrome.add_argument(f"--user-agent={ua.random}")
+    option_chrome.add_argument(f"--user-agent={user_agent().random}")
 
-    caps = DesiredCapabilities().CHROME
-    # page loading 없애기
-    caps["pageLoadStrategy"] = "none"
+    # page loading 없애기 (get 은 이동만 시작하고 바로 반환, 로드 대기는 풀 탭이 lock 밖에서)
+    option_chrome.page_load_strategy = "none"
 
     # prefs가 제공된 경우에만 설정
     if prefs is not None:
         option_chrome.add_experimental_option("prefs", prefs)
 
-    from webdriver_manager.chrome import ChromeDriverManager
     from selenium.webdriver.chrome.service import Service
 
     # webdriver_remote = webdriver.Remote(
@@ -69,7 +81,7 @@ def chrome_option_setting(prefs: dict[str, dict[str, int]] = None) -> uc.Chrome:
         enable_cdp_events=True,
         incognito=True,
         headless=True,
-        service=Service(ChromeDriverManager().install()),
+        service=Service(chromedriver_path()),
     )
     stealth(
         webdirver_chrome,
@@ -8,7 +8,7 @@ from newspaper import Article
 
 import re
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, urlunparse, parse_qsl, urlencode
 
 
 def url_create(url: str) -> str:
@@ -40,6 +40,43 @@ def url_addition(base_url: str, url: str) -> str:
     return url
 
 
+# 같은 기사에 붙는 추적용 쿼리 파라미터
+TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "dclid", "msclkid", "igshid", "ref", "ref_src", "spm", "from", "cmpid"}
+)
+
+
+def canonical_url(url: str) -> str:
+    """같은 기사를 가리키는 URL을 하나의 표기로 정규화
+    Args:
+        url (str): url
+
+    Returns:
+        str: 정규화된 URL (scheme/host 소문자, 기본 포트/fragment/추적 파라미터 제거, 쿼리 정렬)
+            - ex) HTTPS://News.Example.com:443/a/?utm_source=x&id=2#top -> https://news.example.com/a?id=2
+    """
+    url = url.strip()
+    parsed = urlparse(url if "//" in url else f"https://{url}")
+    scheme = parsed.scheme.lower() or "https"
+    host = (parsed.hostname or "").lower()
+    port = parsed.port
+    if port and (scheme, port) not in {("http", 80), ("https", 443)}:
+        host = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parsed.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+        )
+    )
+    return urlunparse((scheme, host, path, "", query, ""))
+
+
 def time_extract(format: str) -> str:
     try:
         # 날짜와 시간 문자열을 datetime 객체로 변환
@@ -1,22 +1,27 @@
-"""모음집"""
+"""모음집 (configs.settings 의 값을 기존 이름으로 노출, 접근할 때 로드)"""
 
-import configparser
-from pathlib import Path
+from typing import Any
 
+from configs.settings import get_api_settings
 
-path_location = Path(__file__)
 
-# key_parser
-parser = configparser.ConfigParser()
-parser.read(f"{path_location.parent}/cy/url.conf")
+# 기존 이름 -> ApiSettings 경로
+_FIELDS: dict[str, tuple[str, str]] = {
+    "naver_id": ("naver", "client_id"),
+    "naver_secret": ("naver", "client_secret"),
+    "naver_url": ("naver", "url"),
+    "daum_url": ("daum", "url"),
+    "daum_auth": ("daum", "auth"),
+    "mongo_uri": ("mongo", "uri"),
+}
 
-naver_id: str = parser.get("naver", "X-Naver-Client-Id")
-naver_secret: str = parser.get("naver", "X-Naver-Client-Secret")
-naver_url: str = parser.get("naver", "NAVER_URL")
 
+def __getattr__(name: str) -> Any:
+    if name not in _FIELDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    group, field = _FIELDS[name]
+    return getattr(getattr(get_api_settings(), group), field)
 
-daum_url: str = parser.get("daum", "DAUM_URL")
-daum_auth: str = parser.get("daum", "Authorization")
 
-
-mongo_uri: str = parser.get("Mongo", "uri")
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_FIELDS])
@@ -0,0 +1,234 @@
+"""설정 레지스트리 (지연 로드 + 파일 변경 시 자동 재로드)
+
+import 시점에는 디스크를 읽지 않고, 처음 get 할 때 파일을 한 번 파싱해 캐시한다.
+이후에는 파일 mtime 이 바뀐 경우에만 다시 읽는다.
+환경변수가 파일 값보다 우선한다.
+    - ex) CRAWLER_NAVER__CLIENT_ID=... / CRAWLER_DB_REDIS_CLUSTERS='[{"id": ...}]'
+"""
+
+import os
+import time
+import threading
+import configparser
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, TypeVar
+
+import yaml
+from pydantic import BaseModel, Field
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+
+T = TypeVar("T")
+
+CONFIG_DIR = Path(__file__).parent / "cy"
+URL_CONF_PATH = CONFIG_DIR / "url.conf"
+DATABASE_YAML_PATH = CONFIG_DIR / "database.yaml"
+KEYWORD_YAML_PATH = CONFIG_DIR / "keyword.yaml"
+CRAWLER_SETTINGS_PATH = CONFIG_DIR / "crawler_settings.yaml"
+SITES_YAML_PATH = CONFIG_DIR / "sites.yaml"
+
+
+class EnvFirstSettings(BaseSettings):
+    """환경변수 > 파일(init 인자) 순으로 값을 채우는 설정"""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return env_settings, dotenv_settings, init_settings, file_secret_settings
+
+
+class NaverSettings(BaseModel):
+    client_id: str
+    client_secret: str
+    url: str
+
+
+class DaumSettings(BaseModel):
+    url: str
+    auth: str
+
+
+class MongoSettings(BaseModel):
+    uri: str
+
+
+class ApiSettings(EnvFirstSettings):
+    """url.conf 의 외부 API 설정"""
+
+    model_config = SettingsConfigDict(env_prefix="CRAWLER_", env_nested_delimiter="__")
+
+    naver: NaverSettings
+    daum: DaumSettings
+    mongo: MongoSettings
+
+
+class RedisNode(BaseModel):
+    id: str
+    host: str
+    port: int
+    role: str = "writer"
+
+
+class CodecSettings(BaseModel):
+    format: str = "msgpack"
+    compression: str | None = "zstd"
+    level: int = 3
+    min_compress_size: int = 512
+
+
+class DatabaseSettings(EnvFirstSettings):
+    """database.yaml 의 Redis 노드/값 형식 설정"""
+
+    model_config = SettingsConfigDict(env_prefix="CRAWLER_DB_", env_nested_delimiter="__")
+
+    redis_clusters: list[RedisNode] = Field(default_factory=list)
+    codec: CodecSettings = Field(default_factory=CodecSettings)
+
+
+# url.conf (configparser, 키는 소문자로 읽힘) -> ApiSettings 필드
+URL_CONF_FIELDS: dict[tuple[str, str], tuple[str, str]] = {
+    ("naver", "x-naver-client-id"): ("naver", "client_id"),
+    ("naver", "x-naver-client-secret"): ("naver", "client_secret"),
+    ("naver", "naver_url"): ("naver", "url"),
+    ("daum", "daum_url"): ("daum", "url"),
+    ("daum", "authorization"): ("daum", "auth"),
+    ("Mongo", "uri"): ("mongo", "uri"),
+}
+
+
+def read_url_conf(path: Path = URL_CONF_PATH) -> dict[str, dict[str, str]]:
+    """url.conf 를 ApiSettings 입력 형태로 변환 (파일/항목이 없으면 비워둠)"""
+    parser = configparser.ConfigParser()
+    parser.read(path)
+
+    values: dict[str, dict[str, str]] = {}
+    for (section, option), (group, name) in URL_CONF_FIELDS.items():
+        if parser.has_option(section, option):
+            values.setdefault(group, {})[name] = parser.get(section, option)
+    return values
+
+
+def read_yaml(path: Path) -> dict:
+    """YAML 파일 (없으면 빈 dict)"""
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return yaml.safe_load(file) or {}
+
+
+def _mtimes(paths: tuple[Path, ...]) -> tuple[float | None, ...]:
+    return tuple(os.stat(p).st_mtime_ns if p.exists() else None for p in paths)
+
+
+@dataclass
+class CachedSetting(Generic[T]):
+    """
+    파일 기반 설정 하나의 캐시
+    Args:
+        paths (tuple[Path, ...]): 감시할 파일
+        factory (Callable[[], T]): 파일을 읽어 설정 객체를 만드는 함수
+    """
+
+    paths: tuple[Path, ...]
+    factory: Callable[[], T]
+    value: T | None = None
+    mtimes: tuple[float | None, ...] | None = None
+    checked_at: float = 0.0
+    loads: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SettingsRegistry:
+    """
+    이름별 설정 캐시. 처음 get 할 때 로드하고, 파일 mtime 이 바뀌면 다시 로드한다.
+    Args:
+        check_interval (float): mtime 확인 최소 간격 (초, 0이면 매번 확인)
+    """
+
+    def __init__(self, check_interval: float = 1.0) -> None:
+        self.check_interval = check_interval
+        self._entries: dict[str, CachedSetting[Any]] = {}
+
+    def register(
+        self, name: str, factory: Callable[[], T], *paths: Path
+    ) -> None:
+        self._entries[name] = CachedSetting(paths=tuple(paths), factory=factory)
+
+    def get(self, name: str) -> Any:
+        """
+        캐시된 설정 (파일이 바뀌었으면 다시 로드)
+        Args:
+            name (str): 등록 이름
+        Returns:
+            Any: 설정 객체
+        """
+        entry = self._entries[name]
+        now = time.monotonic()
+        if entry.mtimes is not None and now - entry.checked_at < self.check_interval:
+            return entry.value
+
+        with entry.lock:
+            mtimes = _mtimes(entry.paths)
+            if entry.mtimes != mtimes:
+                entry.value = entry.factory()
+                entry.mtimes = mtimes
+                entry.loads += 1
+            entry.checked_at = now
+            return entry.value
+
+    def reload(self, name: str | None = None) -> None:
+        """다음 get 에서 강제로 다시 로드 (환경변수를 바꾼 경우 등)"""
+        for key in [name] if name else list(self._entries):
+            self._entries[key].mtimes = None
+
+    def loads(self, name: str) -> int:
+        """지금까지 파일을 읽은 횟수"""
+        return self._entries[name].loads
+
+
+registry = SettingsRegistry()
+registry.register("api", lambda: ApiSettings(**read_url_conf()), URL_CONF_PATH)
+registry.register(
+    "database", lambda: DatabaseSettings(**read_yaml(DATABASE_YAML_PATH)), DATABASE_YAML_PATH
+)
+registry.register("keyword", lambda: read_yaml(KEYWORD_YAML_PATH), KEYWORD_YAML_PATH)
+registry.register(
+    "crawler", lambda: read_yaml(CRAWLER_SETTINGS_PATH), CRAWLER_SETTINGS_PATH
+)
+registry.register("sites", lambda: read_yaml(SITES_YAML_PATH), SITES_YAML_PATH)
+
+
+def get_api_settings() -> ApiSettings:
+    """네이버/다음/몽고 접속 정보 (url.conf + 환경변수)"""
+    return registry.get("api")
+
+
+def get_database_settings() -> DatabaseSettings:
+    """Redis 노드 설정 (database.yaml + 환경변수)"""
+    return registry.get("database")
+
+
+def get_keyword_config() -> dict:
+    """keyword.yaml 원본"""
+    return registry.get("keyword")
+
+
+def get_crawler_settings() -> dict:
+    """crawler_settings.yaml 원본"""
+    return registry.get("crawler")
+
+
+def get_site_settings() -> dict:
+    """sites.yaml 원본 (사이트별 Selenium 네트워크 차단)"""
+    return registry.get("sites")
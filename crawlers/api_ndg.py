@@ -13,14 +13,12 @@ test_crawlers.py ...
 """
 
 from common.types import UrlDictCollect
-from configs.properties import (
-    naver_id,
-    naver_secret,
-    naver_url,
-    daum_auth,
-    daum_url,
+from configs.settings import get_api_settings
+from crawlers.news_parsing import (
+    NaverDaumAsyncDataCrawling,
+    GoogleAsyncDataReqestCrawling,
+    DaumAsyncDataRequestCrawling,
 )
-from crawlers.news_parsing import NaverDaumAsyncDataCrawling, GoogleAsyncDataReqestCrawling
 
 
 class AsyncNaverNewsParsingDriver(NaverDaumAsyncDataCrawling):
@@ -28,11 +26,12 @@ class AsyncNaverNewsParsingDriver(NaverDaumAsyncDataCrawling):
 
     def __init__(self, target: str, count: int) -> None:
         """생성자 초기화"""
+        naver = get_api_settings().naver
         self.header = {
-            "X-Naver-Client-Id": naver_id,
-            "X-Naver-Client-Secret": naver_secret,
+            "X-Naver-Client-Id": naver.client_id,
+            "X-Naver-Client-Secret": naver.client_secret,
         }
-        self.url = f"{naver_url}/news.json?query={target}&start=1&display={count*10}"
+        self.url = f"{naver.url}/news.json?query={target}&start=1&display={count*10}"
 
         super().__init__(
             target, url=self.url, home="naver", count=count, header=self.header
@@ -50,8 +49,9 @@ class AsyncDaumNewsParsingDriver(NaverDaumAsyncDataCrawling):
 
     def __init__(self, target: str, count: int) -> None:
         """생성자 초기화"""
-        self.header = {"Authorization": f"KakaoAK {daum_auth}"}
-        self.url = f"{daum_url}?query={target} /news&page=1&size={count*10}"
+        daum = get_api_settings().daum
+        self.header = {"Authorization": f"KakaoAK {daum.auth}"}
+        self.url = f"{daum.url}?query={target} /news&page=1&size={count*10}"
 
         super().__init__(
             target, url=self.url, home="daum", count=count, header=self.header
@@ -62,16 +62,38 @@ class AsyncDaumNewsParsingDriver(NaverDaumAsyncDataCrawling):
         return data
 
 
-class AsyncGoogleNewsParsingDriver(GoogleAsyncDataReqestCrawling):
-    """구글 크롤링"""
+class AsyncDaumHtmlParsingDriver(DaumAsyncDataRequestCrawling):
+    """다음 검색 결과 HTML 크롤링 (브라우저 없이 첫 페이지)"""
 
     def __init__(self, target: str, count: int) -> None:
+        self.params = {"w": "news", "DA": "NTB", "enc": "utf8", "q": target}
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        }
+        self.url = "https://search.daum.net/search"
+        super().__init__(
+            target,
+            url=self.url,
+            home="daum",
+            count=count,
+            param=self.params,
+            header=self.headers,
+        )
+
+    async def news_collector(self) -> UrlDictCollect:
+        return await self.extract_news_urls()
+
+
+class AsyncGoogleNewsParsingDriver(GoogleAsyncDataReqestCrawling):
+    """구글 크롤링 (start 를 주면 해당 오프셋 페이지)"""
+
+    def __init__(self, target: str, count: int, start: int | None = None) -> None:
         self.params = {
             "q": f"{target}",
             "tbm": "nws",
             "gl": "ko",
             "hl": "kr",
-            "start": count * 10,
+            "start": count * 10 if start is None else start,
         }
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
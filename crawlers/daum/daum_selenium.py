@@ -4,35 +4,48 @@ import logging
 import asyncio
 
 from selenium.common.exceptions import NoSuchElementException, WebDriverException
-from crawling.config.setting import chrome_option_setting, prefs
-from crawling.src.core.types import UrlDictCollect
-from crawling.src.utils.logger import AsyncLogger
-from crawling.src.utils.search_util import PageScroller
-from crawling.src.utils.search_util import (
-    PageScroller,
-    web_element_clicker,
-    ChromeDriver,
-)
-from crawling.src.driver.news_parsing import DaumNewsDataCrawling
-from crawling.src.driver.api_req.api_news_driver import AsyncDaumNewsParsingDriver
+from common.browser_pool import BrowserPool, get_browser_pool
+from common.types import UrlDictCollect
+from common.logger import AsyncLogger
+from utils.search_util import PageScroller, web_element_clicker
+from crawlers.news_parsing import DaumNewsDataCrawling
+from crawlers.api_ndg import AsyncDaumNewsParsingDriver
+from crawlers.dom_extract import DAUM_ITEMS_JS, DomExtractor
 
 
 class DaumSeleniumMovingElementsLocation(DaumNewsDataCrawling):
-    def __init__(self, target: str, count: int) -> None:
+    def __init__(self, target: str, count: int, pool: BrowserPool | None = None) -> None:
         """
         Args:
             target (str): 검색 타겟
             count (int): 얼마나 수집할껀지
+            pool (BrowserPool | None): 브라우저 풀 (None이면 프로세스 공용 풀)
         """
         self.target = target
         self.url = f"https://search.daum.net/search?w=news&nil_search=btn&DA=NTB&enc=utf8&cluster=y&cluster_page=1&q={target}"
-        self.driver: ChromeDriver = chrome_option_setting(prefs=prefs)
+        self.pool = pool or get_browser_pool()
         self.count = count if count - 3 <= 0 else count - 3
         self.logging = AsyncLogger(
             target="Daum", log_file="Daum_selenium.log"
         ).log_message_sync
 
     def page_injection(self) -> UrlDictCollect:
+        """풀에서 빌린 탭으로 페이지 이동 (브라우저는 풀이 재사용)"""
+        self.extractor = (
+            DomExtractor(DAUM_ITEMS_JS) if self.pool.config.extraction == "script" else None
+        )
+        with self.pool.tab() as self.driver:
+            return self._page_injection()
+
+    def collect_page(self) -> UrlDictCollect:
+        """현재 페이지 기사 (script 추출이 실패하거나 비면 page_source 파싱)"""
+        if self.extractor is not None:
+            data = self.extractor.collect(self.driver, fresh=True)
+            if data is not None:
+                return data
+        return self.news_info_collect(self.driver.page_source)
+
+    def _page_injection(self) -> UrlDictCollect:
         """
         //*[@id="dnsColl"]/div[2]/div/div/a[1] 2
         //*[@id="dnsColl"]/div[2]/div/div/a[2] 3
@@ -50,7 +63,7 @@ class DaumSeleniumMovingElementsLocation(DaumNewsDataCrawling):
                 next_page_button = web_element_clicker(
                     self.driver, f'//*[@id="dnsColl"]/div[2]/div/div/a[{i}]'
                 )
-                page = self.news_info_collect(self.driver.page_source)
+                page = self.collect_page()
                 data.append(page)
                 next_page_button.click()
 
@@ -61,21 +74,25 @@ class DaumSeleniumMovingElementsLocation(DaumNewsDataCrawling):
             next_page_button = web_element_clicker(
                 self.driver, f'//*[@id="dnsColl"]/div[2]/div/div/a[{3}]'
             )
-            page = self.news_info_collect(self.driver.page_source)
+            page = self.collect_page()
             data.append(page)
             next_page_button.click()
             self.count -= 1
 
         self.logging(logging.INFO, "다음 크롤링 종료합니다")
-        self.driver.quit()
         return data
 
+    collect = page_injection
+
+    async def fallback(self) -> UrlDictCollect:
+        """Selenium 실패 시 API 수집 (호출한 쪽 이벤트 루프에서 실행)"""
+        return await AsyncDaumNewsParsingDriver(self.target, self.count).news_collector()
+
     def daum_selenium_start(self) -> UrlDictCollect:
+        """동기 실행용 (이벤트 루프 안에서는 crawlers.selenium_ndg 사용)"""
         try:
-            self.page_injection()
+            return self.page_injection()
         except (NoSuchElementException, WebDriverException) as error:
             message = f"다음과 같은 에러로 진행하지못했습니다 --> {error} Api 호출로 대신합니다"
             self.logging(logging.ERROR, message)
-            return asyncio.run(
-                AsyncDaumNewsParsingDriver(self.target, self.count).news_collector()
-            )
+            return asyncio.run(self.fallback())
@@ -0,0 +1,103 @@
+"""Selenium 결과 목록을 page_source 대신 execute_script 한 번으로 추출
+
+스크롤/페이지 이동마다 page_source 전체(수 MB)를 받아 BeautifulSoup 으로 다시 파싱하던 것을
+    - 브라우저 안에서 결과 항목만 골라 [id, url, 제목, 시간] 배열로 반환 (수 KB)
+    - 반환한 노드는 data-crawled 로 표시해 같은 페이지에서 다시 보내지 않음
+    - 페이지가 바뀌어도 이미 받은 id 는 파이썬 쪽에서 한 번 더 거름
+    >>> extractor = DomExtractor(DAUM_ITEMS_JS)
+    >>> extractor.collect(driver)  # 새 항목만
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from selenium.common.exceptions import JavascriptException
+
+from common.types import UrlDictCollect
+from crawlers.news_parsing import data_format_create
+
+
+logger = logging.getLogger("dom_extract")
+
+# 공통: arguments[0] 표시 속성, 표시 안 된 항목만 [id, url, title, time] 로 반환
+DAUM_ITEMS_JS = """
+const mark = arguments[0];
+const rows = [];
+for (const li of document.querySelectorAll('ul.c-list-basic li[data-docid^="26"]')) {
+    if (li.hasAttribute(mark)) continue;
+    const a = li.querySelector('strong.tit-g.clamp-g a');
+    const time = li.querySelector('span.gem-subinfo');
+    if (!a) continue;
+    li.setAttribute(mark, '1');
+    rows.push([li.dataset.docid, a.href, a.textContent.trim(), time ? time.textContent.trim() : '']);
+}
+return rows;
+"""
+
+GOOGLE_ITEMS_JS = """
+const mark = arguments[0];
+const rows = [];
+for (const a of document.querySelectorAll('div[data-hveid] div.MjjYud a[jsname="YKoRaf"]')) {
+    if (a.hasAttribute(mark)) continue;
+    const time = a.querySelector('div.OSrXXb.rbYSKb.LfVVr');
+    a.setAttribute(mark, '1');
+    rows.push([a.href, a.href, a.textContent.slice(0, 20), time ? time.textContent.trim() : '']);
+}
+return rows;
+"""
+
+
+@dataclass
+class DomExtractor:
+    """
+    키워드 하나의 수집 동안 쓰는 추출기 (이미 받은 항목 id 를 기억)
+    Args:
+        script (str): 항목 추출 스크립트 (DAUM_ITEMS_JS / GOOGLE_ITEMS_JS)
+        mark (str): 반환한 노드에 붙일 속성
+    """
+
+    script: str
+    mark: str = "data-crawled"
+    seen: set[str] = field(default_factory=set)
+    calls: int = 0
+    transferred: int = 0
+
+    def collect(self, driver: Any, fresh: bool = False) -> UrlDictCollect | None:
+        """
+        현재 페이지의 새 항목만 추출
+        Args:
+            driver (Any): WebDriver (또는 풀 탭)
+            fresh (bool): 페이지를 연 뒤 첫 호출인지 (이때 빈 결과면 선택자가 안 맞는 것으로 봄)
+        Returns:
+            UrlDictCollect | None: 새 기사 목록 (스크립트가 실패하면 None → page_source 파싱으로)
+        """
+        try:
+            rows = driver.execute_script(self.script, self.mark)
+        except JavascriptException as error:
+            logger.warning(f"⚠️ DOM 추출 실패, page_source 파싱으로 전환합니다 --> {error}")
+            return None
+        if not isinstance(rows, list):
+            return None
+        if fresh and not rows:
+            logger.warning("⚠️ DOM 추출 결과 없음 (선택자 확인), page_source 파싱으로 전환합니다")
+            return None
+        self.calls += 1
+        self.transferred += len(json.dumps(rows, ensure_ascii=False).encode())
+        data = []
+        for item_id, url, title, time_text in rows:
+            if not url or item_id in self.seen:
+                continue
+            self.seen.add(item_id)
+            try:
+                data.append(
+                    data_format_create(
+                        title=title, article_time=time_text, url=url, time_ago=time_text
+                    )
+                )
+            except ValueError as error:
+                logger.debug(f"항목 변환 실패 {url}: {error}")
+        return data
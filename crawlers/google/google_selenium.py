@@ -1,31 +1,63 @@
+from __future__ import annotations
+
 import time
 import random
 import logging
 import asyncio
+from dataclasses import dataclass, fields
 from typing import Any, Callable
 
 from selenium.common.exceptions import NoSuchElementException, WebDriverException
-from common.selenium_utils import chrome_option_setting, prefs
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from common.browser_pool import BrowserPool, get_browser_pool
+from common.selenium_utils import WITH_TIME
 from common.types import UrlDictCollect
 from crawlers.api_ndg import AsyncGoogleNewsParsingDriver
-from news_parsing import GoogleNewsDataSeleniumCrawling
+from crawlers.dom_extract import GOOGLE_ITEMS_JS, DomExtractor
+from crawlers.news_parsing import GoogleNewsDataSeleniumCrawling
 from common.logger import AsyncLogger
-from utils.search_util import (
-    PageScroller,
-    web_element_clicker,
-    ChromeDriver,
-)
+from utils.search_util import PageScroller, web_element_clicker
+from configs.settings import get_crawler_settings
+
+
+@dataclass
+class GooglePagingConfig:
+    """
+    구글 페이지 수집 방식 (crawler_settings.yaml 의 google_paging)
+    Args:
+        mode (str): offset (start= URL 을 동시에 로드) / click (다음 페이지 버튼을 차례로 클릭)
+        transport (str): offset 모드에서 browser (풀의 탭) / http (aiohttp, 브라우저 없이)
+        page_size (int): 페이지당 결과 수 (start 간격)
+    """
+
+    mode: str = "offset"
+    transport: str = "browser"
+    page_size: int = 10
+
+    @classmethod
+    def from_settings(cls) -> GooglePagingConfig:
+        data: dict = get_crawler_settings().get("google_paging") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
 
 
 class GoogleSeleniumMovingElementLocation(GoogleNewsDataSeleniumCrawling):
     """구글 크롤링 셀레니움 location"""
 
-    def __init__(self, target: str, count: int) -> None:
-        """데이터를 크롤링할 타겟 선정"""
+    def __init__(
+        self,
+        target: str,
+        count: int,
+        pool: BrowserPool | None = None,
+        paging: GooglePagingConfig | None = None,
+    ) -> None:
+        """데이터를 크롤링할 타겟 선정 (브라우저는 풀에서 탭 단위로 빌림)"""
         self.target = target
         self.count = count
         self.url = f"https://www.google.com/search?q={target}&tbm=nws&gl=ko&hl=kr"
-        self.driver: ChromeDriver = chrome_option_setting(prefs)
+        self.pool = pool or get_browser_pool()
+        self.paging = paging or GooglePagingConfig.from_settings()
         self.logging = AsyncLogger("google", "selenium_google.log").log_message_sync
 
     def scroll_through_pages(
@@ -35,46 +67,115 @@ class GoogleSeleniumMovingElementLocation(GoogleNewsDataSeleniumCrawling):
 
         page_dict: dict[str, UrlDictCollect] = {}
         for i in range(start, self.count + start):
-            next_page_button: Any = web_element_clicker(xpath(i))
+            next_page_button: Any = web_element_clicker(self.driver, xpath(i))
             message = f"{i-2}page로 이동합니다 --> {xpath(i)} 이용합니다"
             self.logging(logging.INFO, message)
 
-            data = self.extract_news_urls(self.driver.page_source)
+            data = self.collect_page()
             page_dict[str(i - 2)] = data
             next_page_button.click()
             self.driver.implicitly_wait(random.uniform(5.0, 10.0))
-            PageScroller(self.driver).page_scroll(self.driver)
+            PageScroller(self.driver).page_scroll()
 
         self.logging(logging.INFO, f"google 수집 종료")
-        self.driver.quit()
+        return page_dict
+
+    def collect_page(self) -> UrlDictCollect:
+        """현재 페이지 기사 (script 추출이 실패하거나 비면 page_source 파싱)"""
+        return self.page_items(self.driver, self.extractor)
+
+    def page_items(self, driver: Any, extractor: DomExtractor | None) -> UrlDictCollect:
+        if extractor is not None:
+            data = extractor.collect(driver, fresh=True)
+            if data is not None:
+                return data
+        return self.extract_news_urls(driver.page_source)
+
+    def page_url(self, page: int) -> str:
+        """page 번째 (0부터) 결과 페이지 URL"""
+        return f"{self.url}&start={page * self.paging.page_size}"
 
+    def collect_offset(self, page: int) -> UrlDictCollect:
+        """start= 오프셋 페이지 하나를 탭 하나로 수집 (클릭/스크롤 없이)"""
+        extractor = (
+            DomExtractor(GOOGLE_ITEMS_JS) if self.pool.config.extraction == "script" else None
+        )
+        with self.pool.tab() as driver:
+            driver.get(self.page_url(page))
+            WebDriverWait(driver, WITH_TIME).until(
+                EC.presence_of_element_located((By.ID, "search"))
+            )
+            return self.page_items(driver, extractor)
+
+    async def collect_pages(self) -> dict[str, UrlDictCollect]:
+        """
+        모든 페이지를 동시에 수집해 페이지 순서대로 합침 (앞 페이지에 나온 URL 은 뒤에서 제외)
+        browser 모드는 페이지마다 탭 하나라 동시에 로드되는 페이지 수는 풀의 탭 수(size × tabs_per_browser) 까지
+        Returns:
+            dict[str, UrlDictCollect]: {"1": 기사 목록, ~} (모든 페이지가 실패하면 첫 오류를 그대로)
+        """
+        pages = range(self.count)
+        if self.paging.transport == "http":
+            jobs = [
+                AsyncGoogleNewsParsingDriver(
+                    self.target, 1, start=page * self.paging.page_size
+                ).news_collector()
+                for page in pages
+            ]
+        else:
+            jobs = [self.pool.run(self.collect_offset, page) for page in pages]
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        page_dict: dict[str, UrlDictCollect] = {}
+        seen: set[str] = set()
+        for page, result in zip(pages, results):
+            if isinstance(result, BaseException):
+                self.logging(logging.ERROR, f"{page + 1}page 수집 실패 --> {result}")
+                continue
+            items = [item for item in result or [] if item and item["url"] not in seen]
+            seen.update(item["url"] for item in items)
+            page_dict[str(page + 1)] = items
+        self.logging(logging.INFO, f"google {len(page_dict)}/{self.count} page 동시 수집 종료")
         return page_dict
 
-    # fmt: off
-    def google_seleium_start(self) -> dict[str, UrlDictCollect] | UrlDictCollect:
-        """페이지 수집 이동 본체"""
+    @staticmethod
+    def mo_xpath_injection(start: int) -> str:
+        """google mobile xpath 경로 start는 a tag 기점 a -> a[2]"""
+        return f'//*[@id="wepR4d"]/div/span/a[{start-1}]'
+
+    @staticmethod
+    def pa_xpath_injection(start: int) -> str:
+        """google site xpath 경로 start는 tr/td[3](page 2) ~ 기점"""
+        return f'//*[@id="botstuff"]/div/div[3]/table/tbody/tr/td[{start}]/a'
 
-        def mo_xpath_injection(start: int) -> str:
-            """google mobile xpath 경로 start는 a tag 기점 a -> a[2]"""
-            return f'//*[@id="wepR4d"]/div/span/a[{start-1}]'
+    def collect(self) -> dict[str, UrlDictCollect]:
+        """풀에서 빌린 탭으로 페이지 수집 (PC 페이지 구조가 아니면 모바일 구조로)"""
+        self.extractor = (
+            DomExtractor(GOOGLE_ITEMS_JS) if self.pool.config.extraction == "script" else None
+        )
+        with self.pool.tab() as self.driver:
+            self.driver.get(self.url)
+            try:
+                return self.scroll_through_pages(3, self.pa_xpath_injection)
+            except NoSuchElementException:
+                return self.scroll_through_pages(2, self.mo_xpath_injection)
 
-        def pa_xpath_injection(start: int) -> str:
-            """google site xpath 경로 start는 tr/td[3](page 2) ~ 기점"""
-            return f'//*[@id="botstuff"]/div/div[3]/table/tbody/tr/td[{start}]/a'
+    async def fallback(self) -> UrlDictCollect:
+        """Selenium 실패 시 REST 수집 (호출한 쪽 이벤트 루프에서 실행)"""
+        return await AsyncGoogleNewsParsingDriver(self.target, self.count).news_collector()
 
-        self.driver.get(self.url)
+    # fmt: off
+    def google_seleium_start(self) -> dict[str, UrlDictCollect] | UrlDictCollect:
+        """페이지 수집 이동 본체 (동기 실행용, 이벤트 루프 안에서는 crawlers.selenium_ndg 사용)"""
         try:
-            return self.scroll_through_pages(3, pa_xpath_injection)
-        except NoSuchElementException:
-            return self.scroll_through_pages(2, mo_xpath_injection)
+            return self.collect()
         except WebDriverException as e:
             message = (
                 f"다음과 같은 이유로 google 수집 종료 Rest 수집으로 전환합니다 --> {e}"
             )
             self.logging(logging.ERROR, message)
-            self.driver.quit()
             time.sleep(3)
-            rest = AsyncGoogleNewsParsingDriver(self.target, self.count)
-            return asyncio.run(rest.news_collector())
-        finally:
-            self.driver.quit()
+            return asyncio.run(self.fallback())
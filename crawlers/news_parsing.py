@@ -192,7 +192,8 @@ class DaumNewsDataCrawling(DaumSeleniumNews):
             data_format_create(
                 title=self.strong_in_class(div_2).find("a").get_text(strip=True),
                 article_time=self.span_in_class(div_2).get_text(strip=True),
-                url_type=(self.strong_in_class(div_2).find("a")),
+                url=href_from_a_tag(self.strong_in_class(div_2).find("a")),
+                time_ago=self.span_in_class(div_2).get_text(strip=True),
             )
             for div_2 in self.li_in_data_docid(tag)
         )
@@ -208,3 +209,29 @@ class DaumNewsDataCrawling(DaumSeleniumNews):
         start = self.ul_class_c_list_basic(html=html, attrs={"class": "c-list-basic"})
         data = list(chain.from_iterable(self.extract_format(div_1) for div_1 in start))
         return data
+
+
+# get request (Daum 검색 결과 HTML, Selenium 과 같은 파서 사용)
+class DaumAsyncDataRequestCrawling(BasicAsyncNewsDataCrawling):
+    async def fetch_page_urls(self) -> SelectHtml:
+        """HTML 비동기 호출
+        Returns:
+            str: HTML
+        """
+        try:
+            load_f = AsyncRequestHTML(url=self.url, params=self.param, headers=self.header)
+            return await load_f.async_fetch_html(target=self.home)
+        except ConnectionError as error:
+            self._logging(
+                logging.ERROR, f"{self.home} 기사를 가져오지 못햇습니다 --> {error}"
+            )
+            return False
+
+    async def extract_news_urls(self) -> UrlDictCollect:
+        """수집 시작점"""
+        self._logging(logging.INFO, f"{self.home} HTML 수집 시작합니다")
+        res_data = await self.fetch_page_urls()
+        if res_data:
+            data = DaumNewsDataCrawling().news_info_collect(res_data)
+            self._logging(logging.INFO, f"{self.home}에서 --> {len(data)}개 의 뉴스 수집")
+            return data
@@ -0,0 +1,80 @@
+"""Selenium 크롤러 비동기 실행 (api_ndg 드라이버와 같은 사용법)
+
+Selenium 세션은 브라우저 풀 전용 스레드에서 실행하고, 실패하면 API 수집을
+호출한 쪽 이벤트 루프에서 이어서 실행한다 (크롤러 안에서 asyncio.run 을 부르지 않음).
+    >>> data = await AsyncGoogleSeleniumDriver("비트코인", 2).news_collector()
+"""
+
+import logging
+from itertools import chain
+from typing import Any
+
+from selenium.common.exceptions import WebDriverException
+
+from common.browser_pool import BrowserPool, get_browser_pool
+from common.types import UrlDictCollect
+from crawlers.daum.daum_selenium import DaumSeleniumMovingElementsLocation
+from crawlers.google.google_selenium import GoogleSeleniumMovingElementLocation
+
+
+logger = logging.getLogger("selenium_ndg")
+
+
+class AsyncSeleniumNewsDriver:
+    """
+    collect() (동기, 탭 사용) / fallback() (코루틴) 을 가진 Selenium 크롤러의 비동기 래퍼
+    Args:
+        target (str): 검색어
+        count (int): 수집할 페이지 수
+        pool (BrowserPool | None): 브라우저 풀 (None이면 프로세스 공용 풀)
+    """
+
+    home: str
+    crawler_class: type
+
+    def __init__(self, target: str, count: int, pool: BrowserPool | None = None) -> None:
+        self.pool = pool or get_browser_pool()
+        self.crawler = self.crawler_class(target, count, self.pool)
+
+    @staticmethod
+    def flatten(pages: Any) -> UrlDictCollect:
+        """페이지별 결과 (dict 또는 list) 를 기사 목록 하나로"""
+        pages = pages.values() if isinstance(pages, dict) else pages
+        return [item for item in chain.from_iterable(page or [] for page in pages) if item]
+
+    async def run_crawler(self) -> Any:
+        """크롤러의 collect() 를 브라우저 풀 스레드에서 실행"""
+        return await self.pool.run(self.crawler.collect)
+
+    async def news_collector(self) -> UrlDictCollect:
+        """
+        Selenium 수집 (실패하면 API 수집)
+        Returns:
+            UrlDictCollect: 기사 목록
+        """
+        try:
+            pages = await self.run_crawler()
+        except WebDriverException as error:
+            logger.error(f"❌ {self.home} Selenium 수집 실패, API 수집으로 전환합니다 --> {error}")
+            return await self.crawler.fallback() or []
+        return self.flatten(pages)
+
+
+class AsyncDaumSeleniumDriver(AsyncSeleniumNewsDriver):
+    """다음 Selenium 크롤링"""
+
+    home = "daum"
+    crawler_class = DaumSeleniumMovingElementsLocation
+
+
+class AsyncGoogleSeleniumDriver(AsyncSeleniumNewsDriver):
+    """구글 Selenium 크롤링"""
+
+    home = "google"
+    crawler_class = GoogleSeleniumMovingElementLocation
+
+    async def run_crawler(self) -> Any:
+        """offset 모드면 페이지를 동시에 (탭마다 풀 스레드 하나), 아니면 차례로 클릭"""
+        if self.crawler.paging.mode == "offset":
+            return await self.crawler.collect_pages()
+        return await super().run_crawler()
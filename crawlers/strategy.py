@@ -0,0 +1,270 @@
+"""사이트별 수집 방법 선택 (싼 방법부터, 브라우저는 정말 필요할 때만)
+
+사이트마다 비용 순서로 수집 방법을 둔다: api (공식 API) → html (aiohttp + 기존 파서) → browser (Selenium)
+    - 싼 방법부터 시도하고 결과가 충분하면 그대로 반환
+    - 방법별 성공률/수집 건수를 지수 이동 평균으로 누적 (프로세스 단위)
+    - 성공률이 demote_below 아래로 떨어진 방법은 뒤로 밀림 (강등), probe_every 번에 한 번은
+      원래 순서로 다시 시도해 회복하면 복귀 (승격)
+    - 더 비싼 방법의 평균 수집 건수의 min_yield_ratio 에도 못 미치면 부족한 결과로 보고 다음 방법 시도
+    >>> data = await AdaptiveDaumDriver("비트코인", 1).news_collector()
+"""
+
+from __future__ import annotations
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Awaitable, Callable
+
+from common.browser_pool import get_browser_pool
+from common.types import UrlDictCollect
+from configs.settings import get_crawler_settings
+from crawlers.api_ndg import (
+    AsyncDaumHtmlParsingDriver,
+    AsyncDaumNewsParsingDriver,
+    AsyncGoogleNewsParsingDriver,
+)
+from crawlers.selenium_ndg import (
+    AsyncDaumSeleniumDriver,
+    AsyncGoogleSeleniumDriver,
+    AsyncSeleniumNewsDriver,
+)
+
+
+logger = logging.getLogger("fetch_strategy")
+
+
+@dataclass
+class FetchStrategyConfig:
+    """
+    방법 선택 설정 (crawler_settings.yaml 의 fetch_strategy)
+    Args:
+        alpha (float): 이동 평균 가중치 (클수록 최근 결과를 크게 반영)
+        min_attempts (int): 강등 판단 전에 필요한 최소 시도 횟수
+        demote_below (float): 성공률이 이보다 낮으면 강등
+        probe_every (int): 강등된 방법도 이 호출마다 한 번은 원래 순서로 시도 (0이면 하지 않음)
+        min_items (int): 성공으로 볼 최소 기사 수
+        min_yield_ratio (float): 더 비싼 방법 평균 수집 건수 대비 이 비율 미만이면 부족한 결과
+    """
+
+    alpha: float = 0.2
+    min_attempts: int = 5
+    demote_below: float = 0.3
+    probe_every: int = 20
+    min_items: int = 1
+    min_yield_ratio: float = 0.3
+
+    @classmethod
+    def from_settings(cls) -> FetchStrategyConfig:
+        data: dict = get_crawler_settings().get("fetch_strategy") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass(frozen=True)
+class FetchStrategy:
+    """
+    수집 방법 하나
+    Args:
+        name (str): 이름 (api / html / browser)
+        cost (int): 비용 순서 (작을수록 먼저)
+        fetch (Callable[[str, int], Awaitable[UrlDictCollect | None]]): (검색어, 페이지 수) → 기사 목록
+        available (Callable[[], bool]): 지금 쓸 수 있는지 (ex. 브라우저 풀 사용 여부)
+    """
+
+    name: str
+    cost: int
+    fetch: Callable[[str, int], Awaitable[UrlDictCollect | None]]
+    available: Callable[[], bool] = lambda: True
+
+
+@dataclass
+class StrategyStats:
+    """방법 하나의 누적 지표"""
+
+    attempts: int = 0
+    successes: int = 0
+    items: int = 0
+    success_rate: float = 1.0
+    avg_yield: float | None = None
+    avg_seconds: float | None = None
+
+    def update(self, ok: bool, items: int, seconds: float, alpha: float) -> None:
+        self.attempts += 1
+        self.successes += ok
+        self.items += items
+        self.success_rate += alpha * (ok - self.success_rate)
+        if ok:
+            self.avg_yield = (
+                items
+                if self.avg_yield is None
+                else (self.avg_yield + alpha * (items - self.avg_yield))
+            )
+        self.avg_seconds = (
+            seconds
+            if self.avg_seconds is None
+            else (self.avg_seconds + alpha * (seconds - self.avg_seconds))
+        )
+
+
+class StrategyBook:
+    """
+    사이트 하나의 방법별 지표와 시도 순서
+    Args:
+        site (str): 사이트 이름
+        strategies (list[FetchStrategy]): 수집 방법
+        config (FetchStrategyConfig): 설정
+    """
+
+    def __init__(
+        self, site: str, strategies: list[FetchStrategy], config: FetchStrategyConfig
+    ) -> None:
+        self.site = site
+        self.strategies = sorted(strategies, key=lambda strategy: strategy.cost)
+        self.config = config
+        self.stats = {strategy.name: StrategyStats() for strategy in self.strategies}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def demoted(self, strategy: FetchStrategy) -> bool:
+        stats = self.stats[strategy.name]
+        return (
+            stats.attempts >= self.config.min_attempts
+            and stats.success_rate < self.config.demote_below
+        )
+
+    def plan(self) -> list[FetchStrategy]:
+        """이번 호출의 시도 순서 (강등된 방법은 비용 순서를 유지한 채 맨 뒤로)"""
+        with self._lock:
+            self.calls += 1
+            probe = self.config.probe_every and self.calls % self.config.probe_every == 0
+        usable = [strategy for strategy in self.strategies if strategy.available()]
+        if probe:
+            return usable
+        return sorted(usable, key=lambda strategy: (self.demoted(strategy), strategy.cost))
+
+    def enough(self, strategy: FetchStrategy, items: int) -> bool:
+        """결과가 충분한지 (최소 건수 + 더 비싼 방법 평균 건수 대비 비율)"""
+        if items < self.config.min_items:
+            return False
+        richer = [
+            self.stats[other.name].avg_yield
+            for other in self.strategies
+            if other.cost > strategy.cost and self.stats[other.name].avg_yield
+        ]
+        return not richer or items >= self.config.min_yield_ratio * max(richer)
+
+    def record(self, strategy: FetchStrategy, ok: bool, items: int, seconds: float) -> None:
+        with self._lock:
+            before = self.demoted(strategy)
+            self.stats[strategy.name].update(ok, items, seconds, self.config.alpha)
+            after = self.demoted(strategy)
+        if before != after:
+            state = "강등" if after else "복귀"
+            logger.info(f"🔀 {self.site} 수집 방법 {strategy.name} {state}")
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                strategy.name: {
+                    **vars(self.stats[strategy.name]),
+                    "demoted": self.demoted(strategy),
+                }
+                for strategy in self.strategies
+            }
+
+
+def from_driver(driver_class: Callable[[str, int], Any]) -> Callable[..., Awaitable]:
+    """news_collector() 를 가진 기존 드라이버를 수집 방법으로"""
+
+    async def fetch(target: str, count: int) -> UrlDictCollect | None:
+        return await driver_class(target, count).news_collector()
+
+    return fetch
+
+
+def from_selenium(driver_class: type[AsyncSeleniumNewsDriver]) -> Callable[..., Awaitable]:
+    """Selenium 드라이버를 수집 방법으로 (실패 시 API 로 넘어가는 것은 선택기가 담당)"""
+
+    async def fetch(target: str, count: int) -> UrlDictCollect:
+        driver = driver_class(target, count)
+        return driver.flatten(await driver.run_crawler())
+
+    return fetch
+
+
+def browser_enabled() -> bool:
+    return get_browser_pool().config.enabled
+
+
+SITE_STRATEGIES: dict[str, list[FetchStrategy]] = {
+    "daum": [
+        FetchStrategy("api", 0, from_driver(AsyncDaumNewsParsingDriver)),
+        FetchStrategy("html", 1, from_driver(AsyncDaumHtmlParsingDriver)),
+        FetchStrategy("browser", 2, from_selenium(AsyncDaumSeleniumDriver), browser_enabled),
+    ],
+    "google": [
+        FetchStrategy("html", 1, from_driver(AsyncGoogleNewsParsingDriver)),
+        FetchStrategy("browser", 2, from_selenium(AsyncGoogleSeleniumDriver), browser_enabled),
+    ],
+}
+
+
+@lru_cache(maxsize=None)
+def get_strategy_book(site: str) -> StrategyBook:
+    """사이트별 지표 (프로세스 공용)"""
+    return StrategyBook(site, SITE_STRATEGIES[site], FetchStrategyConfig.from_settings())
+
+
+class AdaptiveNewsDriver:
+    """
+    수집 방법을 골라 실행하는 드라이버 (api_ndg 드라이버와 같은 사용법)
+    Args:
+        target (str): 검색어
+        count (int): 수집할 페이지 수
+        book (StrategyBook | None): 방법/지표 (None이면 사이트 공용)
+    """
+
+    home: str
+
+    def __init__(self, target: str, count: int, book: StrategyBook | None = None) -> None:
+        self.target = target
+        self.count = count
+        self.book = book or get_strategy_book(self.home)
+
+    async def news_collector(self) -> UrlDictCollect:
+        """
+        싼 방법부터 시도해 충분한 결과를 반환 (모두 부족하면 가장 많이 모은 결과)
+        Returns:
+            UrlDictCollect: 기사 목록
+        """
+        best: UrlDictCollect = []
+        for strategy in self.book.plan():
+            start = time.perf_counter()
+            try:
+                data = [
+                    item for item in await strategy.fetch(self.target, self.count) or [] if item
+                ]
+            except Exception as error:
+                logger.warning(f"⚠️ {self.home} {strategy.name} 수집 실패 --> {error}")
+                data = []
+            ok = self.book.enough(strategy, len(data))
+            self.book.record(strategy, ok, len(data), time.perf_counter() - start)
+            if ok:
+                return data
+            if len(data) > len(best):
+                best = data
+        return best
+
+
+class AdaptiveDaumDriver(AdaptiveNewsDriver):
+    """다음 (API → HTML → 브라우저)"""
+
+    home = "daum"
+
+
+class AdaptiveGoogleDriver(AdaptiveNewsDriver):
+    """구글 (HTML → 브라우저)"""
+
+    home = "google"
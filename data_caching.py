@@ -1,17 +1,30 @@
 """1회성 스크립트 이긴한데 재사용 가능성 있음"""
 
 import yaml
-import json
-from typing import TypedDict, Required
-from itertools import product
-from databases.cache.redis_cluster_manager import RedisClusterManager
+from typing import TypedDict, Required, Iterator
+from databases.cache.redis_cluster_manager import RedisClusterManager, configure_logging
+from databases.keyword_generator import (
+    CanonicalizationReport,
+    canonical_keywords,
+    canonicalization_report,
+    iter_canonical_pairs,
+    load_synonyms,
+)
 from databases.keyword import world_keywords, korea_keywords
 
 
 class KeyWords(TypedDict):
-    korea_combi: Required[list[set]]
-    world_combi: Required[list[set]]
-    mixin_combi: Required[list[set]]
+    korea_combi: Required[Iterator[tuple[str, str]]]
+    world_combi: Required[Iterator[tuple[str, str]]]
+    mixin_combi: Required[Iterator[tuple[str, str]]]
+
+
+# 조합별 샤딩 키워드 집합 이름
+COMBINATION_NAMES = {
+    "korea_combi": "korea_combination",
+    "world_combi": "global_combination",
+    "mixin_combi": "mixin_combination",
+}
 
 # YAML 설정 로드
 def load_config(file_path: str) -> dict:
@@ -25,37 +38,68 @@ def load_config(file_path: str) -> dict:
         return yaml.safe_load(file)
 
 
+def iter_pairs(
+    left: list[str], right: list[str] | None = None
+) -> Iterator[tuple[str, str]]:
+    """ 정규화된 키워드 조합 반복자 (자기 조합, 순서만 다른 조합 제외)
+    Args:
+        left (list[str]): 앞 키워드
+        right (list[str] | None): 뒤 키워드 (None 이면 left 안의 조합)
+    Returns:
+        Iterator[tuple[str, str]]: 조합 반복자
+    """
+    return iter_canonical_pairs(left, right, load_synonyms())
+
+
 # 데이터 조합 생성
 def generate_combinations() -> KeyWords:
-    """ 키워드 조합 데이터를 생성합니다.
+    """ 키워드 조합 데이터를 생성합니다. (지연 생성, 필요할 때 하나씩 만들어짐)
     Returns:
-        dict: 생성된 키워드 조합
+        dict: 생성된 키워드 조합 반복자
     """
     return KeyWords(
-        korea_combi=list(set(product(korea_keywords, korea_keywords))),
-        world_combi=list(set(product(korea_keywords, korea_keywords))),
-        mixin_combi=list(set(product(korea_keywords, korea_keywords))),
+        korea_combi=iter_pairs(korea_keywords),
+        world_combi=iter_pairs(world_keywords),
+        mixin_combi=iter_pairs(korea_keywords, world_keywords),
     )
 
+
+def combination_reports() -> dict[str, CanonicalizationReport]:
+    """ 조합별 정규화 제거 통계 (기존 product 조합 대비)
+    Returns:
+        dict[str, CanonicalizationReport]: 조합 이름 -> 통계
+    """
+    synonyms = load_synonyms()
+    return {
+        "korea_combi": canonicalization_report(korea_keywords, None, synonyms),
+        "world_combi": canonicalization_report(world_keywords, None, synonyms),
+        "mixin_combi": canonicalization_report(korea_keywords, world_keywords, synonyms),
+    }
+
 # 데이터 저장 함수
-def store_combinations(manager: RedisClusterManager, combinations: dict) -> None:
+def store_combinations(manager: RedisClusterManager, chunk_size: int = 5000) -> None:
     """ Redis 클러스터에 조합 데이터를 저장합니다.
+    키워드 목록은 리스트 키로, 조합은 노드 전체에 퍼진 해시태그 파티션 set 으로 저장합니다.
     Args:
         manager (RedisClusterManager): Redis 클러스터 관리자 인스턴스
-        combinations (dict): 저장할 키워드 조합 데이터
+        chunk_size (int): 명령 1회에 담을 항목 수
     """
-    # Redis에 데이터 저장
-    data_to_store = [
-        ("node7000:korea_keywords", korea_keywords),
-        ("node7000:global_keywords", world_keywords),
-        ("node7001:korea_combination", combinations["korea_combi"][:len(combinations["korea_combi"]) // 2]),
-        ("node7002:global_combination", combinations["world_combi"][len(combinations["world_combi"]) // 2:]),
-        ("node7002:mixin_combination", combinations["mixin_combi"][len(combinations["mixin_combi"]) // 2:]),
-    ]
+    synonyms = load_synonyms()
+    for key, values in [
+        ("node7000:korea_keywords", iter(canonical_keywords(korea_keywords, synonyms))),
+        ("node7000:global_keywords", iter(canonical_keywords(world_keywords, synonyms))),
+    ]:
+        count = manager.store_stream(key, values, chunk_size=chunk_size)
+        print(f"✅ '{key}' 데이터 {count}건 저장 완료.")
+
+    for name, report in combination_reports().items():
+        print(f"🔎 '{COMBINATION_NAMES[name]}' 정규화: {report}")
 
-    for key, value in data_to_store:
-        manager.store_data(key, json.dumps(value))
-        print(f"✅ '{key}' 데이터 저장 완료.")
+    for name, values in generate_combinations().items():
+        layout = manager.store_sharded(
+            COMBINATION_NAMES[name], values, chunk_size=chunk_size
+        )
+        print(f"✅ '{layout.name}' 데이터 {layout.partitions}개 파티션 저장 완료.")
 
 
 # 메인 실행 함수
@@ -65,11 +109,11 @@ def cluster_main() -> None:
     manager = RedisClusterManager()
 
     # 데이터 조합 생성 및 저장
-    combinations = generate_combinations()
-    store_combinations(manager, combinations)
+    store_combinations(manager)
 
 
 if __name__ == "__main__":
+    configure_logging()
     print("🔄 Redis Cluster 데이터 저장 시작...")
     cluster_main()
-    print("✅ Redis Cluster 데이터 저장 완료.")
\ No newline at end of file
+    print("✅ Redis Cluster 데이터 저장 완료.")
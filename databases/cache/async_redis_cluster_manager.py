@@ -0,0 +1,383 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Iterable, Union
+
+import redis.asyncio as aioredis
+from redis.asyncio.cluster import ClusterNode
+
+from configs.settings import RedisNode, get_database_settings
+from databases.cache.keyword_shards import ShardLayout, manifest_key
+from databases.cache.node_router import hot_nodes, replica_read_options
+from databases.cache.codec import ValueCodec, get_codec
+from utils.helpers import chunked
+
+
+logger = logging.getLogger("redis_cluster")
+
+
+# Redis 클러스터 비동기 관리자
+class AsyncRedisClusterManager:
+    """
+    redis.asyncio.RedisCluster 기반 비동기 클러스터 관리자 (RedisClusterManager 와 같은 API)
+
+    클러스터 클라이언트가 슬롯 -> 노드 매핑을 들고 키를 담당 노드로 보내고,
+    노드별 연결 풀을 모든 코루틴이 공유한다. 연결은 처음 명령을 보낼 때 만들어진다.
+        >>> async with AsyncRedisClusterManager() as manager:
+        ...     await manager.store_data("key", {"a": 1})
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 32,
+        cluster_client: aioredis.RedisCluster | None = None,
+        codec: ValueCodec | None = None,
+    ) -> None:
+        """
+        Args:
+            max_connections (int): 노드별 연결 풀 크기
+            cluster_client (aioredis.RedisCluster | None): 이미 만든 클라이언트 (None이면 database.yaml 로 생성)
+            codec (ValueCodec | None): 값 형식 (None이면 database.yaml 의 codec)
+        """
+        self.codec = codec or get_codec()
+        self.nodes: list[RedisNode] = get_database_settings().redis_clusters
+        self.cluster_client = cluster_client or aioredis.RedisCluster(
+            startup_nodes=[ClusterNode(host=node.host, port=node.port) for node in hot_nodes(self.nodes)],
+            decode_responses=False,
+            max_connections=max_connections,
+            **replica_read_options(self.nodes),
+        )
+        self.node_clients: dict[int, aioredis.Redis] = {
+            node.port: aioredis.Redis(
+                host=node.host,
+                port=node.port,
+                decode_responses=False,
+                max_connections=max_connections,
+            )
+            for node in self.nodes
+        }
+
+    async def __aenter__(self) -> "AsyncRedisClusterManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """연결 풀 정리"""
+        await self.cluster_client.aclose()
+        await asyncio.gather(*(client.aclose() for client in self.node_clients.values()))
+
+    def _node_client(self, port: int) -> aioredis.Redis:
+        if port not in self.node_clients:
+            raise ValueError(f"❌ 지정된 포트 {port}에 해당하는 노드가 없습니다.")
+        return self.node_clients[port]
+
+    async def store_data(self, key: str, value: Union[str, dict], port: int | None = None) -> None:
+        """
+        데이터를 Redis 클러스터에 저장. 특정 포트에 저장할 수 있음.
+        Args:
+            key (str): 저장할 키
+            value (Union[str, dict]): 저장할 값
+            port (Optional[int]): 특정 노드의 포트 번호 (None이면 슬롯 기준 자동 분산)
+        """
+        try:
+            client = self._node_client(port) if port else self.cluster_client
+            await client.set(key, self.codec.encode(value))
+            logger.info(f"✅ {key} → {port or 'Redis 클러스터'}에 저장됨.")
+        except Exception as e:
+            logger.error(f"❌ 데이터 저장 실패 (키: {key}, 포트: {port}): {e}")
+            print(f"❌ 데이터 저장 실패: {e}")
+
+    async def fetch_data(self, key: str, port: int | None = None) -> Union[str, dict, None]:
+        """
+        데이터를 Redis 클러스터에서 조회. 특정 포트에서 조회 가능.
+        Args:
+            key (str): 조회할 키
+            port (Optional[int]): 특정 노드의 포트 번호 (None이면 클러스터에서 조회)
+        Returns:
+            Union[str, dict, None]: 조회된 값
+        """
+        try:
+            client = self._node_client(port) if port else self.cluster_client
+            return self.codec.decode(await client.get(key))
+        except Exception as e:
+            logger.error(f"❌ 데이터 조회 실패 (키: {key}, 포트: {port}): {e}")
+            print(f"❌ 데이터 조회 실패: {e}")
+            return None
+
+    async def store_many(self, items: dict[str, Union[str, dict]]) -> None:
+        """
+        여러 키를 한 번에 저장 (슬롯별로 묶어 노드마다 MSET)
+        Args:
+            items (dict[str, Union[str, dict]]): 키 -> 값
+        """
+        if not items:
+            return
+        await self.cluster_client.mset_nonatomic(
+            {key: self.codec.encode(value) for key, value in items.items()}
+        )
+        logger.info(f"✅ {len(items)}개 키 일괄 저장됨.")
+
+    async def fetch_many(self, keys: Iterable[str]) -> dict[str, Union[str, dict, None]]:
+        """
+        여러 키를 한 번에 조회 (슬롯별로 묶어 노드마다 MGET)
+        Args:
+            keys (Iterable[str]): 조회할 키
+        Returns:
+            dict[str, Union[str, dict, None]]: 키 -> 값 (없으면 None)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        values = await self.cluster_client.mget_nonatomic(keys)
+        return {key: self.codec.decode(value) for key, value in zip(keys, values)}
+
+    async def store_stream(
+        self,
+        key: str,
+        values: Iterable[Any],
+        chunk_size: int = 5000,
+        pipeline_depth: int = 10,
+    ) -> int:
+        """
+        반복자 데이터를 청크 단위 RPUSH 파이프라인으로 리스트에 저장
+        Args:
+            key (str): 저장할 리스트 키 (기존 값은 교체)
+            values (Iterable[Any]): 저장할 값 반복자 (항목별 JSON 직렬화)
+            chunk_size (int): RPUSH 1회에 담을 항목 수
+            pipeline_depth (int): 파이프라인 1회 전송에 담을 RPUSH 수
+        Returns:
+            int: 저장한 항목 수
+        """
+        pipe = self.cluster_client.pipeline()
+        pipe.delete(key)
+        total = 0
+        for index, chunk in enumerate(chunked(values, chunk_size), start=1):
+            pipe.rpush(key, *(self.codec.encode(value) for value in chunk))
+            total += len(chunk)
+            if index % pipeline_depth == 0:
+                await pipe.execute()
+        await pipe.execute()
+        logger.info(f"✅ {key} → {total}건 청크 저장됨.")
+        return total
+
+    async def fetch_stream(self, key: str, chunk_size: int = 5000) -> AsyncIterator[Any]:
+        """
+        store_stream 으로 저장한 리스트를 LRANGE 페이지 단위로 순회
+        Args:
+            key (str): 조회할 리스트 키
+            chunk_size (int): LRANGE 1회 조회 항목 수
+        Yields:
+            Any: JSON 역직렬화된 항목
+        """
+        start = 0
+        while page := await self.cluster_client.lrange(key, start, start + chunk_size - 1):
+            for value in page:
+                yield self.codec.decode(value)
+            start += len(page)
+
+    async def store_sharded(
+        self,
+        name: str,
+        values: Iterable[Any],
+        partitions: int | None = None,
+        kind: str = "set",
+        chunk_size: int = 5000,
+    ) -> ShardLayout:
+        """
+        키워드 집합을 해시태그 파티션으로 나눠 클러스터 전체에 저장
+        Args:
+            name (str): 키워드 집합 이름
+            values (Iterable[Any]): 저장할 값 반복자 (항목별 JSON 직렬화)
+            partitions (int | None): 파티션 수 (None이면 database.yaml 노드 수 x 4)
+            kind (str): "set"(SADD, 중복 제거) 또는 "list"(RPUSH, 순서 유지)
+            chunk_size (int): 파티션별 명령 1회에 담을 항목 수
+        Returns:
+            ShardLayout: 저장된 샤딩 정보
+        """
+        layout = ShardLayout(
+            name=name,
+            partitions=partitions or len(self.nodes) * 4,
+            kind=kind,
+        )
+        keys = layout.keys
+        command = "sadd" if kind == "set" else "rpush"
+        buffers: list[list[str]] = [[] for _ in keys]
+
+        pipe = self.cluster_client.pipeline()
+        for key in keys:
+            pipe.delete(key)
+        await pipe.execute()
+
+        total = 0
+        for index, value in enumerate(values):
+            member = self.codec.encode(value)
+            partition = (
+                layout.partition_of(member) if kind == "set" else index % len(keys)
+            )
+            buffers[partition].append(member)
+            total += 1
+            if len(buffers[partition]) >= chunk_size:
+                getattr(pipe, command)(keys[partition], *buffers[partition])
+                buffers[partition] = []
+                await pipe.execute()
+
+        for key, buffer in zip(keys, buffers):
+            if buffer:
+                getattr(pipe, command)(key, *buffer)
+        pipe.set(layout.manifest_key, layout.dumps())
+        await pipe.execute()
+        logger.info(f"✅ {name} → {layout.partitions}개 파티션에 {total}건 저장됨.")
+        return layout
+
+    async def fetch_layout(self, name: str) -> ShardLayout | None:
+        """
+        샤딩 정보 조회
+        Args:
+            name (str): 키워드 집합 이름
+        Returns:
+            ShardLayout | None: 샤딩 정보 (없으면 None)
+        """
+        value = await self.cluster_client.get(manifest_key(name))
+        return ShardLayout.loads(value) if value else None
+
+    async def _scan_partition(
+        self, layout: ShardLayout, key: str, count: int, pages: asyncio.Queue
+    ) -> None:
+        """파티션 하나를 끝까지 읽어 페이지를 큐에 넣음 (SSCAN 또는 LRANGE)"""
+        cursor = 0
+        while True:
+            if layout.kind == "set":
+                cursor, page = await self.cluster_client.sscan(key, cursor=cursor, count=count)
+            else:
+                page = await self.cluster_client.lrange(key, cursor, cursor + count - 1)
+                cursor = cursor + len(page) if len(page) == count else 0
+            if page:
+                await pages.put([self.codec.decode(member) for member in page])
+            if cursor == 0:
+                return
+
+    async def iter_sharded(
+        self, name: str, count: int = 1000, concurrency: int | None = None
+    ) -> AsyncIterator[list[Any]]:
+        """
+        샤딩된 키워드 집합을 페이지 단위로 순회. 파티션을 동시에 읽고 도착한 순서대로 넘겨줌
+        Args:
+            name (str): 키워드 집합 이름
+            count (int): 페이지 크기 (SSCAN COUNT 힌트 / LRANGE 개수)
+            concurrency (int | None): 동시에 읽을 파티션 수 (None이면 노드 수)
+        Yields:
+            list[Any]: JSON 역직렬화된 항목 묶음
+        """
+        layout = await self.fetch_layout(name)
+        if layout is None:
+            return
+
+        pending = list(reversed(layout.keys))
+        workers_count = min(concurrency or max(len(self.nodes), 1), len(pending))
+        pages: asyncio.Queue = asyncio.Queue(maxsize=workers_count)
+
+        async def worker() -> None:
+            # 끝나면 None, 실패하면 예외를 큐에 넣어 소비자에게 알림
+            try:
+                while pending:
+                    await self._scan_partition(layout, pending.pop(), count, pages)
+            except Exception as e:
+                await pages.put(e)
+            else:
+                await pages.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(workers_count)]
+        finished = 0
+        try:
+            while finished < workers_count:
+                page = await pages.get()
+                if page is None:
+                    finished += 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    yield page
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    aiter_sharded = iter_sharded
+
+    async def xadd_many(
+        self,
+        stream: str,
+        values: Iterable[Any],
+        maxlen: int | None = 100_000,
+        pipeline_depth: int = 500,
+    ) -> list[bytes]:
+        """
+        값을 Redis Stream 에 파이프라인 XADD 로 추가 (MAXLEN ~ 로 오래된 항목 정리)
+        Args:
+            stream (str): 스트림 키
+            values (Iterable[Any]): 추가할 값 (항목별 codec 직렬화, 필드 "v")
+            maxlen (int | None): 유지할 대략적인 최대 길이 (None이면 정리하지 않음)
+            pipeline_depth (int): 파이프라인 1회 전송에 담을 XADD 수
+        Returns:
+            list[bytes]: 추가된 항목 ID
+        """
+        ids: list[bytes] = []
+        pipe = self.cluster_client.pipeline()
+        for chunk in chunked(values, pipeline_depth):
+            for value in chunk:
+                pipe.xadd(stream, {"v": self.codec.encode(value)}, maxlen=maxlen, approximate=True)
+            ids.extend(await pipe.execute())
+        return ids
+
+    async def ensure_group(self, stream: str, group: str, start_id: str = "$") -> bool:
+        """
+        소비자 그룹 생성 (스트림이 없으면 같이 만들고, 이미 있으면 그대로 둠)
+        Args:
+            stream (str): 스트림 키
+            group (str): 그룹 이름
+            start_id (str): 그룹이 읽기 시작할 ID ("$": 이후 추가분, "0": 처음부터)
+        Returns:
+            bool: 새로 만들었으면 True
+        """
+        try:
+            await self.cluster_client.xgroup_create(stream, group, id=start_id, mkstream=True)
+            return True
+        except aioredis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+            return False
+
+    async def read_group(
+        self,
+        stream: str,
+        group: str,
+        consumer: str,
+        count: int = 100,
+        block_ms: int | None = 1000,
+    ) -> list[tuple[str, Any]]:
+        """
+        소비자 그룹으로 아직 전달되지 않은 항목 읽기 (XREADGROUP >)
+        Args:
+            stream (str): 스트림 키
+            group (str): 그룹 이름
+            consumer (str): 소비자 이름
+            count (int): 최대 항목 수
+            block_ms (int | None): 새 항목을 기다릴 시간 (ms, None이면 기다리지 않음)
+        Returns:
+            list[tuple[str, Any]]: (항목 ID, 역직렬화된 값)
+        """
+        reply = await self.cluster_client.xreadgroup(
+            group, consumer, {stream: ">"}, count=count, block=block_ms
+        )
+        return [
+            (entry_id.decode(), self.codec.decode(fields.get(b"v")))
+            for _, entries in reply or []
+            for entry_id, fields in entries
+        ]
+
+    async def ack(self, stream: str, group: str, *ids: str) -> int:
+        """처리 완료한 항목 확인 (XACK)"""
+        if not ids:
+            return 0
+        return await self.cluster_client.xack(stream, group, *ids)
@@ -0,0 +1,102 @@
+"""Redis 값 직렬화 (msgpack + 선택적 zstd, 기존 JSON 값도 그대로 읽음)
+
+저장 형식 (첫 바이트가 형식 헤더)
+    - 0x01 + msgpack
+    - 0x02 + zstd(msgpack)
+    - 그 외: 기존 JSON 텍스트 또는 일반 문자열
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import msgpack
+import zstandard
+
+from configs.settings import get_database_settings
+
+
+MSGPACK = b"\x01"
+MSGPACK_ZSTD = b"\x02"
+
+
+@dataclass(frozen=True)
+class ValueCodec:
+    """
+    Redis 값 인코더/디코더
+    Args:
+        format (str): "msgpack" 또는 "json" (json 은 기존 저장 형식)
+        compression (str | None): "zstd" 또는 None
+        level (int): zstd 압축 레벨
+        min_compress_size (int): 이 크기(byte) 이상인 값만 압축
+    """
+
+    format: str = "msgpack"
+    compression: str | None = "zstd"
+    level: int = 3
+    min_compress_size: int = 512
+
+    def encode(self, value: Any) -> bytes | str:
+        """
+        값 직렬화
+        Args:
+            value (Any): 저장할 값 (dict/list/str/숫자 등)
+        Returns:
+            bytes | str: Redis 에 저장할 값
+        """
+        if self.format == "json":
+            return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+        packed = msgpack.packb(value, use_bin_type=True)
+        if self.compression == "zstd" and len(packed) >= self.min_compress_size:
+            return MSGPACK_ZSTD + _compressor(self.level).compress(packed)
+        return MSGPACK + packed
+
+    def decode(self, value: bytes | str | None) -> Any:
+        """
+        값 역직렬화 (헤더가 없으면 기존 JSON/문자열로 해석, 빈 값은 None)
+        Args:
+            value (bytes | str | None): Redis 에서 읽은 값
+        Returns:
+            Any: 원래 값
+        """
+        if not value:
+            return None
+        if isinstance(value, bytes):
+            header = value[:1]
+            if header == MSGPACK:
+                return msgpack.unpackb(value[1:], raw=False)
+            if header == MSGPACK_ZSTD:
+                return msgpack.unpackb(_decompressor().decompress(value[1:]), raw=False)
+            value = value.decode("utf-8")
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+
+
+_local = threading.local()
+
+
+def _compressor(level: int) -> zstandard.ZstdCompressor:
+    """스레드별 압축기 (zstd 압축기 객체는 스레드 간 공유 불가)"""
+    compressors = _local.__dict__.setdefault("compressors", {})
+    if level not in compressors:
+        compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressors[level]
+
+
+def _decompressor() -> zstandard.ZstdDecompressor:
+    if not hasattr(_local, "decompressor"):
+        _local.decompressor = zstandard.ZstdDecompressor()
+    return _local.decompressor
+
+
+# 기존 저장 형식 (JSON 텍스트)
+JSON_CODEC = ValueCodec(format="json", compression=None)
+
+
+def get_codec() -> ValueCodec:
+    """database.yaml 의 codec 설정으로 만든 코덱"""
+    return ValueCodec(**get_database_settings().codec.model_dump())
@@ -0,0 +1,81 @@
+"""키워드 집합의 해시태그 샤딩 키 레이아웃"""
+
+import json
+import zlib
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+
+from redis.crc import REDIS_CLUSTER_HASH_SLOTS, key_slot
+
+
+KEY_PREFIX = "keywords"
+
+
+@lru_cache(maxsize=None)
+def partition_tag(name: str, index: int, partitions: int) -> str:
+    """
+    파티션 index 의 해시 슬롯이 전체 슬롯 공간의 index 번째 구간에 들어가도록 고른 해시태그.
+    클러스터 슬롯이 노드에 균등 분배되어 있으면 파티션도 노드에 고르게 퍼진다.
+    Args:
+        name (str): 키워드 집합 이름
+        index (int): 파티션 번호
+        partitions (int): 전체 파티션 수
+    Returns:
+        str: 해시태그 ("{}" 안에 들어갈 문자열)
+            - ex) mixin_combination:0:17
+    """
+    low = index * REDIS_CLUSTER_HASH_SLOTS // partitions
+    high = (index + 1) * REDIS_CLUSTER_HASH_SLOTS // partitions
+    salt = 0
+    while True:
+        tag = f"{name}:{index}:{salt}"
+        if low <= key_slot(tag.encode()) < high:
+            return tag
+        salt += 1
+
+
+@dataclass(frozen=True)
+class ShardLayout:
+    """
+    샤딩된 키워드 집합 정보 (manifest 키에 JSON으로 저장)
+    Args:
+        name (str): 키워드 집합 이름
+        partitions (int): 파티션 수
+        kind (str): "set"(SADD/SSCAN) 또는 "list"(RPUSH/LRANGE)
+    """
+
+    name: str
+    partitions: int
+    kind: str = "set"
+
+    @property
+    def manifest_key(self) -> str:
+        return manifest_key(self.name)
+
+    @property
+    def keys(self) -> list[str]:
+        """파티션 키 목록
+        - ex) keywords:mixin_combination:{mixin_combination:0:17}
+        """
+        return [
+            f"{KEY_PREFIX}:{self.name}:{{{partition_tag(self.name, index, self.partitions)}}}"
+            for index in range(self.partitions)
+        ]
+
+    def partition_of(self, member: str | bytes) -> int:
+        """멤버가 들어갈 파티션 (재저장해도 같은 파티션이라 집합 중복 제거가 유지됨)"""
+        if isinstance(member, str):
+            member = member.encode("utf-8")
+        return zlib.crc32(member) % self.partitions
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def loads(cls, value: str) -> "ShardLayout":
+        return cls(**json.loads(value))
+
+
+def manifest_key(name: str) -> str:
+    """샤딩 정보 키"""
+    return f"{KEY_PREFIX}:{name}:manifest"
@@ -0,0 +1,268 @@
+"""프로세스 내부 읽기 캐시 (TTL + LRU, 역직렬화된 값 보관)
+
+Redis 6+ 에서는 CLIENT TRACKING (BCAST + REDIRECT + PREFIX) 으로 다른 클라이언트의 쓰기를
+__redis__:invalidate 채널로 받아 즉시 무효화하고, 추적을 켤 수 없으면 TTL 로만 만료시킨다.
+원본을 읽는 동안 무효화가 도착하면 읽은 값은 캐시하지 않는다 (reserve 토큰).
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+import redis
+
+
+logger = logging.getLogger("redis_cluster")
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# 캐시에 없음을 나타내는 값 (None 도 캐시할 수 있도록 별도 객체 사용)
+MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LocalCache:
+    """
+    크기 제한 TTL + LRU 캐시 (스레드 안전)
+    Args:
+        max_size (int): 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 제거)
+        ttl (float): 항목 유효 시간 (초)
+        clock (Callable[[], float]): 시간 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # 원본 조회 중인 키 -> 토큰 (조회 중 무효화되면 지워져 set 이 건너뜀)
+        self._loading: dict[str, int] = {}
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> Any:
+        """
+        캐시 조회
+        Returns:
+            Any: 값 (없거나 만료됐으면 MISSING)
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.stats.misses += 1
+                return MISSING
+            expires_at, value = item
+            if expires_at <= self.clock():
+                del self._items[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return MISSING
+            self._items.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None, token: int | None = None) -> bool:
+        """
+        캐시 저장
+        Args:
+            key (str): 캐시 키
+            value (Any): 값
+            ttl (float | None): 유효 시간 (None이면 기본값)
+            token (int | None): reserve 로 받은 토큰 (그 뒤 무효화됐으면 저장하지 않음)
+        Returns:
+            bool: 저장 여부
+        """
+        with self._lock:
+            if token is not None:
+                if self._loading.get(key) != token:
+                    return False
+                del self._loading[key]
+            self._items[key] = (self.clock() + (self.ttl if ttl is None else ttl), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.stats.evictions += 1
+            return True
+
+    def reserve(self, key: str) -> int:
+        """원본 조회 직전에 호출 (조회 중 들어온 무효화를 set 에서 알 수 있도록)"""
+        with self._lock:
+            self._tokens += 1
+            self._loading[key] = self._tokens
+            return self._tokens
+
+    def release(self, key: str, token: int) -> None:
+        """캐시하지 않기로 한 조회의 토큰 정리"""
+        with self._lock:
+            if self._loading.get(key) == token:
+                del self._loading[key]
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        캐시에 없으면 loader 로 읽어 저장 (read-through, 읽는 동안 무효화되면 저장하지 않음)
+        Args:
+            key (str): 캐시 키
+            loader (Callable[[], Any]): 원본 조회 함수 (None 을 돌려주면 캐시하지 않음)
+        Returns:
+            Any: 값
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+        token = self.reserve(key)
+        try:
+            value = loader()
+        finally:
+            if value is None or value is MISSING:
+                self.release(key, token)
+        if value is not None:
+            self.set(key, value, token=token)
+        return value
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._loading.pop(key, None)
+                if self._items.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.invalidations += len(self._items)
+            self._items.clear()
+            self._loading.clear()
+
+
+class TrackingInvalidator:
+    """
+    노드 하나의 CLIENT TRACKING 무효화 메시지를 받아 캐시에서 지우는 백그라운드 스레드
+
+    구독 연결의 id 로 REDIRECT 하는 BCAST 추적을 별도 연결에 켠다.
+    BCAST 는 접두사가 없으면 노드의 모든 키 쓰기를 보내므로 캐시하는 키의 접두사가 필요하다.
+    (RESP2/RESP3 어느 쪽 연결이든 pub/sub 메시지로 받으므로 기존 클라이언트 설정을 그대로 쓴다)
+    연결이 끊기면 놓친 무효화가 있을 수 있으므로 캐시를 비우고 TTL 만료로 전환한다.
+    Args:
+        cache (LocalCache): 무효화할 캐시
+        client (redis.Redis): 노드 클라이언트
+        prefixes (Iterable[str]): 추적할 키 접두사 (캐시하는 키 공간, 비어 있으면 ValueError)
+        poll_interval (float): 종료 확인 간격 (초)
+    """
+
+    def __init__(
+        self,
+        cache: LocalCache,
+        client: redis.Redis,
+        prefixes: Iterable[str],
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.cache = cache
+        self.client = client
+        self.prefixes = list(prefixes)
+        if not self.prefixes:
+            raise ValueError("❌ CLIENT TRACKING BCAST 에는 추적할 키 접두사가 필요합니다")
+        self.poll_interval = poll_interval
+        self.active = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._subscriber = None
+        self._tracker = None
+
+    def start(self) -> bool:
+        """
+        추적 시작
+        Returns:
+            bool: 추적이 켜졌는지 (False 면 TTL 로만 만료)
+        """
+        pool = self.client.connection_pool
+        try:
+            self._subscriber = pool.make_connection()
+            self._subscriber.send_command("CLIENT", "ID")
+            subscriber_id = self._subscriber.read_response()
+            self._subscriber.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+            self._subscriber.read_response()
+
+            self._tracker = pool.make_connection()
+            args = ["CLIENT", "TRACKING", "ON", "REDIRECT", subscriber_id, "BCAST"]
+            for prefix in self.prefixes:
+                args.extend(["PREFIX", prefix])
+            self._tracker.send_command(*args)
+            self._tracker.read_response()
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ CLIENT TRACKING 사용 불가, TTL 만료만 사용: {e}")
+            self._disconnect()
+            return False
+
+        self.active = True
+        self._thread = threading.Thread(
+            target=self._listen, name="redis-cache-invalidator", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def handle_message(self, message: Any) -> None:
+        """
+        무효화 메시지 처리
+            - ["message", "__redis__:invalidate", [키, ~]] : 해당 키 삭제
+            - ["message", "__redis__:invalidate", None]   : FLUSHALL 등, 전체 삭제
+        """
+        if not isinstance(message, list) or len(message) < 3:
+            return
+        kind, channel, keys = message[0], message[1], message[2]
+        if isinstance(kind, bytes):
+            kind, channel = kind.decode(), channel.decode()
+        if kind != "message" or channel != INVALIDATE_CHANNEL:
+            return
+        if keys is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(
+                key.decode() if isinstance(key, bytes) else key for key in keys
+            )
+
+    def _listen(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if self._subscriber.can_read(timeout=self.poll_interval):
+                    self.handle_message(self._subscriber.read_response())
+        except (redis.RedisError, OSError) as e:
+            if not self._stop.is_set():
+                logger.warning(f"⚠️ 무효화 연결 끊김, 캐시 비우고 TTL 만료로 전환: {e}")
+                self.cache.clear()
+        finally:
+            self.active = False
+            self._disconnect()
+
+    def _disconnect(self) -> None:
+        for connection in (self._subscriber, self._tracker):
+            if connection is not None:
+                connection.disconnect()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 2)
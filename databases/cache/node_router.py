@@ -0,0 +1,160 @@
+"""database.yaml 역할(reader/writer/backup) 기반 노드 선택과 노드별 지연 통계"""
+
+import time
+import random
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Iterator, Sequence
+
+from redis.cluster import ClusterNode
+
+try:
+    from redis.cluster import LoadBalancingStrategy
+except ImportError:  # redis-py 5.3 미만 (read_from_replicas 만 지원)
+    LoadBalancingStrategy = None
+
+from configs.settings import RedisNode
+
+
+READER = "reader"
+WRITER = "writer"
+BACKUP = "backup"
+
+
+def node_name(host: str, port: int) -> str:
+    """redis-py ClusterNode.name 과 같은 형식 (host:port)"""
+    return f"{host}:{port}"
+
+
+def hot_nodes(nodes: Sequence[RedisNode]) -> list[RedisNode]:
+    """backup 을 뺀 노드 (모두 backup 이면 전체)"""
+    return [node for node in nodes if node.role != BACKUP] or list(nodes)
+
+
+def has_readers(nodes: Sequence[RedisNode]) -> bool:
+    return any(node.role == READER for node in nodes)
+
+
+def replica_read_options(nodes: Sequence[RedisNode]) -> dict[str, Any]:
+    """
+    reader 노드가 설정돼 있으면 키 단위 읽기도 replica 로 분산 (RedisCluster 생성 인자)
+    Args:
+        nodes (Sequence[RedisNode]): database.yaml 노드
+    Returns:
+        dict[str, Any]: load_balancing_strategy (redis-py 5.3 이상) 또는 read_from_replicas
+    """
+    if not has_readers(nodes):
+        return {}
+    if LoadBalancingStrategy is None:
+        return {"read_from_replicas": True}
+    return {"load_balancing_strategy": LoadBalancingStrategy.ROUND_ROBIN_REPLICAS}
+
+
+@dataclass
+class NodeStats:
+    """
+    노드별 호출 통계
+    Args:
+        name (str): host:port
+        role (str): 설정된 역할 (설정에 없는 노드는 빈 문자열)
+        ewma_ms (float | None): 지수 이동 평균 지연 (ms)
+    """
+
+    name: str
+    role: str = ""
+    ewma_ms: float | None = None
+    calls: int = 0
+    errors: int = 0
+    in_flight: int = 0
+
+    def record(self, elapsed_ms: float, ok: bool, alpha: float) -> None:
+        self.calls += 1
+        self.errors += 0 if ok else 1
+        self.ewma_ms = (
+            elapsed_ms
+            if self.ewma_ms is None
+            else alpha * elapsed_ms + (1 - alpha) * self.ewma_ms
+        )
+
+    @property
+    def load(self) -> float:
+        """선택 기준 (평균 지연 x 진행 중 요청), 측정 전 노드는 0 이라 먼저 시도됨"""
+        return (self.ewma_ms or 0.0) * (self.in_flight + 1)
+
+
+class NodeRouter:
+    """
+    역할에 맞는 노드를 고르고 노드별 지연을 기록
+        - 쓰기: 슬롯의 primary
+        - 읽기: replica/reader 중 부하가 낮은 노드 (power of two choices), 없으면 primary
+        - backup: 읽기/쓰기 대상에서 제외
+    Args:
+        nodes (Sequence[RedisNode]): database.yaml 노드
+        alpha (float): EWMA 가중치
+        rng (random.Random | None): 난수 생성기 (테스트용)
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[RedisNode],
+        alpha: float = 0.2,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.roles: dict[str, str] = {
+            node_name(node.host, node.port): node.role for node in nodes
+        }
+        self.alpha = alpha
+        self.rng = rng or random.Random()
+        self.stats: dict[str, NodeStats] = {}
+        self._lock = threading.Lock()
+
+    def role_of(self, name: str) -> str:
+        return self.roles.get(name, "")
+
+    def _stats(self, name: str) -> NodeStats:
+        if name not in self.stats:
+            self.stats[name] = NodeStats(name=name, role=self.role_of(name))
+        return self.stats[name]
+
+    def choose_reader(self, candidates: Sequence[ClusterNode]) -> ClusterNode:
+        """
+        슬롯 담당 노드 목록 [primary, replica, ~] 에서 읽기 노드 선택
+        Args:
+            candidates (Sequence[ClusterNode]): 슬롯 담당 노드 (첫 번째가 primary)
+        Returns:
+            ClusterNode: 읽기 노드
+        """
+        usable = [node for node in candidates if self.role_of(node.name) != BACKUP]
+        preferred = [
+            node
+            for index, node in enumerate(usable)
+            if index > 0 or self.role_of(node.name) == READER
+        ]
+        pool = preferred or usable or list(candidates)
+        if len(pool) == 1:
+            return pool[0]
+        with self._lock:
+            first, second = self.rng.sample(pool, 2)
+            return min(first, second, key=lambda node: self._stats(node.name).load)
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """노드 호출 구간의 지연/실패 기록"""
+        with self._lock:
+            stats = self._stats(name)
+            stats.in_flight += 1
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            with self._lock:
+                stats.in_flight -= 1
+                stats.record((time.perf_counter() - started) * 1000, ok, self.alpha)
+
+    def snapshot(self) -> dict[str, dict]:
+        """노드별 통계 사본"""
+        with self._lock:
+            return {name: asdict(stats) for name, stats in self.stats.items()}
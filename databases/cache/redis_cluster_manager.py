@@ -1,22 +1,62 @@
 import redis
-import yaml
-import json
+import asyncio
 import logging
-from pathlib import Path
-from typing import Union, List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterable, Iterator, Union
 from redis.cluster import ClusterNode
+from redis.exceptions import AskError, MovedError
 
-# 로깅 설정
-logging.basicConfig(
-    filename="redis_cluster.log",
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
+from configs.settings import RedisNode, get_database_settings
+from databases.cache.codec import ValueCodec, get_codec
+from databases.cache.keyword_shards import ShardLayout, manifest_key
+from databases.cache.local_cache import MISSING, LocalCache, TrackingInvalidator
+from databases.cache.node_router import (
+    BACKUP,
+    READER,
+    NodeRouter,
+    has_readers,
+    hot_nodes,
+    node_name,
+    replica_read_options,
 )
+from utils.helpers import chunked
+
+
+logger = logging.getLogger("redis_cluster")
+
+
+def configure_logging(filename: str = "redis_cluster.log", level: int = logging.INFO) -> None:
+    """
+    Redis 작업 로그를 파일로 남기도록 설정 (실행 스크립트에서 한 번 호출)
+    Args:
+        filename (str): 로그 파일
+        level (int): 로그 레벨
+    """
+    logging.basicConfig(
+        filename=filename,
+        level=level,
+        format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+
+
+@dataclass
+class BatchResult:
+    """
+    일괄 명령 결과 (실패한 키는 values 에 없고 errors 에만 들어감)
+    Args:
+        values (dict[str, Any]): 키 -> 값 (저장은 True)
+        errors (dict[str, Exception]): 키 -> 실패 원인
+    """
+
+    values: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
 
-# YAML 설정 파일 로드
-CONFIG_PATH = Path(__file__).parent.parent.parent / "configs/cy/database.yaml"
-with open(CONFIG_PATH, "r") as file:
-    config: List[dict] = yaml.safe_load(file)
 
 # Redis 클러스터 관리자
 class RedisClusterManager:
@@ -24,20 +64,109 @@ class RedisClusterManager:
     Redis 클러스터를 동기식으로 관리하는 클래스
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cluster_client: redis.RedisCluster | None = None,
+        codec: ValueCodec | None = None,
+    ) -> None:
         """
         Redis 클러스터 클라이언트 초기화
+        Args:
+            cluster_client (redis.RedisCluster | None): 이미 만든 클라이언트 (None이면 database.yaml 로 생성)
+            codec (ValueCodec | None): 값 형식 (None이면 database.yaml 의 codec, 응답은 bytes 로 받아 코덱이 해석)
         """
-        # Redis 클러스터 노드 설정
+        self.codec = codec or get_codec()
+        # Redis 클러스터 노드 설정 (backup 노드는 시작/읽기/쓰기 경로에서 제외)
+        self.nodes: list[RedisNode] = get_database_settings().redis_clusters
         self.startup_nodes: list[ClusterNode] = [
-            ClusterNode(host=node["host"], port=node["port"]) 
-            for node in config["redis_clusters"]
+            ClusterNode(host=node.host, port=node.port) 
+            for node in hot_nodes(self.nodes)
         ]
-        self.cluster_client = redis.RedisCluster(startup_nodes=self.startup_nodes, decode_responses=True)
-        self.node_clients = {node["host"]: redis.StrictRedis(host=node["host"], port=node["port"], decode_responses=True)
-                             for node in config["redis_clusters"]}
+        # reader 노드가 있으면 키 단위 읽기도 replica 로 분산 (replica 연결은 READONLY 로 열림)
+        self.read_from_replicas = has_readers(self.nodes)
+        self.cluster_client = cluster_client or redis.RedisCluster(
+            startup_nodes=self.startup_nodes,
+            decode_responses=False,
+            **replica_read_options(self.nodes),
+        )
+        self.node_clients = {node.port: redis.StrictRedis(host=node.host, port=node.port, decode_responses=False)
+                             for node in self.nodes}
+        self.nodes_by_port = {node.port: node for node in self.nodes}
+        self.router = NodeRouter(self.nodes)
+        self.local_cache: LocalCache | None = None
+        self._invalidators: list[TrackingInvalidator] = []
         print("🚀 Redis 클러스터 모드 활성화")
 
+    def enable_local_cache(
+        self,
+        max_size: int = 1024,
+        ttl: float = 30.0,
+        tracking: bool = True,
+        prefixes: Iterable[str] = (),
+    ) -> LocalCache:
+        """
+        fetch_data / fetch_many / fetch_list 앞에 프로세스 내부 캐시를 둠 (역직렬화된 값 보관)
+        Args:
+            max_size (int): 최대 항목 수
+            ttl (float): 항목 유효 시간 (초), 추적이 안 되는 노드는 이 시간만큼 이전 값이 보일 수 있음
+            tracking (bool): primary 노드마다 CLIENT TRACKING 무효화 구독
+            prefixes (Iterable[str]): 추적할 키 접두사 (캐시하는 키 공간, tracking 이면 필수)
+        Returns:
+            LocalCache: 캐시 (stats 로 적중률 확인)
+        """
+        prefixes = list(prefixes)
+        if tracking and not prefixes:
+            raise ValueError("❌ 로컬 캐시 추적에는 캐시할 키의 접두사가 필요합니다 (예: prefixes=['KR:'])")
+        self.disable_local_cache()
+        self.local_cache = LocalCache(max_size=max_size, ttl=ttl)
+        if tracking:
+            for node in self.cluster_client.get_primaries():
+                invalidator = TrackingInvalidator(
+                    self.local_cache, node.redis_connection, prefixes
+                )
+                if invalidator.start():
+                    self._invalidators.append(invalidator)
+        logger.info(
+            f"✅ 로컬 캐시 활성화 (추적 노드 {len(self._invalidators)}개, TTL {ttl}초)"
+        )
+        return self.local_cache
+
+    def disable_local_cache(self) -> None:
+        """로컬 캐시와 무효화 구독 정리"""
+        for invalidator in self._invalidators:
+            invalidator.stop()
+        self._invalidators = []
+        self.local_cache = None
+
+    def _forget(self, keys: Iterable[str]) -> None:
+        """이 클라이언트가 쓴 키는 무효화 메시지를 기다리지 않고 바로 캐시에서 제거"""
+        if self.local_cache is not None:
+            self.local_cache.invalidate(keys)
+
+    def _port_client(self, port: int, write: bool = False) -> redis.StrictRedis:
+        """
+        포트로 노드 클라이언트 조회 (역할 확인)
+        Args:
+            port (int): 노드 포트
+            write (bool): 쓰기 여부 (reader/backup 노드에는 쓰지 않음)
+        Returns:
+            redis.StrictRedis: 노드 클라이언트
+        """
+        if port not in self.node_clients:
+            raise ValueError(f"❌ 지정된 포트 {port}에 해당하는 노드가 없습니다.")
+        role = self.nodes_by_port[port].role
+        if role == BACKUP or (write and role == READER):
+            raise ValueError(f"❌ {port}번 노드는 {role} 노드라 {'쓰기' if write else '읽기'} 대상이 아닙니다.")
+        return self.node_clients[port]
+
+    def node_stats(self) -> dict[str, dict]:
+        """
+        노드별 지연(EWMA)/호출/실패/진행 중 요청 수
+        Returns:
+            dict[str, dict]: host:port -> 통계
+        """
+        return self.router.snapshot()
+
     def store_data(self, key: str, value: Union[str, dict], port: int | None = None):
         """
         데이터를 Redis 클러스터에 저장. 특정 포트에 저장할 수 있음.
@@ -47,24 +176,24 @@ class RedisClusterManager:
             port (Optional[int]): 특정 노드의 포트 번호 (None이면 자동 분산)
         """
         try:
-            serialized_value = json.dumps(value) if isinstance(value, dict) else value
+            serialized_value = self.codec.encode(value)
+            self._forget([key])
 
             if port:
                 # 특정 노드에 저장
-                if port not in self.node_clients:
-                    raise ValueError(f"❌ 지정된 포트 {port}에 해당하는 노드가 없습니다.")
-                client = self.node_clients[port]
-                client.set(key, serialized_value)
-                logging.info(f"✅ {key} → {port}번 노드에 저장됨.")
+                client = self._port_client(port, write=True)
+                with self.router.track(node_name(self.nodes_by_port[port].host, port)):
+                    client.set(key, serialized_value)
+                logger.info(f"✅ {key} → {port}번 노드에 저장됨.")
                 print(f"✅ '{key}' → {port}번 노드에 저장됨.")
             else:
                 # 클러스터 자동 분산 저장
                 self.cluster_client.set(key, serialized_value)
-                logging.info(f"✅ {key} → Redis 클러스터에 자동 저장됨.")
+                logger.info(f"✅ {key} → Redis 클러스터에 자동 저장됨.")
                 print(f"✅ '{key}' → Redis 클러스터에 자동 저장됨.")
 
         except Exception as e:
-            logging.error(f"❌ 데이터 저장 실패 (키: {key}, 포트: {port}): {e}")
+            logger.error(f"❌ 데이터 저장 실패 (키: {key}, 포트: {port}): {e}")
             print(f"❌ 데이터 저장 실패: {e}")
 
     def fetch_data(self, key: str, port: int | None = None) -> Union[str, dict, None]:
@@ -79,22 +208,372 @@ class RedisClusterManager:
         try:
             if port:
                 # 특정 노드에서 데이터 조회
-                if port not in self.node_clients:
-                    raise ValueError(f"❌ 지정된 포트 {port}에 해당하는 노드가 없습니다.")
-                client = self.node_clients[port]
-                value = client.get(key)
+                client = self._port_client(port)
+                with self.router.track(node_name(self.nodes_by_port[port].host, port)):
+                    value = client.get(key)
+            elif self.local_cache is not None:
+                # 로컬 캐시 -> 클러스터 순으로 조회
+                return self.local_cache.get_or_load(
+                    key, lambda: self.codec.decode(self.cluster_client.get(key))
+                )
             else:
                 # 클러스터 자동 조회
                 value = self.cluster_client.get(key)
 
-            if value:
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
-            return None
+            return self.codec.decode(value)
         except Exception as e:
-            logging.error(f"❌ 데이터 조회 실패 (키: {key}, 포트: {port}): {e}")
+            logger.error(f"❌ 데이터 조회 실패 (키: {key}, 포트: {port}): {e}")
             print(f"❌ 데이터 조회 실패: {e}")
             return None
 
+    def _group_by_node(
+        self, keys: Iterable[str], read: bool = False
+    ) -> dict[str, tuple[ClusterNode, dict[int, list[str]]]]:
+        """
+        키를 슬롯별로 묶고, 슬롯을 처리할 노드별로 묶음
+        (쓰기는 primary, 읽기는 replica/reader 중 부하가 낮은 노드)
+        """
+        slots: dict[int, list[str]] = defaultdict(list)
+        for key in keys:
+            slots[self.cluster_client.keyslot(key)].append(key)
+
+        nodes_manager = self.cluster_client.nodes_manager
+        groups: dict[str, tuple[ClusterNode, dict[int, list[str]]]] = {}
+        for slot, slot_keys in slots.items():
+            candidates = nodes_manager.slots_cache.get(slot) if read and self.read_from_replicas else None
+            node = (
+                self.router.choose_reader(candidates)
+                if candidates
+                else nodes_manager.get_node_from_slot(slot)
+            )
+            groups.setdefault(node.name, (node, {}))[1][slot] = slot_keys
+        return groups
+
+    def _run_node_batches(
+        self,
+        keys: Iterable[str],
+        queue_command: Any,
+        chunk_size: int,
+        max_workers: int | None,
+        read: bool = False,
+    ) -> list[tuple[list[str], Any]]:
+        """
+        노드마다 파이프라인 하나씩 보내고 노드끼리는 병렬 실행
+        Args:
+            keys (Iterable[str]): 대상 키
+            queue_command (Callable[[Pipeline, list[str]], None]): 같은 슬롯 키 묶음을 파이프라인에 넣는 함수
+            chunk_size (int): 명령 1회에 담을 키 수
+            max_workers (int | None): 동시에 처리할 노드 수 (None이면 노드 수)
+            read (bool): 읽기 명령 여부 (replica/reader 노드로 분산)
+        Returns:
+            list[tuple[list[str], Any]]: (키 묶음, 응답 또는 예외) 목록
+        """
+
+        def run_node(node: ClusterNode, slots: dict[int, list[str]]) -> list[tuple[list[str], Any]]:
+            batches = [
+                batch
+                for slot_keys in slots.values()
+                for batch in chunked(slot_keys, chunk_size)
+            ]
+            pipe = node.redis_connection.pipeline(transaction=False)
+            for batch in batches:
+                queue_command(pipe, batch)
+            try:
+                with self.router.track(node.name):
+                    replies = pipe.execute(raise_on_error=False)
+            except Exception as e:
+                # 노드 자체 장애는 해당 노드의 키만 실패 처리
+                replies = [e] * len(batches)
+            return list(zip(batches, replies))
+
+        groups = self._group_by_node(keys, read=read)
+        if not groups:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or len(groups)) as executor:
+            node_results = executor.map(lambda group: run_node(*group), groups.values())
+            return [pair for pairs in node_results for pair in pairs]
+
+    @staticmethod
+    def _collect(replies: list[tuple[list[str], Any]], unpack: Any) -> BatchResult:
+        """(키 묶음, 응답) 목록을 키별 결과로 풀기"""
+        result = BatchResult()
+        for batch, reply in replies:
+            if isinstance(reply, Exception):
+                result.errors.update(dict.fromkeys(batch, reply))
+            else:
+                result.values.update(unpack(batch, reply))
+        return result
+
+    def _retry_moved(self, result: BatchResult, retry: Any) -> None:
+        """슬롯 이동(MOVED/ASK)으로 실패한 키는 클러스터 클라이언트로 한 건씩 다시 시도"""
+        for key, error in list(result.errors.items()):
+            if isinstance(error, (MovedError, AskError)):
+                try:
+                    result.values[key] = retry(key)
+                    del result.errors[key]
+                except Exception as e:
+                    result.errors[key] = e
+
+    def store_many(
+        self,
+        items: dict[str, Union[str, dict]],
+        chunk_size: int = 1000,
+        max_workers: int | None = None,
+    ) -> BatchResult:
+        """
+        여러 키를 한 번에 저장. 슬롯별 MSET 을 노드별 파이프라인으로 묶어 노드 병렬 전송
+        Args:
+            items (dict[str, Union[str, dict]]): 키 -> 값
+            chunk_size (int): MSET 1회에 담을 키 수
+            max_workers (int | None): 동시에 처리할 노드 수 (None이면 노드 수)
+        Returns:
+            BatchResult: 저장된 키(True)와 실패한 키별 원인
+        """
+        encoded = {key: self.codec.encode(value) for key, value in items.items()}
+        self._forget(encoded)
+        replies = self._run_node_batches(
+            encoded,
+            lambda pipe, batch: pipe.mset({key: encoded[key] for key in batch}),
+            chunk_size,
+            max_workers,
+        )
+        result = self._collect(replies, lambda batch, _: dict.fromkeys(batch, True))
+        self._retry_moved(
+            result, lambda key: bool(self.cluster_client.set(key, encoded[key]))
+        )
+        logger.info(f"✅ {len(result.values)}개 키 일괄 저장됨 (실패 {len(result.errors)}건).")
+        return result
+
+    def fetch_many(
+        self,
+        keys: Iterable[str],
+        chunk_size: int = 1000,
+        max_workers: int | None = None,
+    ) -> BatchResult:
+        """
+        여러 키를 한 번에 조회. 슬롯별 MGET 을 노드별 파이프라인으로 묶어 노드 병렬 전송
+        Args:
+            keys (Iterable[str]): 조회할 키
+            chunk_size (int): MGET 1회에 담을 키 수
+            max_workers (int | None): 동시에 처리할 노드 수 (None이면 노드 수)
+        Returns:
+            BatchResult: 키 -> 값 (없으면 None)과 실패한 키별 원인
+        """
+        keys = list(dict.fromkeys(keys))
+        cached: dict[str, Any] = {}
+        if self.local_cache is not None:
+            for key in keys:
+                value = self.local_cache.get(key)
+                if value is not MISSING:
+                    cached[key] = value
+            keys = [key for key in keys if key not in cached]
+            tokens = {key: self.local_cache.reserve(key) for key in keys}
+
+        replies = self._run_node_batches(
+            keys,
+            lambda pipe, batch: pipe.mget(batch),
+            chunk_size,
+            max_workers,
+            read=True,
+        )
+        result = self._collect(
+            replies,
+            lambda batch, values: {
+                key: self.codec.decode(value) for key, value in zip(batch, values)
+            },
+        )
+        self._retry_moved(
+            result, lambda key: self.codec.decode(self.cluster_client.get(key))
+        )
+        if self.local_cache is not None:
+            for key, token in tokens.items():
+                value = result.values.get(key)
+                if value is None:
+                    self.local_cache.release(key, token)
+                else:
+                    self.local_cache.set(key, value, token=token)
+            result.values.update(cached)
+        if result.errors:
+            logger.error(f"❌ 일괄 조회 실패 {len(result.errors)}건: {next(iter(result.errors.values()))}")
+        return result
+
+    def store_stream(
+        self,
+        key: str,
+        values: Iterable[Any],
+        chunk_size: int = 5000,
+        pipeline_depth: int = 10,
+    ) -> int:
+        """
+        반복자 데이터를 청크 단위 RPUSH 파이프라인으로 리스트에 저장 (전체를 메모리에 올리지 않음)
+        Args:
+            key (str): 저장할 리스트 키 (기존 값은 교체)
+            values (Iterable[Any]): 저장할 값 반복자 (항목별 JSON 직렬화)
+            chunk_size (int): RPUSH 1회에 담을 항목 수
+            pipeline_depth (int): 파이프라인 1회 전송에 담을 RPUSH 수
+        Returns:
+            int: 저장한 항목 수
+        """
+        self._forget([key])
+        pipe = self.cluster_client.pipeline(transaction=False)
+        pipe.delete(key)
+        total = 0
+        for index, chunk in enumerate(chunked(values, chunk_size), start=1):
+            pipe.rpush(key, *(self.codec.encode(value) for value in chunk))
+            total += len(chunk)
+            if index % pipeline_depth == 0:
+                pipe.execute()
+        pipe.execute()
+        logger.info(f"✅ {key} → {total}건 청크 저장됨.")
+        return total
+
+    def fetch_stream(self, key: str, chunk_size: int = 5000) -> Iterator[Any]:
+        """
+        store_stream 으로 저장한 리스트를 LRANGE 페이지 단위로 순회
+        Args:
+            key (str): 조회할 리스트 키
+            chunk_size (int): LRANGE 1회 조회 항목 수
+        Yields:
+            Any: JSON 역직렬화된 항목
+        """
+        start = 0
+        while page := self.cluster_client.lrange(key, start, start + chunk_size - 1):
+            yield from (self.codec.decode(value) for value in page)
+            start += len(page)
+
+    def fetch_list(self, key: str, chunk_size: int = 5000) -> list[Any]:
+        """
+        store_stream 으로 저장한 리스트 전체 (로컬 캐시가 켜져 있으면 역직렬화된 목록을 재사용)
+        Args:
+            key (str): 조회할 리스트 키
+            chunk_size (int): LRANGE 1회 조회 항목 수
+        Returns:
+            list[Any]: JSON 역직렬화된 항목 목록
+        """
+        if self.local_cache is None:
+            return list(self.fetch_stream(key, chunk_size))
+        return self.local_cache.get_or_load(
+            key, lambda: list(self.fetch_stream(key, chunk_size))
+        )
+
+    def store_sharded(
+        self,
+        name: str,
+        values: Iterable[Any],
+        partitions: int | None = None,
+        kind: str = "set",
+        chunk_size: int = 5000,
+    ) -> ShardLayout:
+        """
+        키워드 집합을 해시태그 파티션(Redis set 또는 list)으로 나눠 클러스터 전체에 저장
+        Args:
+            name (str): 키워드 집합 이름
+            values (Iterable[Any]): 저장할 값 반복자 (항목별 JSON 직렬화)
+            partitions (int | None): 파티션 수 (None이면 database.yaml 노드 수 x 4)
+            kind (str): "set"(SADD, 중복 제거) 또는 "list"(RPUSH, 순서 유지)
+            chunk_size (int): 파티션별 명령 1회에 담을 항목 수
+        Returns:
+            ShardLayout: 저장된 샤딩 정보
+        """
+        layout = ShardLayout(
+            name=name,
+            partitions=partitions or len(self.nodes) * 4,
+            kind=kind,
+        )
+        keys = layout.keys
+        command = "sadd" if kind == "set" else "rpush"
+        buffers: list[list[str]] = [[] for _ in keys]
+
+        pipe = self.cluster_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.delete(key)
+        pipe.execute()
+
+        total = 0
+        for index, value in enumerate(values):
+            member = self.codec.encode(value)
+            partition = (
+                layout.partition_of(member) if kind == "set" else index % len(keys)
+            )
+            buffers[partition].append(member)
+            total += 1
+            if len(buffers[partition]) >= chunk_size:
+                getattr(pipe, command)(keys[partition], *buffers[partition])
+                buffers[partition] = []
+                pipe.execute()
+
+        for key, buffer in zip(keys, buffers):
+            if buffer:
+                getattr(pipe, command)(key, *buffer)
+        pipe.set(layout.manifest_key, layout.dumps())
+        pipe.execute()
+        logger.info(f"✅ {name} → {layout.partitions}개 파티션에 {total}건 저장됨.")
+        return layout
+
+    def fetch_layout(self, name: str) -> ShardLayout | None:
+        """
+        샤딩 정보 조회
+        Args:
+            name (str): 키워드 집합 이름
+        Returns:
+            ShardLayout | None: 샤딩 정보 (없으면 None)
+        """
+        value = self.cluster_client.get(manifest_key(name))
+        return ShardLayout.loads(value) if value else None
+
+    def _fetch_page(
+        self, layout: ShardLayout, key: str, cursor: int, count: int
+    ) -> tuple[int, list[str]]:
+        """파티션 1페이지 조회 (SSCAN 또는 LRANGE), 다음 커서가 0이면 끝"""
+        if layout.kind == "set":
+            return self.cluster_client.sscan(key, cursor=cursor, count=count)
+        page = self.cluster_client.lrange(key, cursor, cursor + count - 1)
+        return (cursor + len(page) if len(page) == count else 0), page
+
+    def iter_sharded(self, name: str, count: int = 1000) -> Iterator[list[Any]]:
+        """
+        샤딩된 키워드 집합을 파티션/페이지 단위로 순회
+        Args:
+            name (str): 키워드 집합 이름
+            count (int): 페이지 크기 (SSCAN COUNT 힌트 / LRANGE 개수)
+        Yields:
+            list[Any]: JSON 역직렬화된 항목 묶음
+        """
+        layout = self.fetch_layout(name)
+        if layout is None:
+            return
+        for key in layout.keys:
+            cursor = 0
+            while True:
+                cursor, page = self._fetch_page(layout, key, cursor, count)
+                if page:
+                    yield [self.codec.decode(member) for member in page]
+                if cursor == 0:
+                    break
+
+    async def aiter_sharded(
+        self, name: str, count: int = 1000
+    ) -> AsyncIterator[list[Any]]:
+        """
+        iter_sharded 의 비동기 버전. 첫 페이지가 오면 바로 넘겨주므로 전체 로딩을 기다리지 않음
+        (동기 클라이언트 호출은 스레드에서 실행해 이벤트 루프를 막지 않음)
+        Args:
+            name (str): 키워드 집합 이름
+            count (int): 페이지 크기
+        Yields:
+            list[Any]: JSON 역직렬화된 항목 묶음
+        """
+        layout = await asyncio.to_thread(self.fetch_layout, name)
+        if layout is None:
+            return
+        for key in layout.keys:
+            cursor = 0
+            while True:
+                cursor, page = await asyncio.to_thread(
+                    self._fetch_page, layout, key, cursor, count
+                )
+                if page:
+                    yield [self.codec.decode(member) for member in page]
+                if cursor == 0:
+                    break
+
@@ -1,47 +1,57 @@
 import asyncio
-import aioredis
-import yaml
-import json
 import logging
-from pathlib import Path
 
+import redis.asyncio as aioredis
 
-# 로깅 설정
-logging.basicConfig(
-    filename="redis_cluster.log",
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
-)
+from configs.settings import RedisNode, get_database_settings
+from databases.cache.codec import ValueCodec, get_codec
+from databases.cache.redis_cluster_manager import configure_logging
 
-# YAML 설정 파일 로드
-CONFIG_PATH = Path(__file__).parent / "configs/database.yaml"
-with open(CONFIG_PATH, "r") as file:
-    config: list[dict[str, str | int]] = yaml.safe_load(file)["redis_clusters"]
+
+logger = logging.getLogger("redis_cluster")
 
 # Redis 클러스터 비동기 관리자
 class RedisManager:
     """
-    Redis 클러스터를 비동기적으로 관리하는 클래스
+    Redis 노드를 포트 단위로 비동기 관리하는 클래스 (노드별 연결 풀을 재사용)
     """
 
-    def __init__(self):
+    def __init__(self, max_connections: int = 16, codec: ValueCodec | None = None):
         """
         Redis 클라이언트 초기화
+        Args:
+            max_connections (int): 노드별 연결 풀 크기
+            codec (ValueCodec | None): 값 형식 (None이면 database.yaml 의 codec)
         """
-        self.startup_nodes: list[dict[str, str | int]] = config
+        self.codec = codec or get_codec()
+        self.startup_nodes: list[RedisNode] = get_database_settings().redis_clusters
+        self.max_connections = max_connections
+        self._clients: dict[int, aioredis.Redis] = {}
 
-    async def get_client(self, port: int) -> aioredis.Redis:
+    def get_client(self, port: int) -> aioredis.Redis:
         """
-        특정 노드에 연결하는 비동기 클라이언트 생성
+        특정 노드의 비동기 클라이언트 (처음 요청 시 만들고 이후 재사용)
         Args:
             port (int): 노드의 포트 번호
         Returns:
             aioredis.Redis: 비동기 Redis 클라이언트
         """
-        node = next((n for n in self.startup_nodes if n["port"] == port), None)
-        if not node:
-            raise ValueError(f"❌ 포트 {port}에 해당하는 노드가 없습니다.")
-        return await aioredis.from_url(f"redis://{node['host']}:{node['port']}")
+        if port not in self._clients:
+            node = next((n for n in self.startup_nodes if n.port == port), None)
+            if not node:
+                raise ValueError(f"❌ 포트 {port}에 해당하는 노드가 없습니다.")
+            self._clients[port] = aioredis.Redis(
+                host=node.host,
+                port=node.port,
+                decode_responses=False,
+                max_connections=self.max_connections,
+            )
+        return self._clients[port]
+
+    async def aclose(self) -> None:
+        """연결 풀 정리"""
+        await asyncio.gather(*(client.aclose() for client in self._clients.values()))
+        self._clients.clear()
 
     async def store_data(self, port: int, key: str, value: str | dict):
         """
@@ -51,17 +61,13 @@ class RedisManager:
             key (str): 저장할 키
             value (str | dict): 저장할 값 (문자열 또는 딕셔너리)
         """
-        client = await self.get_client(port)
         try:
-            serialized_value = json.dumps(value) if isinstance(value, dict) else value
-            await client.set(key, serialized_value)
-            logging.info(f"✅ {key} → {port}번 노드에 저장됨.")
+            await self.get_client(port).set(key, self.codec.encode(value))
+            logger.info(f"✅ {key} → {port}번 노드에 저장됨.")
             print(f"✅ '{key}' → {port}번 노드에 저장됨.")
         except Exception as e:
-            logging.error(f"❌ 데이터 저장 실패 (포트 {port}, 키: {key}): {e}")
+            logger.error(f"❌ 데이터 저장 실패 (포트 {port}, 키: {key}): {e}")
             print(f"❌ 데이터 저장 실패: {e}")
-        finally:
-            await client.close()
 
     async def fetch_data(self, port: int, key: str):
         """
@@ -72,25 +78,16 @@ class RedisManager:
         Returns:
             str | dict | None: 조회된 값
         """
-        client = await self.get_client(port)
         try:
-            value = await client.get(key)
-            if value:
-                try:
-                    return json.loads(value)  # JSON 직렬화된 값을 딕셔너리로 반환
-                except json.JSONDecodeError:
-                    return value  # 일반 문자열 반환
-            return None
+            return self.codec.decode(await self.get_client(port).get(key))
         except Exception as e:
-            logging.error(f"❌ 데이터 조회 실패 (포트 {port}, 키: {key}): {e}")
+            logger.error(f"❌ 데이터 조회 실패 (포트 {port}, 키: {key}): {e}")
             print(f"❌ 데이터 조회 실패: {e}")
             return None
-        finally:
-            await client.close()
 
 # 비동기 실행
 async def main():
-    manager = RedisClusterManager()
+    manager = RedisManager()
 
     # 테스트 키워드 데이터
     test_data = [
@@ -111,7 +108,10 @@ async def main():
     for data, result in zip(test_data, results):
         print(f"📖 조회된 데이터: '{data['key']}' → {result}")
 
+    await manager.aclose()
+
 if __name__ == "__main__":
+    configure_logging()
     print("🔄 Redis Cluster 비동기 테스트 시작...")
     asyncio.run(main())
     print("✅ Redis Cluster 비동기 테스트 완료.")
\ No newline at end of file
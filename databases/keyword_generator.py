@@ -1,8 +1,164 @@
-from pathlib import Path
-from typing import TypedDict
-from dataclasses import dataclass
+from typing import Iterable, Iterator, TypedDict
+from dataclasses import dataclass, field
 import itertools
-import yaml
+import string
+
+from configs.settings import (
+    KEYWORD_YAML_PATH,
+    get_keyword_config,
+    read_yaml,
+    registry,
+)
+from utils.helpers import iter_unique
+
+
+def template_fields(template: str) -> tuple[int, ...]:
+    """
+    템플릿이 실제로 사용하는 위치 인자 번호
+        - ex) "{}와 관련된 최신 트렌드는?" -> (0,)
+    """
+    used: set[int] = set()
+    auto = 0
+    for _, name, _, _ in string.Formatter().parse(template):
+        if name is None:
+            continue
+        head = name.split(".")[0].split("[")[0]
+        if head == "":
+            used.add(auto)
+            auto += 1
+        else:
+            used.add(int(head))
+    return tuple(sorted(used))
+
+
+def canonicalize_keyword(keyword: str, synonyms: dict[str, str] | None = None) -> str:
+    """
+    키워드 정규화 (공백 정리 + 대소문자 통일 + 동의어 치환)
+        - ex) " Ai  트렌드 " -> "ai 트렌드"
+    Args:
+        keyword (str): 원본 키워드
+        synonyms (dict[str, str] | None): 정규화된 표기 -> 대표 표기
+    Returns:
+        str: 대표 키워드
+    """
+    normalized = " ".join(str(keyword).split()).casefold()
+    if synonyms:
+        return synonyms.get(normalized, normalized)
+    return normalized
+
+
+def normalize_synonyms(synonyms: dict[str, str] | None) -> dict[str, str]:
+    """동의어 표의 키/값을 같은 규칙으로 정규화"""
+    return {
+        canonicalize_keyword(variant): canonicalize_keyword(canonical)
+        for variant, canonical in (synonyms or {}).items()
+    }
+
+
+def canonical_keywords(
+    keywords: Iterable[str], synonyms: dict[str, str] | None = None
+) -> list[str]:
+    """
+    정규화 후 중복을 제거한 키워드 목록 (처음 나온 순서 유지, 빈 키워드 제외)
+    """
+    return list(
+        dict.fromkeys(
+            keyword
+            for keyword in (canonicalize_keyword(k, synonyms) for k in keywords)
+            if keyword
+        )
+    )
+
+
+def iter_canonical_pairs(
+    left: Iterable[str],
+    right: Iterable[str] | None = None,
+    synonyms: dict[str, str] | None = None,
+) -> Iterator[tuple[str, str]]:
+    """
+    정규화된 키워드 조합 반복자 (자기 자신과의 조합, 순서만 다른 조합 제외)
+
+    right 가 None 이면 left 안의 조합(combinations)만 만든다.
+    두 목록에 같은 키워드가 있으면 (a, b) 와 (b, a) 중 product 순서상 먼저 나오는 것만 남긴다.
+    Args:
+        left (Iterable[str]): 앞 키워드
+        right (Iterable[str] | None): 뒤 키워드
+        synonyms (dict[str, str] | None): 동의어 표 (normalize_synonyms 결과)
+    Returns:
+        Iterator[tuple[str, str]]: 조합 반복자
+    """
+    left_keys = canonical_keywords(left, synonyms)
+    if right is None:
+        return itertools.combinations(left_keys, 2)
+
+    right_keys = canonical_keywords(right, synonyms)
+    left_index = {keyword: i for i, keyword in enumerate(left_keys)}
+    right_index = {keyword: j for j, keyword in enumerate(right_keys)}
+
+    def pairs() -> Iterator[tuple[str, str]]:
+        for i, a in enumerate(left_keys):
+            for j, b in enumerate(right_keys):
+                if a == b:
+                    continue
+                # (b, a) 도 만들어지는 조합이면 먼저 나온 쪽만 유지
+                if a in right_index and b in left_index:
+                    if (left_index[b], right_index[a]) < (i, j):
+                        continue
+                yield a, b
+
+    return pairs()
+
+
+@dataclass(frozen=True)
+class CanonicalizationReport:
+    """
+    정규화로 줄어든 키워드/조회 수
+    """
+
+    keywords_before: int
+    keywords_after: int
+    queries_before: int
+    queries_after: int
+
+    @property
+    def eliminated(self) -> int:
+        return self.queries_before - self.queries_after
+
+    @property
+    def eliminated_ratio(self) -> float:
+        return self.eliminated / self.queries_before if self.queries_before else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"키워드 {self.keywords_before} -> {self.keywords_after}, "
+            f"조회 {self.queries_before} -> {self.queries_after} "
+            f"({self.eliminated}건, {self.eliminated_ratio:.1%} 제거)"
+        )
+
+
+def canonicalization_report(
+    left: list[str],
+    right: list[str] | None = None,
+    synonyms: dict[str, str] | None = None,
+) -> CanonicalizationReport:
+    """
+    원본 product 조합 대비 정규화 조합 수 비교
+    Args:
+        left (list[str]): 앞 키워드
+        right (list[str] | None): 뒤 키워드 (None 이면 left x left)
+        synonyms (dict[str, str] | None): 동의어 표
+    Returns:
+        CanonicalizationReport: 제거 통계
+    """
+    right_raw = left if right is None else right
+    raw_keywords = set(left) | set(right_raw)
+    canonical = set(canonical_keywords(raw_keywords, synonyms))
+    return CanonicalizationReport(
+        keywords_before=len(raw_keywords),
+        keywords_after=len(canonical),
+        queries_before=len(left) * len(right_raw),
+        queries_after=sum(1 for _ in iter_canonical_pairs(left, right, synonyms)),
+    )
 
 
 @dataclass(frozen=True)
@@ -15,44 +171,101 @@ class BaseCountry:
     core_keywords: list[str]
     context_keywords: list[str]
     templates: list[str]
+    synonyms: dict[str, str] = field(default_factory=dict)
+
+    def iter_search_queries(self) -> Iterator[tuple[str, str]]:
+        """
+        키워드 조합을 하나씩 생성 (정규화된 키워드 기준, 중복/자기 조합 없음)
+        """
+        return iter_canonical_pairs(
+            self.core_keywords, self.context_keywords, self.synonyms
+        )
+
+    def canonicalization_report(self) -> CanonicalizationReport:
+        """
+        정규화로 제거된 조회 수
+        """
+        return canonicalization_report(
+            self.core_keywords, self.context_keywords, self.synonyms
+        )
+
+    def iter_question_templates(
+        self, queries: Iterable[tuple[str, str]] | None = None, exact: bool = False
+    ) -> Iterator[str]:
+        """
+        질문 템플릿을 적용한 질문을 하나씩 생성 (스트리밍 중복 제거)
+
+        템플릿이 쓰지 않는 자리(예: "{}와 관련된 ~" 의 context)는 중복만 만들므로
+        사용하는 자리의 고유 조합만 순회한다. 별도 기억 공간 없이 중복이 제거된다.
+        Args:
+            queries: 키워드 조합 (None이면 iter_search_queries)
+            exact: 서로 다른 템플릿이 같은 문장을 만드는 경우까지 제거 (고유 항목 수만큼 메모리 사용)
+        """
+        # 템플릿마다 조합을 다시 순회하므로 외부 조합만 리스트로 고정
+        fixed = None if queries is None else list(queries)
+
+        def questions() -> Iterator[str]:
+            for template in dict.fromkeys(self.templates):
+                fields = template_fields(template)
+                pairs = self.iter_search_queries() if fixed is None else fixed
+                if fields != (0, 1):
+                    representatives: dict[tuple[str, ...], tuple[str, str]] = {}
+                    for pair in pairs:
+                        representatives.setdefault(
+                            tuple(pair[i] for i in fields), pair
+                        )
+                    pairs = representatives.values()
+                yield from (template.format(*pair) for pair in pairs)
+
+        return iter_unique(questions()) if exact else questions()
 
     def generate_search_queries(self) -> list[tuple[str, str]]:
         """
         키워드 조합 생성
         """
-        return list(itertools.product(self.core_keywords, self.context_keywords))
+        return list(self.iter_search_queries())
 
     def apply_question_templates(self, queries: list[tuple[str, str]]) -> set[str]:
         """
         질문 템플릿 적용
         """
-        questions = []
-        for template in self.templates:
-            questions.extend(
-                [template.format(core, context) for core, context in queries]
-            )
-        return set(questions)
+        return set(self.iter_question_templates(queries))
+
+
+def load_synonyms() -> dict[str, str]:
+    """
+    keyword.yaml 의 공통 동의어 표 (정규화된 표기 -> 대표 표기)
+    """
+    return normalize_synonyms(get_keyword_config().get("synonyms"))
 
 
 def load_countries_from_yaml() -> dict[str, BaseCountry]:
     """
     YAML 파일에서 국가별 데이터를 로드하고 BaseCountry 객체 생성
-    Args:
-        yaml_path (str): YAML 파일 경로
+    (설정 레지스트리에 캐시되며, keyword.yaml 이 수정되면 다시 읽음)
     Returns:
         Dict[str, BaseCountry]: 국가 이름을 키로 하는 BaseCountry 객체 딕셔너리
     """
-    keyword_yaml_path = Path(__file__).parent.parent / "configs/cy/keyword.yaml"
-    with open(keyword_yaml_path, "r", encoding="utf-8") as file:
-        data: dict = yaml.safe_load(file)
+    return dict(registry.get("countries"))
+
 
+def _countries_from(data: dict) -> dict[str, BaseCountry]:
+    synonyms = data.get("synonyms") or {}
     countries: dict[str, BaseCountry] = {
         country_code: BaseCountry(
             name=country_code,
             core_keywords=country_data["core_keywords"],
             context_keywords=country_data["context_keywords"],
             templates=country_data["templates"],
+            synonyms=normalize_synonyms(
+                {**synonyms, **(country_data.get("synonyms") or {})}
+            ),
         )
         for country_code, country_data in data["countries"].items()
     }
     return countries
+
+
+registry.register(
+    "countries", lambda: _countries_from(read_yaml(KEYWORD_YAML_PATH)), KEYWORD_YAML_PATH
+)
@@ -0,0 +1,403 @@
+"""MongoDB 없이 단일 노드에서 쓰는 추가 전용(append-only) 기사 저장소
+
+디렉터리 구성
+    - 00000001.seg, 00000002.seg, ~ : 세그먼트 (segment_bytes 를 넘으면 다음 파일로 교체)
+        프레임 = [길이 u32][crc32 u32][payload] , payload 는 ValueCodec (msgpack + zstd)
+    - index.bin : mmap 해시 테이블 (canonical URL 해시 -> 세그먼트/오프셋, 선형 탐사)
+
+쓰기는 sync_every 건 또는 sync_interval 초마다 모아서 fsync 한다 (그 시점까지는 충돌 후에도 보존).
+정상 종료되지 않은 저장소를 다시 열면 마지막 세그먼트의 잘린 꼬리를 잘라내고
+세그먼트를 처음부터 읽어 인덱스를 다시 만든다 (인덱스는 세그먼트에서 파생된 값).
+"""
+
+from __future__ import annotations
+
+import os
+import mmap
+import time
+import zlib
+import struct
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass, fields
+from typing import Any, Iterable, Iterator
+
+from common.url_utils import canonical_url
+from configs.settings import get_crawler_settings
+from databases.cache.codec import ValueCodec
+
+
+logger = logging.getLogger("segment_store")
+
+FRAME = struct.Struct("<II")  # payload 길이, crc32
+HEADER = struct.Struct("<4sIQQI")  # magic, version, capacity, count, 정상 종료 여부
+HEADER_SIZE = 64
+SLOT = struct.Struct("<QIQ")  # 키 해시 (0 = 빈 칸), 세그먼트 번호, 오프셋
+MAGIC = b"SIDX"
+VERSION = 1
+MAX_LOAD = 0.7
+
+
+def key_hash(url: str) -> int:
+    """canonical URL 의 64bit 해시 (0 은 빈 칸 표시라 쓰지 않음)"""
+    digest = hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def record_key(record: dict) -> int | None:
+    """레코드 URL 의 키 해시 (URL 이 없거나 canonical 형태로 만들 수 없으면 None)"""
+    try:
+        return key_hash(record["url"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass
+class SegmentStoreConfig:
+    """
+    저장소 설정 (crawler_settings.yaml 의 segment_store)
+    Args:
+        enabled (bool): main 크롤링에서 MongoDB 대신 사용할지 여부
+        root (str): 저장 디렉터리
+        segment_bytes (int): 세그먼트 교체 크기
+        sync_every (int): 이 건수마다 fsync
+        sync_interval (float): 마지막 fsync 후 이 시간(초)이 지나면 다음 쓰기에서 fsync
+        initial_capacity (int): 인덱스 초기 칸 수 (2의 거듭제곱, 가득 차면 2배로)
+        min_compress_size (int): 이 크기(byte) 이상인 레코드만 zstd 압축
+    """
+
+    enabled: bool = False
+    root: str = "data/segments"
+    segment_bytes: int = 64 * 1024 * 1024
+    sync_every: int = 1000
+    sync_interval: float = 1.0
+    initial_capacity: int = 1 << 16
+    min_compress_size: int = 256
+
+    @classmethod
+    def from_settings(cls) -> SegmentStoreConfig:
+        data: dict = get_crawler_settings().get("segment_store") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+class HashIndex:
+    """
+    mmap 파일 위의 고정 크기 해시 테이블 (선형 탐사, 삭제 없음)
+    Args:
+        path (Path): 인덱스 파일
+        capacity (int): 새로 만들 때의 칸 수 (2의 거듭제곱)
+    """
+
+    def __init__(self, path: Path, capacity: int) -> None:
+        self.path = path
+        if not path.exists() or path.stat().st_size < HEADER_SIZE:
+            self._create(path, capacity)
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, version, self.capacity, self.count, self.clean = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"❌ 인덱스 형식이 아닙니다: {self.path}")
+
+    @staticmethod
+    def _create(path: Path, capacity: int, items: Iterable[tuple[int, int, int]] = ()) -> None:
+        """빈 인덱스 (또는 items 를 담은 인덱스) 를 임시 파일에 만든 뒤 교체"""
+        temp = path.with_name(f"_{path.name}")
+        with open(temp, "w+b") as file:
+            file.truncate(HEADER_SIZE + capacity * SLOT.size)
+            table = mmap.mmap(file.fileno(), 0)
+            count = 0
+            for key, segment, offset in items:
+                position = key & (capacity - 1)
+                while SLOT.unpack_from(table, HEADER_SIZE + position * SLOT.size)[0]:
+                    position = (position + 1) & (capacity - 1)
+                SLOT.pack_into(table, HEADER_SIZE + position * SLOT.size, key, segment, offset)
+                count += 1
+            HEADER.pack_into(table, 0, MAGIC, VERSION, capacity, count, 1)
+            table.flush()
+            table.close()
+        os.replace(temp, path)
+
+    def _positions(self, key: int) -> Iterator[int]:
+        start = key & (self.capacity - 1)
+        for i in range(self.capacity):
+            yield HEADER_SIZE + ((start + i) & (self.capacity - 1)) * SLOT.size
+
+    def get(self, key: int) -> tuple[int, int] | None:
+        """
+        Args:
+            key (int): 키 해시
+        Returns:
+            tuple[int, int] | None: (세그먼트 번호, 오프셋)
+        """
+        for position in self._positions(key):
+            stored, segment, offset = SLOT.unpack_from(self._map, position)
+            if stored == key:
+                return segment, offset
+            if stored == 0:
+                return None
+        return None
+
+    def put(self, key: int, segment: int, offset: int) -> None:
+        """키 위치 기록 (같은 키는 최신 위치로 덮어씀)"""
+        if self.count + 1 > self.capacity * MAX_LOAD:
+            self._grow()
+        for position in self._positions(key):
+            stored = SLOT.unpack_from(self._map, position)[0]
+            if stored in (0, key):
+                SLOT.pack_into(self._map, position, key, segment, offset)
+                self.count += stored == 0
+                return
+
+    def items(self) -> Iterator[tuple[int, int, int]]:
+        for index in range(self.capacity):
+            slot = SLOT.unpack_from(self._map, HEADER_SIZE + index * SLOT.size)
+            if slot[0]:
+                yield slot
+
+    def _grow(self) -> None:
+        """2배 크기 인덱스로 교체"""
+        items = list(self.items())
+        self.close(clean=False)
+        self._create(self.path, self.capacity * 2, items)
+        self._open()
+        self.mark(clean=False)
+
+    def mark(self, clean: bool) -> None:
+        """헤더 갱신 후 디스크 반영 (clean=False 면 다음에 열 때 인덱스를 다시 만듦)"""
+        self.clean = int(clean)
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, self.capacity, self.count, self.clean)
+        self._map.flush()
+
+    def close(self, clean: bool = True) -> None:
+        self.mark(clean)
+        self._map.close()
+        self._file.close()
+
+
+class SegmentStore:
+    """
+    NewsDataFormat 레코드 (+ 선택적 원문) 추가 전용 저장소
+        >>> with SegmentStore() as store:
+        ...     store.put(record, body=html)
+        ...     store.get(record["url"])
+        ...     for record in store.replay("2025-01-01"): ...
+    Args:
+        config (SegmentStoreConfig | None): 저장소 설정 (None이면 crawler_settings.yaml)
+    """
+
+    def __init__(self, config: SegmentStoreConfig | None = None) -> None:
+        self.config = config or SegmentStoreConfig.from_settings()
+        self.root = Path(self.config.root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.codec = ValueCodec(min_compress_size=self.config.min_compress_size)
+        self._readers: dict[int, Any] = {}
+        self._pending = 0
+        self._synced_at = time.monotonic()
+        self.skipped = 0
+        # 쓰기(put/sync/close)는 이벤트 루프 밖 스레드에서도 실행되므로 lock 으로 직렬화
+        self._lock = threading.RLock()
+
+        self._recover()
+        self.segment = max(self.segments(), default=1)
+        self._active = open(self._segment_path(self.segment), "ab")
+        self.index.mark(clean=False)
+
+    def __enter__(self) -> SegmentStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> SegmentStore:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.index.count
+
+    def _segment_path(self, number: int) -> Path:
+        return self.root / f"{number:08d}.seg"
+
+    def segments(self) -> list[int]:
+        """세그먼트 번호 (오래된 순)"""
+        return sorted(int(path.stem) for path in self.root.glob("*.seg"))
+
+    def _recover(self) -> None:
+        """정상 종료되지 않았으면 잘린 꼬리를 잘라내고 인덱스를 처음부터 다시 만듦"""
+        path = self.root / "index.bin"
+        segments = self.segments()
+        missing = not path.exists()
+        self.index = HashIndex(path, self.config.initial_capacity)
+        if not segments or (self.index.clean and not missing):
+            return
+
+        last = segments[-1]
+        end = 0
+        for _, end, _ in self._scan(last):
+            pass
+        size = self._segment_path(last).stat().st_size
+        if end < size:
+            with open(self._segment_path(last), "r+b") as file:
+                file.truncate(end)
+            logger.warning(f"⚠️ 세그먼트 {last} 끝의 불완전한 기록 {size - end}byte 제거")
+
+        self.index.close(clean=False)
+        path.unlink()
+        self.index = HashIndex(path, self.config.initial_capacity)
+        for number in segments:
+            for offset, _, record in self._scan(number):
+                # 검증 전 버전이 남긴 URL 이 잘못된 프레임은 인덱스에 넣지 않음
+                key = record_key(record)
+                if key is not None:
+                    self.index.put(key, number, offset)
+        logger.info(f"✅ 인덱스 재생성 ({self.index.count}건)")
+
+    def _scan(self, number: int, offset: int = 0) -> Iterator[tuple[int, int, dict]]:
+        """세그먼트를 순서대로 읽음 (프레임 오프셋, 다음 오프셋, 레코드), 손상된 프레임에서 멈춤"""
+        with open(self._segment_path(number), "rb") as file:
+            file.seek(offset)
+            while header := file.read(FRAME.size):
+                if len(header) < FRAME.size:
+                    return
+                length, crc = FRAME.unpack(header)
+                payload = file.read(length)
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    return
+                yield offset, offset + FRAME.size + length, self.codec.decode(payload)
+                offset += FRAME.size + length
+
+    def put(self, record: dict, body: str | bytes | None = None) -> bool:
+        """
+        레코드 추가 (같은 URL 은 최신 기록이 조회됨)
+        Args:
+            record (dict): NewsDataFormat 레코드 (url 필수)
+            body (str | bytes | None): 원문 (HTML 등)
+        Returns:
+            bool: 저장 여부 (URL 이 잘못된 레코드는 아무것도 쓰지 않고 건너뜀)
+        """
+        key = record_key(record)
+        if key is None:
+            logger.warning(f"⚠️ URL 이 잘못된 레코드는 저장하지 않습니다: {record.get('url')!r}")
+            self.skipped += 1
+            return False
+        value = {**record, "body": body} if body is not None else record
+        payload = self.codec.encode(value)
+        with self._lock:
+            size = self._active.tell()
+            if size and size + FRAME.size + len(payload) > self.config.segment_bytes:
+                self._rotate()
+            offset = self._active.tell()
+            self._active.write(FRAME.pack(len(payload), zlib.crc32(payload)))
+            self._active.write(payload)
+            self.index.put(key, self.segment, offset)
+            self._pending += 1
+            if (
+                self._pending >= self.config.sync_every
+                or time.monotonic() - self._synced_at >= self.config.sync_interval
+            ):
+                self.sync()
+        return True
+
+    def _put_batch(self, records: list[dict]) -> None:
+        with self._lock:
+            for record in records:
+                self.put(record)
+
+    async def put_many(self, records: Iterable[dict]) -> None:
+        """
+        크롤링 싱크 인터페이스 (MongoSink 와 같은 형태, url 없는 레코드는 건너뜀)
+        파일 쓰기와 주기적 fsync 는 스레드에서 실행 (이벤트 루프를 막지 않음)
+        """
+        records = [record for record in records if record and record.get("url")]
+        if records:
+            await asyncio.to_thread(self._put_batch, records)
+
+    def sync(self) -> None:
+        """세그먼트 fsync (이 시점까지의 기록은 충돌 후에도 보존)"""
+        with self._lock:
+            self._active.flush()
+            os.fsync(self._active.fileno())
+            self._pending = 0
+            self._synced_at = time.monotonic()
+
+    def _rotate(self) -> None:
+        """현재 세그먼트를 닫고 다음 세그먼트로"""
+        self.sync()
+        self._active.close()
+        self.segment += 1
+        self._active = open(self._segment_path(self.segment), "ab")
+
+    def _read_at(self, number: int, offset: int) -> dict | None:
+        if number == self.segment:
+            self._active.flush()
+        if number not in self._readers:
+            self._readers[number] = open(self._segment_path(number), "rb")
+        fd = self._readers[number].fileno()
+        length, crc = FRAME.unpack(os.pread(fd, FRAME.size, offset))
+        payload = os.pread(fd, length, offset + FRAME.size)
+        if zlib.crc32(payload) != crc:
+            return None
+        return self.codec.decode(payload)
+
+    def get(self, url: str, with_body: bool = False) -> dict | None:
+        """
+        URL 로 최신 레코드 조회 (인덱스 1회 + pread 2회)
+        Args:
+            url (str): 기사 URL (canonical 형태가 아니어도 됨)
+            with_body (bool): 원문 포함 여부
+        Returns:
+            dict | None: 레코드 (없으면 None)
+        """
+        with self._lock:
+            location = self.index.get(key_hash(url))
+            if location is None:
+                return None
+            record = self._read_at(*location)
+        # 64bit 해시 충돌 대비
+        if record is None or canonical_url(record["url"]) != canonical_url(url):
+            return None
+        if not with_body:
+            record.pop("body", None)
+        return record
+
+    def replay(
+        self, day: str | None = None, latest_only: bool = True, with_body: bool = False
+    ) -> Iterator[dict]:
+        """
+        세그먼트를 처음부터 순서대로 읽기 (재채점 등)
+        Args:
+            day (str | None): 이 수집일(timestamp)의 레코드만 (None이면 전체)
+            latest_only (bool): 같은 URL 의 이전 기록은 건너뜀
+            with_body (bool): 원문 포함 여부
+        Yields:
+            dict: 레코드
+        """
+        self._active.flush()
+        for number in self.segments():
+            for offset, _, record in self._scan(number):
+                if day is not None and record.get("timestamp") != day:
+                    continue
+                key = record_key(record)
+                if key is None:
+                    continue
+                if latest_only and self.index.get(key) != (number, offset):
+                    continue
+                if not with_body:
+                    record.pop("body", None)
+                yield record
+
+    def close(self) -> None:
+        with self._lock:
+            self.sync()
+            self._active.close()
+            for reader in self._readers.values():
+                reader.close()
+            self.index.close()
@@ -1,38 +1,81 @@
+import time
 import asyncio
-from databases.cache.redis_cluster_manager import RedisClusterManager
-from typing import Callable
+from databases.cache.async_redis_cluster_manager import AsyncRedisClusterManager
+from databases.cache.redis_cluster_manager import RedisClusterManager, configure_logging
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Callable
 
-from crawlers.api_ndg import (
-    AsyncDaumNewsParsingDriver,
-    # AsyncGoogleNewsParsingDriver,
-    AsyncNaverNewsParsingDriver
-)
+from pipelines.mongo_sink import MongoSink
+from databases.segment_store import SegmentStore, SegmentStoreConfig
+from pipelines.stream_sink import StreamSink
+from common.browser_pool import get_browser_pool
+from crawlers.api_ndg import AsyncNaverNewsParsingDriver
+from crawlers.strategy import AdaptiveDaumDriver, AdaptiveGoogleDriver, get_strategy_book
+from configs.settings import get_crawler_settings
+
+if TYPE_CHECKING:
+    from pipelines.parquet_export import ParquetExporter
 
 def redis_data_array() -> list[str]:
     manager = RedisClusterManager()
-    data: list[list[str]] = manager.fetch_data("node7002:mixin_combination")
-    return [" ".join(pair) for pair in data]
+    return [
+        " ".join(pair)
+        for page in manager.iter_sharded("mixin_combination")
+        for pair in page
+    ]
 
 # # 크롤링 및 데이터 출력 함수 정의
-async def crawl_and_insert(target: str, count: int, driver_class: Callable) -> None:
+async def crawl_and_insert(target: str, count: int, driver_class: Callable) -> list[dict]:
     driver = driver_class(target, count)
     data = await driver.news_collector()
-    return data
+    # 하위 소비자가 출처별 스트림/지연을 알 수 있도록 표시
+    fetched_at = time.time()
+    return [{**item, "source": driver.home, "fetched_at": fetched_at} for item in data or []]
 
 # fmt: off
-async def crawling_data_insert_db(target: str, count: int) -> None:
+async def crawling_data_insert_db(
+    target: str, count: int, sinks: list["MongoSink | SegmentStore | StreamSink | ParquetExporter"]
+) -> None:
     tasks: list[list[dict[str, str]]] = [
         # API 기반 크롤러 태스크
         crawl_and_insert(target, count, AsyncNaverNewsParsingDriver),
-        crawl_and_insert(target, count, AsyncDaumNewsParsingDriver),
+        # 다음/구글은 API → HTML → 브라우저 중 싼 방법부터 (브라우저는 풀이 켜져 있을 때만)
+        crawl_and_insert(target, count, AdaptiveDaumDriver),
+        crawl_and_insert(target, count, AdaptiveGoogleDriver),
     ]
-    return await asyncio.gather(*tasks)
+    for data in await asyncio.gather(*tasks):
+        for sink in sinks:
+            await sink.put_many(data)
 
     
 async def crawling_keyword() -> None:
-    """레디스에서 가지고온 값"""
-    tasks = [crawling_data_insert_db(target, 1) for target in redis_data_array()]
-    return await asyncio.gather(*tasks)
+    """레디스에서 가지고온 값 (파티션 페이지가 도착하는 대로 크롤링 시작, 결과는 MongoDB + Redis Stream + Parquet 으로)"""
+    tasks: list[asyncio.Task] = []
+    # 단일 노드 실행은 MongoDB 대신 로컬 세그먼트 저장소 (crawler_settings.yaml segment_store.enabled)
+    store_config = SegmentStoreConfig.from_settings()
+    store = SegmentStore(store_config) if store_config.enabled else MongoSink.from_settings()
+    if get_browser_pool().config.enabled:
+        await asyncio.to_thread(get_browser_pool().warm)
+    async with AsyncExitStack() as stack:
+        sink = await stack.enter_async_context(store)
+        manager = await stack.enter_async_context(AsyncRedisClusterManager())
+        stream = StreamSink(manager)
+        sinks = [sink, stream]
+        # pyarrow 는 Parquet 내보내기를 켰을 때만 필요 (crawler_settings.yaml parquet_export.enabled)
+        if (get_crawler_settings().get("parquet_export") or {}).get("enabled", True):
+            from pipelines.parquet_export import ParquetExporter
+
+            sinks.append(await stack.enter_async_context(ParquetExporter()))
+        async for page in manager.iter_sharded("mixin_combination"):
+            tasks.extend(
+                asyncio.create_task(crawling_data_insert_db(" ".join(pair), 1, sinks))
+                for pair in page
+            )
+        await asyncio.gather(*tasks)
+    print(sink.stats if hasattr(sink, "stats") else len(sink))
+    print(stream.published, stream.latency.summary())
+    print({site: get_strategy_book(site).summary() for site in ("daum", "google")})
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(crawling_keyword())
\ No newline at end of file
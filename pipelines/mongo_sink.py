@@ -0,0 +1,229 @@
+"""크롤링 결과를 MongoDB 에 묶음 단위로 저장하는 비동기 싱크"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure
+
+from common.url_utils import canonical_url
+from configs.settings import get_api_settings, get_crawler_settings
+from utils.retry_handler import async_retry
+
+
+logger = logging.getLogger("mongo_sink")
+
+DUPLICATE_KEY = 11000
+
+# 재시도할 일시적 오류 (AutoReconnect, NetworkTimeout, ServerSelectionTimeoutError 포함)
+TRANSIENT_ERRORS = (ConnectionFailure,)
+
+
+@dataclass
+class MongoSinkConfig:
+    """
+    싱크 설정 (crawler_settings.yaml 의 mongo_sink)
+    Args:
+        database (str): DB 이름
+        collection (str): 컬렉션 이름
+        mode (str): "upsert"(canonical_url 기준 갱신) 또는 "insert"(중복은 건너뜀)
+        batch_size (int): 이만큼 모이면 바로 저장
+        flush_interval (float): 첫 레코드가 들어온 뒤 이 시간(초)이 지나면 저장
+        max_queue (int): 대기 레코드 상한 (가득 차면 put 이 기다림)
+        retry_attempts (int): 일시적 오류 재시도 횟수 (최초 포함)
+    """
+
+    database: str = "crawling"
+    collection: str = "news"
+    mode: str = "upsert"
+    batch_size: int = 500
+    flush_interval: float = 2.0
+    max_queue: int = 5000
+    retry_attempts: int = 5
+
+    @classmethod
+    def from_settings(cls) -> MongoSinkConfig:
+        data: dict = get_crawler_settings().get("mongo_sink") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass
+class SinkStats:
+    received: int = 0
+    inserted: int = 0
+    upserted: int = 0
+    updated: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    flushes: int = 0
+    flush_ms: float = 0.0
+
+
+@dataclass
+class MongoSink:
+    """
+    레코드를 버퍼링했다가 크기/시간 기준으로 묶어 저장
+        - 큐가 가득 차면 put 이 기다리므로 크롤링 속도가 저장 속도를 넘지 않음
+        - 일시적 오류는 지수 백오프로 재시도, 끝내 실패한 묶음은 기록만 하고 다음으로 진행
+        >>> async with MongoSink(collection) as sink:
+        ...     await sink.put_many(records)
+    Args:
+        collection (Any): motor AsyncIOMotorCollection (또는 같은 메서드를 가진 객체)
+        config (MongoSinkConfig): 싱크 설정
+    """
+
+    collection: Any
+    config: MongoSinkConfig = field(default_factory=MongoSinkConfig)
+    stats: SinkStats = field(default_factory=SinkStats)
+
+    def __post_init__(self) -> None:
+        self._queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize=self.config.max_queue)
+        self._flusher: asyncio.Task | None = None
+        self._write = async_retry(attempts=self.config.retry_attempts, exceptions=TRANSIENT_ERRORS)(
+            self._write_once
+        )
+
+    @classmethod
+    def from_settings(cls, config: MongoSinkConfig | None = None) -> MongoSink:
+        """url.conf 의 mongo uri + crawler_settings.yaml 설정으로 생성"""
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        config = config or MongoSinkConfig.from_settings()
+        client = AsyncIOMotorClient(get_api_settings().mongo.uri)
+        return cls(client[config.database][config.collection], config)
+
+    async def __aenter__(self) -> MongoSink:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """인덱스 생성 후 저장 태스크 시작"""
+        await self.collection.create_indexes(
+            [
+                IndexModel([("canonical_url", ASCENDING)], unique=True),
+                IndexModel([("timestamp", DESCENDING)]),
+            ]
+        )
+        self._flusher = asyncio.create_task(self._run())
+
+    async def put(self, record: dict) -> None:
+        """레코드 1건 추가 (큐가 가득 차면 자리가 날 때까지 대기)"""
+        if not record or not record.get("url"):
+            return
+        self.stats.received += 1
+        await self._queue.put(record)
+
+    async def put_many(self, records: Iterable[dict]) -> None:
+        for record in records:
+            await self.put(record)
+
+    async def close(self) -> None:
+        """남은 레코드를 모두 저장하고 종료"""
+        if self._flusher is None:
+            return
+        await self._queue.put(None)
+        await self._flusher
+        self._flusher = None
+
+    async def _run(self) -> None:
+        """큐에서 묶음을 만들어 저장 (batch_size 도달 또는 flush_interval 경과)"""
+        closing = False
+        while not closing:
+            first = await self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.config.flush_interval
+            while len(batch) < self.config.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is None:
+                    closing = True
+                    break
+                batch.append(record)
+            try:
+                await self.flush(batch)
+            except Exception as e:
+                # 저장 태스크가 죽으면 큐가 가득 찬 뒤 put 이 영원히 기다리므로 계속 진행
+                self.stats.failed += len(batch)
+                logger.exception(f"❌ 묶음 저장 중 예외 ({len(batch)}건): {e}")
+
+    async def flush(self, records: list[dict]) -> None:
+        """
+        레코드 묶음 저장
+        Args:
+            records (list[dict]): 저장할 레코드
+        """
+        documents = self._documents(records)
+        started = time.perf_counter()
+        try:
+            await self._write(documents)
+        except Exception as e:
+            self.stats.failed += len(documents)
+            logger.error(f"❌ MongoDB 저장 실패 ({len(documents)}건): {e}")
+        self.stats.flushes += 1
+        self.stats.flush_ms += (time.perf_counter() - started) * 1000
+
+    def _documents(self, records: list[dict]) -> list[dict]:
+        """canonical_url 추가 및 묶음 내 중복 제거 (나중 레코드 우선, URL 이 잘못된 레코드는 실패로 집계)"""
+        documents: dict[str, dict] = {}
+        for record in records:
+            try:
+                key = canonical_url(record["url"])
+            except ValueError as e:
+                self.stats.failed += 1
+                logger.warning(f"⚠️ URL 이 잘못된 레코드 건너뜀 {record['url']!r}: {e}")
+                continue
+            documents[key] = {**record, "canonical_url": key}
+        return list(documents.values())
+
+    async def _write_once(self, documents: list[dict]) -> None:
+        if self.config.mode == "insert":
+            await self._insert(documents)
+        else:
+            await self._upsert(documents)
+
+    async def _insert(self, documents: list[dict]) -> None:
+        """unordered insert_many, 이미 있는 URL(중복 키)은 건너뜀"""
+        try:
+            result = await self.collection.insert_many(
+                [dict(document) for document in documents], ordered=False
+            )
+            self.stats.inserted += len(result.inserted_ids)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            duplicates = sum(1 for error in errors if error.get("code") == DUPLICATE_KEY)
+            self.stats.inserted += e.details.get("nInserted", 0)
+            self.stats.duplicates += duplicates
+            self.stats.failed += len(errors) - duplicates
+
+    async def _upsert(self, documents: list[dict]) -> None:
+        """canonical_url 기준 unordered upsert (처음 본 시각은 유지)"""
+        now = datetime.now(timezone.utc)
+        result = await self.collection.bulk_write(
+            [
+                UpdateOne(
+                    {"canonical_url": document["canonical_url"]},
+                    {"$set": document, "$setOnInsert": {"first_seen": now}},
+                    upsert=True,
+                )
+                for document in documents
+            ],
+            ordered=False,
+        )
+        self.stats.upserted += result.upserted_count
+        self.stats.updated += result.modified_count
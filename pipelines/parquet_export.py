@@ -0,0 +1,280 @@
+"""크롤링 결과를 수집일/출처별 Parquet 파일로 내보내기 (분석용)
+
+저장 위치: {root}/crawl_date=YYYY-MM-DD/source=naver/part-*.parquet (hive 파티션)
+    - 파티션별로 row_group_size 만큼 모아서 파일 하나로 기록 (큰 row group)
+    - 값 종류가 적은 열(timestamp 등)은 dictionary 인코딩
+    - compact: 파티션 안의 작은 파일들을 하나로 합침
+    - read_articles: 필요한 열/파티션만 읽음
+        >>> read_articles(columns=["title"], filters=[("source", "=", "naver")])
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+import time
+import asyncio
+import logging
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, fields
+from typing import Iterable, Sequence
+
+import pytz
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from common.url_utils import canonical_url
+from configs.settings import get_crawler_settings
+
+
+logger = logging.getLogger("parquet_export")
+
+# 파티션 열(crawl_date, source)은 경로에만 있고 파일에는 저장하지 않음
+ARTICLE_SCHEMA = pa.schema(
+    [
+        ("url", pa.string()),
+        ("canonical_url", pa.string()),
+        ("title", pa.string()),
+        ("article_time", pa.string()),
+        ("timestamp", pa.string()),
+        ("time_ago", pa.string()),
+        ("fetched_at", pa.float64()),
+    ]
+)
+
+
+@dataclass
+class ParquetExportConfig:
+    """
+    내보내기 설정 (crawler_settings.yaml 의 parquet_export)
+    Args:
+        enabled (bool): main 크롤링에서 사용할지 여부
+        root (str): 저장 디렉터리
+        row_group_size (int): 파티션별로 모아서 기록할 행 수 (= row group 크기)
+        max_buffer_rows (int): 전체 버퍼 상한 (넘으면 가장 큰 파티션부터 기록)
+        compression (str): 압축 방식
+        dictionary_columns (tuple[str, ...]): dictionary 인코딩할 열
+        compact_min_bytes (int): 이보다 작은 파일은 compact 대상
+    """
+
+    enabled: bool = True
+    root: str = "data/parquet"
+    row_group_size: int = 100_000
+    max_buffer_rows: int = 500_000
+    compression: str = "zstd"
+    dictionary_columns: tuple[str, ...] = ("timestamp", "article_time", "time_ago")
+    compact_min_bytes: int = 64 * 1024 * 1024
+
+    @classmethod
+    def from_settings(cls) -> ParquetExportConfig:
+        data: dict = get_crawler_settings().get("parquet_export") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+def partition_of(record: dict) -> tuple[str, str]:
+    """
+    레코드의 (수집일, 출처) - 수집일은 NewsDataFormat.timestamp (없으면 오늘, 서울 기준)
+    Args:
+        record (dict): 크롤링 레코드
+    Returns:
+        tuple[str, str]: (crawl_date, source)
+    """
+    crawl_date = record.get("timestamp") or datetime.now(pytz.timezone("Asia/Seoul")).strftime(
+        "%Y-%m-%d"
+    )
+    return crawl_date, record.get("source") or "unknown"
+
+
+def canonical_or_none(url: str | None) -> str | None:
+    """canonical URL (URL 이 없거나 잘못된 형식이면 None, 행은 그대로 기록)"""
+    if not url:
+        return None
+    try:
+        return canonical_url(url)
+    except ValueError as error:
+        logger.warning(f"⚠️ canonical URL 을 만들 수 없어 비워 둡니다 {url!r}: {error}")
+        return None
+
+
+def partition_dir(root: str | Path, crawl_date: str, source: str) -> Path:
+    return Path(root) / f"crawl_date={crawl_date}" / f"source={source}"
+
+
+def write_partition(
+    config: ParquetExportConfig, crawl_date: str, source: str, rows: list[dict]
+) -> Path:
+    """
+    파티션 하나의 행을 새 파일로 기록
+    Args:
+        config (ParquetExportConfig): 내보내기 설정
+        crawl_date (str): 수집일
+        source (str): 출처
+        rows (list[dict]): 기록할 행
+    Returns:
+        Path: 기록한 파일
+    """
+    table = pa.Table.from_pylist(
+        [
+            {**row, "canonical_url": canonical_or_none(row.get("url"))}
+            for row in rows
+        ],
+        schema=ARTICLE_SCHEMA,
+    )
+    directory = partition_dir(config.root, crawl_date, source)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+    _write_table(table, path, config)
+    return path
+
+
+def _write_table(table: pa.Table, path: Path, config: ParquetExportConfig) -> None:
+    """임시 파일(_ 로 시작해 데이터셋 읽기에서 제외됨)에 쓴 뒤 이름을 바꿈"""
+    temp = path.with_name(f"_{path.name}")
+    pq.write_table(
+        table,
+        temp,
+        row_group_size=config.row_group_size,
+        compression=config.compression,
+        use_dictionary=list(config.dictionary_columns),
+    )
+    os.replace(temp, path)
+
+
+class ParquetExporter:
+    """
+    레코드를 파티션별로 버퍼링했다가 row_group_size 단위로 Parquet 파일 기록
+        >>> async with ParquetExporter() as exporter:
+        ...     await exporter.put_many(records)
+    Args:
+        config (ParquetExportConfig | None): 내보내기 설정 (None이면 crawler_settings.yaml)
+    """
+
+    def __init__(self, config: ParquetExportConfig | None = None) -> None:
+        self.config = config or ParquetExportConfig.from_settings()
+        self.buffers: dict[tuple[str, str], list[dict]] = {}
+        self.buffered = 0
+        self.files: list[Path] = []
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> ParquetExporter:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def put_many(self, records: Iterable[dict]) -> None:
+        """
+        레코드 추가 (파티션 버퍼가 row_group_size 에 도달하면 기록)
+        Args:
+            records (Iterable[dict]): 크롤링 레코드
+        """
+        full: list[tuple[str, str]] = []
+        for record in records:
+            if not record:
+                continue
+            key = partition_of(record)
+            buffer = self.buffers.setdefault(key, [])
+            buffer.append(record)
+            self.buffered += 1
+            if len(buffer) == self.config.row_group_size:
+                full.append(key)
+        if self.buffered > self.config.max_buffer_rows:
+            full.append(max(self.buffers, key=lambda key: len(self.buffers[key])))
+        for key in dict.fromkeys(full):
+            await self.flush_partition(key)
+
+    async def flush_partition(self, key: tuple[str, str]) -> None:
+        """파티션 버퍼를 파일로 기록 (파일 쓰기는 스레드에서, 기록에 성공한 행만 버퍼에서 뺌)"""
+        async with self._lock:
+            rows = list(self.buffers.get(key, ()))
+            if not rows:
+                return
+            try:
+                path = await asyncio.to_thread(write_partition, self.config, *key, rows)
+            except Exception as error:
+                # 버퍼는 남겨 두고 다음 기록(close 포함)에서 다시 시도, 크롤링은 계속
+                logger.error(f"❌ {key} 파티션 기록 실패 ({len(rows)}건): {error}")
+                return
+            # 기록하는 동안 들어온 행은 남김
+            buffer = self.buffers[key]
+            del buffer[: len(rows)]
+            if not buffer:
+                del self.buffers[key]
+            self.buffered -= len(rows)
+        self.files.append(path)
+        logger.info(f"✅ {path} ← {len(rows)}건 기록")
+
+    async def close(self) -> None:
+        """남은 버퍼를 모두 기록"""
+        for key in list(self.buffers):
+            await self.flush_partition(key)
+
+
+@dataclass(frozen=True)
+class CompactionReport:
+    partitions: int
+    files_before: int
+    files_after: int
+
+
+def compact(config: ParquetExportConfig | None = None) -> CompactionReport:
+    """
+    파티션마다 compact_min_bytes 보다 작은 파일이 2개 이상이면 하나로 합침
+    Args:
+        config (ParquetExportConfig | None): 내보내기 설정 (None이면 crawler_settings.yaml)
+    Returns:
+        CompactionReport: 합친 파티션 수와 전후 파일 수
+    """
+    config = config or ParquetExportConfig.from_settings()
+    partitions = files_before = files_after = 0
+    for directory in sorted({path.parent for path in Path(config.root).rglob("*.parquet")}):
+        small = sorted(
+            path
+            for path in directory.glob("*.parquet")
+            if path.stat().st_size < config.compact_min_bytes
+        )
+        if len(small) < 2:
+            continue
+        table = pa.concat_tables([pq.ParquetFile(path).read() for path in small])
+        _write_table(
+            table, directory / f"compacted-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet", config
+        )
+        for path in small:
+            path.unlink()
+        partitions += 1
+        files_before += len(small)
+        files_after += 1
+    report = CompactionReport(partitions, files_before, files_after)
+    logger.info(f"✅ compact: {report}")
+    return report
+
+
+def read_articles(
+    root: str | Path | None = None,
+    columns: Sequence[str] | None = None,
+    filters: list[tuple] | None = None,
+) -> pd.DataFrame:
+    """
+    필요한 열/파티션만 읽기 (filters 의 crawl_date/source 조건은 디렉터리 단위로 건너뜀)
+    Args:
+        root (str | Path | None): 저장 디렉터리 (None이면 설정값)
+        columns (Sequence[str] | None): 읽을 열 (None이면 전체, 파티션 열 포함 가능)
+        filters (list[tuple] | None): ex) [("crawl_date", ">=", "2025-01-01"), ("source", "=", "naver")]
+    Returns:
+        pd.DataFrame: 기사 (source/crawl_date 는 category)
+    """
+    root = root or ParquetExportConfig.from_settings().root
+    table = pq.read_table(
+        root,
+        columns=list(columns) if columns else None,
+        filters=filters,
+        partitioning=ds.HivePartitioning.discover(infer_dictionary=True),
+    )
+    return table.to_pandas()
+
+
+if __name__ == "__main__":
+    print(compact())
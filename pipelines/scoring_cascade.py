@@ -0,0 +1,348 @@
+"""중복 제거 -> 휴리스틱 -> 벡터 관련도 -> LLM 순서의 점수 캐스케이드"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from configs.settings import CRAWLER_SETTINGS_PATH, get_crawler_settings
+from utils.helpers import SimHashIndex, content_hash, normalize_text, simhash
+from utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from utils.promt import LLMDocument, LLMEvaluationService
+from utils.relevance import IncrementalRelevanceIndex
+from utils.search_util import NewsWeightScoring
+
+SETTINGS_PATH = CRAWLER_SETTINGS_PATH
+
+
+@dataclass
+class StageConfig:
+    """단계 설정
+
+    Args:
+        enabled (bool): 단계 사용 여부
+        threshold (float): 통과 기준 점수
+        sample_rate (float): 기준 미달 문서를 다음 단계로 보내는 비율
+    """
+
+    enabled: bool = True
+    threshold: float = 0.0
+    sample_rate: float = 0.0
+
+
+@dataclass
+class CascadeConfig:
+    """캐스케이드 설정 (crawler_settings.yaml 의 scoring_cascade)"""
+
+    dedupe: StageConfig = field(default_factory=StageConfig)
+    heuristic: StageConfig = field(default_factory=StageConfig)
+    vectorizer: StageConfig = field(default_factory=lambda: StageConfig(enabled=False))
+    llm: StageConfig = field(default_factory=StageConfig)
+    similarity_distance: int = 6
+    max_concurrency: int = 8
+
+    @classmethod
+    def from_yaml(cls, path: Path | None = None) -> CascadeConfig:
+        """YAML 설정 로드 (path 가 없으면 설정 레지스트리의 캐시 사용)"""
+        if path is None:
+            settings = get_crawler_settings()
+        else:
+            with open(path, "r", encoding="utf-8") as file:
+                settings = yaml.safe_load(file) or {}
+        data: dict = settings.get("scoring_cascade") or {}
+
+        def stage(name: str, **default) -> StageConfig:
+            values = {**default, **(data.get(name) or {})}
+            return StageConfig(
+                **{k: v for k, v in values.items() if k in StageConfig.__annotations__}
+            )
+
+        return cls(
+            dedupe=stage("dedupe"),
+            heuristic=stage("heuristic"),
+            vectorizer=stage("vectorizer", enabled=False),
+            llm=stage("llm"),
+            similarity_distance=(data.get("dedupe") or {}).get(
+                "similarity_distance", 6
+            ),
+            max_concurrency=(data.get("llm") or {}).get("max_concurrency", 8),
+        )
+
+
+@dataclass
+class StageStats:
+    """단계별 통과율 및 지연 시간"""
+
+    name: str
+    received: int = 0
+    passed: int = 0
+    sampled: int = 0
+    seconds: float = 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        return (self.passed + self.sampled) / self.received if self.received else 0.0
+
+    @property
+    def latency_ms_per_doc(self) -> float:
+        return self.seconds * 1000 / self.received if self.received else 0.0
+
+
+def overall_score(result: str | None) -> float | None:
+    """LLM 평가 JSON 에서 종합 점수 추출"""
+    try:
+        value = json.loads(result)["종합 점수"]
+        return float(value[0] if isinstance(value, list) else value)
+    except (TypeError, ValueError, KeyError, IndexError):
+        return None
+
+
+class ScoringCascade:
+    """싼 단계에서 탈락한 기사는 비싼 단계(LLM)로 보내지 않는 점수 캐스케이드
+
+    입력 DataFrame 컬럼: content, published_date, timestamp, source
+    """
+
+    STAGES = ("dedupe", "heuristic", "vectorizer", "llm")
+
+    def __init__(
+        self,
+        config: CascadeConfig | None = None,
+        evaluator: LLMEvaluationService | None = None,
+        relevance_index: IncrementalRelevanceIndex | None = None,
+        matcher: KeywordMatcher | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            config (CascadeConfig | None): 설정 (None이면 crawler_settings.yaml)
+            evaluator (LLMEvaluationService | None): LLM 평가 서비스
+            relevance_index (IncrementalRelevanceIndex | None): 벡터 관련도 인덱스
+            matcher (KeywordMatcher | None): 휴리스틱 키워드 오토마톤
+            seed (int | None): 샘플링 난수 시드
+        """
+        self.config = config or CascadeConfig.from_yaml()
+        self.matcher = matcher or get_keyword_matcher()
+        self.relevance_index = relevance_index
+        if self.config.vectorizer.enabled and self.relevance_index is None:
+            self.relevance_index = IncrementalRelevanceIndex()
+        self.evaluator = evaluator
+        if self.config.llm.enabled and self.evaluator is None:
+            self.evaluator = LLMEvaluationService(
+                max_concurrency=self.config.max_concurrency
+            )
+        self.rng = np.random.default_rng(seed)
+        self.stats = {name: StageStats(name) for name in self.STAGES}
+
+    def _gate(self, name: str, scores: np.ndarray, config: StageConfig) -> np.ndarray:
+        """기준 통과 + 샘플링 마스크 계산 후 통계 기록"""
+        passed = scores >= config.threshold
+        sampled = ~passed & (self.rng.random(len(scores)) < config.sample_rate)
+        stats = self.stats[name]
+        stats.received += len(scores)
+        stats.passed += int(passed.sum())
+        stats.sampled += int(sampled.sum())
+        return passed | sampled
+
+    def deduplicate(self, contents: pd.Series) -> np.ndarray:
+        """본문 해시 및 SimHash 근접 중복 제거 마스크 (처음 나온 문서만 True)"""
+        start = time.perf_counter()
+        index = SimHashIndex(self.config.similarity_distance)
+        seen: set[str] = set()
+        keep = np.zeros(len(contents), dtype=bool)
+        for position, content in enumerate(contents):
+            digest = content_hash(normalize_text(content))
+            fingerprint = simhash(content)
+            if digest in seen or index.find(fingerprint) is not None:
+                continue
+            seen.add(digest)
+            index.add(fingerprint, position)
+            keep[position] = True
+
+        stats = self.stats["dedupe"]
+        stats.received += len(contents)
+        stats.passed += int(keep.sum())
+        stats.seconds += time.perf_counter() - start
+        return keep
+
+    def screen(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """LLM 이전 단계만 실행
+
+        Returns:
+            pd.DataFrame: heuristic_score, relevance, dropped_at, llm_candidate 컬럼 추가
+        """
+        result = frame.reset_index(drop=True).copy()
+        result["heuristic_score"] = np.nan
+        result["relevance"] = np.nan
+        result["dropped_at"] = None
+        alive = np.ones(len(result), dtype=bool)
+
+        if self.config.dedupe.enabled:
+            keep = self.deduplicate(result["content"])
+            result.loc[~keep, "dropped_at"] = "dedupe"
+            alive &= keep
+
+        if self.config.heuristic.enabled and alive.any():
+            start = time.perf_counter()
+            rows = result[alive]
+            scores = NewsWeightScoring.batch_total_weight(
+                rows["content"],
+                rows["published_date"],
+                rows["timestamp"],
+                matcher=self.matcher,
+            )
+            result.loc[alive, "heuristic_score"] = scores
+            keep = self._gate("heuristic", scores, self.config.heuristic)
+            self.stats["heuristic"].seconds += time.perf_counter() - start
+            result.loc[rows.index[~keep], "dropped_at"] = "heuristic"
+            alive[rows.index[~keep]] = False
+
+        if self.config.vectorizer.enabled and alive.any():
+            start = time.perf_counter()
+            rows = result[alive]
+            scores = self.relevance_index.score_batch(rows["content"])[
+                "relevance"
+            ].to_numpy(dtype=np.float64)
+            result.loc[alive, "relevance"] = scores
+            keep = self._gate("vectorizer", scores, self.config.vectorizer)
+            self.stats["vectorizer"].seconds += time.perf_counter() - start
+            result.loc[rows.index[~keep], "dropped_at"] = "vectorizer"
+            alive[rows.index[~keep]] = False
+
+        result["llm_candidate"] = alive
+        return result
+
+    def _llm_document(self, row: pd.Series) -> LLMDocument:
+        """상위 매칭 키워드를 시그니처 키워드로 쓰는 LLM 평가 문서"""
+        keywords = tuple(list(self.matcher.scan(row["content"]).counts)[:5])
+        return LLMDocument(
+            text=row["content"],
+            source=str(row.get("source", "")),
+            date=str(row["published_date"]),
+            signature_keywords=keywords,
+        )
+
+    async def run(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """전체 캐스케이드 실행
+
+        Returns:
+            pd.DataFrame: screen 결과 + llm_result, llm_score 컬럼
+        """
+        result = self.screen(frame)
+        result["llm_result"] = None
+        result["llm_score"] = np.nan
+        candidates = result[result["llm_candidate"]]
+        if not self.config.llm.enabled or candidates.empty:
+            return result
+
+        start = time.perf_counter()
+        evaluations = await self.evaluator.evaluate_many(
+            [self._llm_document(row) for _, row in candidates.iterrows()]
+        )
+        stats = self.stats["llm"]
+        stats.received += len(candidates)
+        stats.passed += sum(1 for evaluation in evaluations if evaluation is not None)
+        stats.seconds += time.perf_counter() - start
+
+        result.loc[candidates.index, "llm_result"] = pd.Series(
+            evaluations, index=candidates.index, dtype=object
+        )
+        result.loc[candidates.index, "llm_score"] = [
+            overall_score(evaluation) for evaluation in evaluations
+        ]
+        return result
+
+    def report(self) -> pd.DataFrame:
+        """단계별 통과율 및 지연 시간 보고"""
+        return pd.DataFrame(
+            [
+                {
+                    "stage": stats.name,
+                    "received": stats.received,
+                    "passed": stats.passed,
+                    "sampled": stats.sampled,
+                    "pass_rate": stats.pass_rate,
+                    "latency_ms_per_doc": stats.latency_ms_per_doc,
+                }
+                for stats in self.stats.values()
+            ]
+        )
+
+
+def _recall_threshold(scores: np.ndarray, labels: np.ndarray, recall: float) -> float:
+    """양성 문서의 recall 이상을 유지하는 가장 높은 기준 점수"""
+    positives = np.sort(scores[labels & ~np.isnan(scores)])
+    if positives.size == 0:
+        return 0.0
+    return float(positives[int(np.floor((1.0 - recall) * positives.size))])
+
+
+def calibrate_thresholds(
+    frame: pd.DataFrame,
+    label_column: str = "relevant",
+    target_recall: float = 0.95,
+    cascade: ScoringCascade | None = None,
+) -> dict[str, float]:
+    """저장된 기사를 재생해 목표 재현율을 지키는 단계별 기준 점수 산출 (오프라인 보정)
+
+    Args:
+        frame (pd.DataFrame): 기사 + 정답(label_column, 예: 과거 LLM 종합 점수 >= 기준)
+        label_column (str): 관련 기사 여부 컬럼
+        target_recall (float): 캐스케이드 전체 목표 재현율
+        cascade (ScoringCascade | None): 점수 계산에 사용할 캐스케이드
+
+    Returns:
+        dict[str, float]: heuristic/vectorizer 기준 점수와 예상 재현율, LLM 호출 비율
+    """
+    cascade = cascade or ScoringCascade(
+        CascadeConfig(llm=StageConfig(enabled=False)), evaluator=None
+    )
+    config = cascade.config
+    stages = [
+        name for name in ("heuristic", "vectorizer") if getattr(config, name).enabled
+    ]
+    stage_recall = target_recall ** (1 / max(len(stages), 1))
+
+    # 점수만 얻기 위해 모든 문서를 통과시킨다
+    saved = {name: getattr(config, name).threshold for name in stages}
+    for name in stages:
+        getattr(config, name).threshold = -np.inf
+    try:
+        scored = cascade.screen(frame)
+    finally:
+        for name, threshold in saved.items():
+            getattr(config, name).threshold = threshold
+
+    # 중복으로 제거된 문서는 원본이 평가되므로 재현율 계산에서 제외
+    alive = scored["dropped_at"].isna().to_numpy().copy()
+    labels = frame[label_column].to_numpy(dtype=bool) & alive
+    columns = {"heuristic": "heuristic_score", "vectorizer": "relevance"}
+    calibrated: dict[str, float] = {}
+    for name in stages:
+        scores = scored[columns[name]].to_numpy(dtype=np.float64)
+        threshold = _recall_threshold(
+            np.where(alive, scores, np.nan), labels, stage_recall
+        )
+        calibrated[f"{name}_threshold"] = threshold
+        alive &= scores >= threshold
+
+    positives = labels.sum()
+    calibrated["expected_recall"] = (
+        float((alive & labels).sum() / positives) if positives else 1.0
+    )
+    calibrated["llm_fraction"] = float(alive.mean()) if len(alive) else 0.0
+    return calibrated
+
+
+def load_replay(path: str | Path) -> pd.DataFrame:
+    """저장된 기사(JSON lines 또는 parquet) 로드"""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_json(path, lines=True)
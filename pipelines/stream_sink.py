@@ -0,0 +1,252 @@
+"""크롤링 결과를 출처별 Redis Stream 으로 실시간 전달 (점수 계산/LLM 평가/대시보드 소비자용)
+
+스트림 키: {prefix}:{source} (ex: articles:naver)
+    - 발행: StreamSink.put_many -> 출처별 파이프라인 XADD (MAXLEN ~)
+    - 소비: StreamConsumer -> 소비자 그룹 XREADGROUP / XACK
+    - 지연: 레코드의 fetched_at(크롤링 시각) 부터 소비자가 받은 시각까지
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+import statistics
+from collections import deque
+from dataclasses import dataclass, field, fields
+from itertools import groupby
+from typing import Any, AsyncIterator, Iterable
+
+from configs.settings import get_crawler_settings
+from databases.cache.async_redis_cluster_manager import AsyncRedisClusterManager
+
+
+logger = logging.getLogger("stream_sink")
+
+
+@dataclass
+class StreamSinkConfig:
+    """
+    스트림 설정 (crawler_settings.yaml 의 stream_sink)
+    Args:
+        prefix (str): 스트림 키 접두사
+        maxlen (int): 스트림별로 유지할 대략적인 최대 길이
+        count (int): XREADGROUP 1회 최대 항목 수
+        block_ms (int): 새 항목을 기다릴 시간 (ms)
+    """
+
+    prefix: str = "articles"
+    maxlen: int = 100_000
+    count: int = 100
+    block_ms: int = 1000
+
+    @classmethod
+    def from_settings(cls) -> StreamSinkConfig:
+        data: dict = get_crawler_settings().get("stream_sink") or {}
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+    def stream_key(self, source: str) -> str:
+        return f"{self.prefix}:{source}"
+
+
+@dataclass
+class LatencyStats:
+    """
+    지연 시간 표본 (최근 max_samples 개)
+    Args:
+        max_samples (int): 보관할 표본 수
+    """
+
+    max_samples: int = 10_000
+    count: int = 0
+    samples: deque = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.samples = deque(maxlen=self.max_samples)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.samples.append(seconds * 1000)
+
+    def summary(self) -> dict[str, float]:
+        """
+        Returns:
+            dict[str, float]: count 와 p50/p95/p99/max (ms)
+        """
+        if not self.samples:
+            return {"count": self.count}
+        ordered = sorted(self.samples)
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        return {
+            "count": self.count,
+            "p50_ms": cuts[49],
+            "p95_ms": cuts[94],
+            "p99_ms": cuts[98],
+            "max_ms": ordered[-1],
+        }
+
+
+class StreamSink:
+    """
+    정규화된 레코드를 출처별 스트림에 발행
+        >>> sink = StreamSink(manager)
+        >>> await sink.put_many([{"url": ..., "source": "naver", "fetched_at": time.time()}])
+    Args:
+        manager (AsyncRedisClusterManager): 클러스터 관리자
+        config (StreamSinkConfig | None): 스트림 설정 (None이면 crawler_settings.yaml)
+    """
+
+    def __init__(
+        self, manager: AsyncRedisClusterManager, config: StreamSinkConfig | None = None
+    ) -> None:
+        self.manager = manager
+        self.config = config or StreamSinkConfig.from_settings()
+        self.published: dict[str, int] = {}
+        self.latency = LatencyStats()
+
+    async def put_many(self, records: Iterable[dict]) -> None:
+        """
+        레코드 발행 (출처별 파이프라인 XADD, 실패는 기록만 하고 크롤링은 계속)
+        Args:
+            records (Iterable[dict]): source / fetched_at 이 포함된 레코드
+        """
+        by_source = groupby(
+            sorted((r for r in records if r), key=lambda r: r.get("source", "unknown")),
+            key=lambda r: r.get("source", "unknown"),
+        )
+        batches = {source: list(group) for source, group in by_source}
+        results = await asyncio.gather(
+            *(
+                self.manager.xadd_many(
+                    self.config.stream_key(source), batch, maxlen=self.config.maxlen
+                )
+                for source, batch in batches.items()
+            ),
+            return_exceptions=True,
+        )
+        now = time.time()
+        for (source, batch), result in zip(batches.items(), results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ 스트림 발행 실패 ({source}, {len(batch)}건): {result}")
+                continue
+            self.published[source] = self.published.get(source, 0) + len(batch)
+            for record in batch:
+                if "fetched_at" in record:
+                    self.latency.record(now - record["fetched_at"])
+
+
+@dataclass
+class StreamRecord:
+    stream: str
+    id: str
+    record: Any
+
+
+class StreamConsumer:
+    """
+    소비자 그룹으로 출처별 스트림을 읽는 하위 소비자용 도우미 (적어도 한 번 전달)
+        >>> consumer = StreamConsumer(manager, "scoring", "worker-1", ["naver", "daum"])
+        >>> await consumer.start()
+        >>> async for batch in consumer.batches():
+        ...     handle(batch)  # 다음 batch 를 요청하면 이전 batch 를 XACK
+    Args:
+        manager (AsyncRedisClusterManager): 클러스터 관리자
+        group (str): 소비자 그룹 이름
+        consumer (str): 그룹 안에서의 소비자 이름
+        sources (Iterable[str]): 읽을 출처
+        config (StreamSinkConfig | None): 스트림 설정 (None이면 crawler_settings.yaml)
+    """
+
+    def __init__(
+        self,
+        manager: AsyncRedisClusterManager,
+        group: str,
+        consumer: str,
+        sources: Iterable[str],
+        config: StreamSinkConfig | None = None,
+    ) -> None:
+        self.manager = manager
+        self.group = group
+        self.consumer = consumer
+        self.config = config or StreamSinkConfig.from_settings()
+        self.streams = [self.config.stream_key(source) for source in sources]
+        self.latency = LatencyStats()
+        self._reads: dict[str, asyncio.Task] = {}
+
+    async def start(self, start_id: str = "$") -> None:
+        """스트림별 소비자 그룹 생성 (이미 있으면 그대로 사용)"""
+        await asyncio.gather(
+            *(self.manager.ensure_group(stream, self.group, start_id) for stream in self.streams)
+        )
+
+    async def read(self) -> list[StreamRecord]:
+        """
+        모든 스트림에서 새 항목 읽기 (클러스터에서는 스트림마다 슬롯이 달라 스트림별로 동시에 요청)
+
+        어느 한 스트림이라도 응답하면 바로 반환하고, 아직 기다리는 스트림의 요청은 취소하지 않고
+        다음 read 에서 이어서 기다림 (조용한 스트림이 block_ms 만큼 묶음을 붙잡지 않음)
+        한 스트림의 읽기가 실패해도 다른 스트림에서 이미 전달된 항목은 그대로 반환 (실패는 로그,
+        읽은 항목이 하나도 없을 때만 예외를 다시 올림)
+        Returns:
+            list[StreamRecord]: 읽은 항목
+        """
+        for stream in self.streams:
+            if stream not in self._reads:
+                self._reads[stream] = asyncio.create_task(
+                    self.manager.read_group(
+                        stream,
+                        self.group,
+                        self.consumer,
+                        count=self.config.count,
+                        block_ms=self.config.block_ms,
+                    )
+                )
+        await asyncio.wait(self._reads.values(), return_when=asyncio.FIRST_COMPLETED)
+        done = [stream for stream in self.streams if self._reads[stream].done()]
+        now = time.time()
+        batch: list[StreamRecord] = []
+        errors: list[BaseException] = []
+        for stream in done:
+            task = self._reads.pop(stream)
+            if task.exception() is not None:
+                logger.error(f"❌ 스트림 읽기 실패 ({stream}): {task.exception()}")
+                errors.append(task.exception())
+                continue
+            batch.extend(
+                StreamRecord(stream, entry_id, record) for entry_id, record in task.result()
+            )
+        if errors and not batch:
+            raise errors[0]
+        for item in batch:
+            if isinstance(item.record, dict) and "fetched_at" in item.record:
+                self.latency.record(now - item.record["fetched_at"])
+        return batch
+
+    async def close(self) -> None:
+        """기다리던 읽기 요청 취소 (취소 직전에 전달된 항목은 PEL 에 남음, XCLAIM 으로 회수)"""
+        reads, self._reads = list(self._reads.values()), {}
+        for task in reads:
+            task.cancel()
+        await asyncio.gather(*reads, return_exceptions=True)
+
+    async def ack(self, batch: list[StreamRecord]) -> None:
+        """처리 완료 확인 (스트림별 XACK)"""
+        ordered = sorted(batch, key=lambda item: item.stream)
+        await asyncio.gather(
+            *(
+                self.manager.ack(stream, self.group, *(item.id for item in items))
+                for stream, items in groupby(ordered, key=lambda item: item.stream)
+            )
+        )
+
+    async def batches(self) -> AsyncIterator[list[StreamRecord]]:
+        """새 항목 묶음을 계속 넘겨줌 (빈 묶음은 건너뜀, 다음 요청 시 이전 묶음 XACK)"""
+        try:
+            while True:
+                batch = await self.read()
+                if not batch:
+                    continue
+                yield batch
+                await self.ack(batch)
+        finally:
+            await self.close()
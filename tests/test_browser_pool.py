@@ -0,0 +1,421 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webelement import WebElement
+
+from common.browser_pool import BrowserPool, BrowserPoolConfig
+from common.network_policy import PAGE_METRICS_JS, NetworkPolicy, SiteProfile
+from crawlers.dom_extract import DAUM_ITEMS_JS, GOOGLE_ITEMS_JS, DomExtractor
+from crawlers.google.google_selenium import GoogleSeleniumMovingElementLocation, GooglePagingConfig
+from crawlers.selenium_ndg import AsyncSeleniumNewsDriver
+
+
+class FakeElement(WebElement):
+    def __init__(self, driver: "FakeDriver", handle: str) -> None:
+        self.driver = driver
+        self.handle = handle
+
+    def click(self):
+        # 실제 브라우저처럼 현재 탭의 요소만 조작 가능
+        assert self.driver.current_window_handle == self.handle
+        self.driver.clicks.append(self.handle)
+
+
+class FakeSwitchTo:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.driver.handles)}"
+        self.driver.handles.append(handle)
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """탭 전환/페이지 이동만 흉내 내는 WebDriver (pageLoadStrategy none: get 은 바로 반환)"""
+
+    load_seconds = 0.0
+
+    def __init__(self) -> None:
+        self.handles = ["tab-0"]
+        self.current_window_handle = "tab-0"
+        self.switch_to = FakeSwitchTo(self)
+        self.urls: dict[str, str] = {}
+        self.clicks: list[str] = []
+        self.alive = True
+        self.quit_called = False
+        self.cdp: list[tuple[str, str, dict]] = []
+        self.ready_at: dict[str, float] = {}
+        self.blocked: dict[str, list[str]] = {}
+        self.implicit_wait = 0.0
+
+    @property
+    def current_url(self):
+        return self.urls.get(self.current_window_handle)
+
+    @property
+    def page_source(self):
+        return f"<html>{self.urls.get(self.current_window_handle)}</html>"
+
+    def get(self, url):
+        self.urls[self.current_window_handle] = url
+        self.ready_at[self.current_window_handle] = time.monotonic() + self.load_seconds
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def find_element(self, by, value):
+        if value == "//missing":
+            # 실제 세션처럼 implicit wait 동안 기다린 뒤 실패
+            time.sleep(self.implicit_wait)
+            raise NoSuchElementException(value)
+        return FakeElement(self, self.current_window_handle)
+
+    def execute_script(self, script, *args):
+        if not self.alive:
+            raise WebDriverException("session deleted")
+        if script == "return document.readyState":
+            ready = time.monotonic() >= self.ready_at.get(self.current_window_handle, 0)
+            return "complete" if ready else "loading"
+        if script == PAGE_METRICS_JS:
+            # 차단 목록이 있으면 전송량이 줄어든 것처럼
+            blocked = self.blocked.get(self.current_window_handle)
+            return {
+                "url": self.current_url,
+                "bytes": 300 if blocked else 1000,
+                "requests": 5,
+                "ready_ms": 120.0,
+            }
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((self.current_window_handle, cmd, params))
+        if cmd == "Network.setBlockedURLs":
+            self.blocked[self.current_window_handle] = params["urls"]
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_browser_pool_spreads_tabs_and_recycles():
+    drivers: list[FakeDriver] = []
+
+    def factory() -> FakeDriver:
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    config = BrowserPoolConfig(size=2, tabs_per_browser=2, max_pages=6, health_check_interval=0)
+    pool = BrowserPool(factory, config)
+    pool.warm()
+    assert len(drivers) == 2
+
+    barrier = threading.Barrier(4)
+    sources: dict[int, str] = {}
+
+    def crawl(i: int) -> None:
+        with pool.tab() as tab:
+            tab.get(f"https://news.example.com/{i}")
+            button = tab.find_element("xpath", "//a")
+            barrier.wait()  # 4개 키워드가 동시에 탭을 잡고 있는 상태
+            button.click()
+            sources[i] = tab.page_source
+            tab.quit()  # 탭 사용자의 quit 은 무시
+
+    threads = [threading.Thread(target=crawl, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sources == {i: f"<html>https://news.example.com/{i}</html>" for i in range(4)}
+    assert [len(driver.handles) for driver in drivers] == [2, 2]
+    assert not any(driver.quit_called for driver in drivers)
+
+    # max_pages 를 넘긴 브라우저는 반납 시 교체
+    for _ in range(4):
+        with pool.tab() as tab:
+            tab.get("https://news.example.com/again")
+    assert pool.recycled >= 1 and any(driver.quit_called for driver in drivers)
+
+    # 상태 확인에 실패한 브라우저는 빌려주지 않고 교체
+    for browser in pool.browsers:
+        browser.driver.alive = False
+    with pool.tab() as tab:
+        assert tab._browser.driver.alive
+    assert pool.stats()["browsers"] <= 2
+
+    pool.close()
+    with pytest.raises(RuntimeError):
+        with pool.tab():
+            pass
+
+
+class SlowLoadingDriver(FakeDriver):
+    load_seconds = 0.2
+
+
+def test_tabs_of_one_browser_load_concurrently():
+    config = BrowserPoolConfig(size=1, tabs_per_browser=3, health_check_interval=60)
+    with BrowserPool(SlowLoadingDriver, config) as pool:
+        pool.warm()
+        ready: list[str] = []
+
+        def load(i: int) -> None:
+            with pool.tab() as tab:
+                tab.get(f"https://news.example.com/{i}")
+                ready.append(tab.execute_script("return document.readyState"))
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=load, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        assert ready == ["complete"] * 3
+        assert len(pool.browsers) == 1
+    # 로드 대기는 lock 밖이라 한 브라우저의 세 탭이 겹쳐서 로드 (차례로면 0.6초 이상)
+    assert elapsed < 0.45
+
+
+def test_implicit_wait_does_not_freeze_other_tabs():
+    driver = FakeDriver()
+    config = BrowserPoolConfig(size=1, tabs_per_browser=2, health_check_interval=60)
+    elapsed: dict[str, float] = {}
+
+    def look_for_popup() -> None:
+        with pool.tab() as tab:
+            tab.implicitly_wait(10)  # PageScroller.page_scroll 처럼
+            started = time.monotonic()
+            with pytest.raises(NoSuchElementException):
+                tab.find_element("xpath", "//missing")
+            elapsed["popup"] = time.monotonic() - started
+
+    def load_page() -> None:
+        with pool.tab() as tab:
+            time.sleep(0.05)
+            started = time.monotonic()
+            tab.get("https://news.example.com/1")
+            elapsed["other"] = time.monotonic() - started
+
+    with BrowserPool(lambda: driver, config) as pool:
+        pool.warm()
+        threads = [threading.Thread(target=look_for_popup), threading.Thread(target=load_page)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=15)
+
+    # 세션 implicit wait 는 0 그대로라 없는 요소 확인이 lock 을 오래 잡지 않음
+    assert driver.implicit_wait == 0.0
+    assert elapsed["popup"] < 0.5
+    assert elapsed["other"] < 0.5
+
+
+class FakeSeleniumCrawler:
+    """블로킹 Selenium 크롤러 흉내 (target 이 "broken" 이면 WebDriverException)"""
+
+    def __init__(self, target: str, count: int, pool: BrowserPool) -> None:
+        self.target = target
+        self.pool = pool
+        self.fallback_loop = None
+
+    def collect(self):
+        with self.pool.tab() as tab:
+            tab.get(f"https://news.example.com/{self.target}")
+            threading.Event().wait(0.2)  # time.sleep / implicitly_wait 처럼 스레드를 막음
+            if self.target == "broken":
+                raise WebDriverException("chrome not reachable")
+            return {"1": [{"url": tab.current_url, "thread": threading.current_thread().name}]}
+
+    async def fallback(self):
+        self.fallback_loop = asyncio.get_running_loop()
+        return [{"url": "https://api.example.com", "thread": threading.current_thread().name}]
+
+
+class FakeSeleniumDriver(AsyncSeleniumNewsDriver):
+    home = "fake"
+    crawler_class = FakeSeleniumCrawler
+
+
+@pytest.mark.asyncio
+async def test_selenium_driver_runs_in_pool_threads_and_falls_back_on_loop():
+    config = BrowserPoolConfig(size=1, tabs_per_browser=3)
+    pool = BrowserPool(FakeDriver, config)
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    beat = asyncio.create_task(heartbeat())
+    drivers = [FakeSeleniumDriver(target, 1, pool) for target in ("a", "b", "broken")]
+    results = await asyncio.gather(*(driver.news_collector() for driver in drivers))
+    beat.cancel()
+    pool.close()
+
+    assert results[0] == [{"url": "https://news.example.com/a", "thread": results[0][0]["thread"]}]
+    assert results[0][0]["thread"].startswith("selenium")
+    assert results[2][0]["thread"] == threading.current_thread().name
+    assert drivers[2].crawler.fallback_loop is asyncio.get_running_loop()
+    assert ticks >= 10  # Selenium 이 도는 동안에도 이벤트 루프는 계속 돎
+
+
+def test_network_policy_blocks_per_site_and_tracks_savings():
+    google = SiteProfile.build(
+        "google",
+        ["google.com"],
+        ["*.css", "*.woff2", "*google.com/search*"],
+        ["https://www.google.com/search*"],
+    )
+    # 파서가 쓰는 검색 결과 HTML 과 겹치는 패턴은 빠짐
+    assert google.blocked == ("*.css", "*.woff2")
+
+    network = NetworkPolicy([google], baseline_every=3)
+    driver = FakeDriver()
+    config = BrowserPoolConfig(size=1, tabs_per_browser=1, health_check_interval=60)
+    with BrowserPool(lambda: driver, config, network) as pool:
+        with pool.tab() as tab:
+            for page in range(5):
+                tab.get(f"https://www.google.com/search?q=x&start={page * 10}")
+            tab.get("https://news.example.com/article")
+
+    # 기준 측정 페이지(1, 4번째)는 차단 없이, 다른 사이트로 가면 해제 (같은 목록이면 CDP 호출 안 함)
+    assert driver.cdp[0][1] == "Network.enable"
+    assert [params["urls"] for _, _, params in driver.cdp[1:]] == [
+        ["*.css", "*.woff2"],
+        [],
+        ["*.css", "*.woff2"],
+        [],
+    ]
+
+    summary = pool.stats()["network"]["google"]
+    assert summary["pages"] == 3
+    assert summary["baseline_avg_bytes"] == 1000
+    assert summary["bytes_saved"] == 3 * 700
+    assert summary["p50_ready_ms"] == 120.0
+
+
+def test_network_policy_reserves_baseline_pages_across_threads():
+    google = SiteProfile.build("google", ["google.com"], ["*.css"], [])
+    network = NetworkPolicy([google], baseline_every=3)
+    barrier = threading.Barrier(12)
+
+    def load(_):
+        barrier.wait()
+        return network.prepare(FakeDriver(), None, "https://www.google.com/search?q=x")
+
+    # 아직 어떤 페이지도 떠나지 않아 기록(record)이 없어도 3번에 1번만 차단 없이
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        applied = list(executor.map(load, range(12)))
+
+    assert applied.count(None) == 4  # 차단 없이 (CDP 호출도 없음)
+    assert applied.count(("*.css",)) == 8
+
+
+class FakeScriptDriver:
+    """결과 목록 DOM 흉내 (표시 속성이 붙은 항목은 다시 반환하지 않음)"""
+
+    page_source = "<html></html>"
+
+    def __init__(self) -> None:
+        self.items: list[dict] = []
+        self.broken = False
+
+    def load(self, *docids: str) -> None:
+        # 페이지 이동: 새 DOM 이라 표시 속성이 없음
+        self.items = [{"id": docid, "marks": set()} for docid in docids]
+
+    def execute_script(self, script, mark):
+        if self.broken:
+            raise JavascriptException("querySelectorAll is not a function")
+        rows = []
+        for item in self.items:
+            if mark not in item["marks"]:
+                item["marks"].add(mark)
+                url = f"https://v.daum.net/v/{item['id']}"
+                rows.append([item["id"], url, f"기사 {item['id']}", "3시간 전"])
+        return rows
+
+
+def test_dom_extractor_returns_only_new_items():
+    driver = FakeScriptDriver()
+    extractor = DomExtractor(DAUM_ITEMS_JS)
+
+    driver.load("26a", "26b")
+    assert [item["url"][-3:] for item in extractor.collect(driver)] == ["26a", "26b"]
+    # 스크롤만 했으면 새로 나타난 항목만
+    driver.items.append({"id": "26c", "marks": set()})
+    assert [item["title"] for item in extractor.collect(driver)] == ["기사 26c"]
+    assert extractor.collect(driver) == []
+    # 다음 페이지에 다시 나온 기사는 거름
+    driver.load("26c", "26d")
+    assert [item["url"][-3:] for item in extractor.collect(driver)] == ["26d"]
+    assert extractor.calls == 4 and extractor.transferred > 0
+
+    driver.broken = True
+    assert extractor.collect(driver) is None
+
+
+def test_empty_dom_extraction_falls_back_to_page_source_once_per_page():
+    driver = FakeScriptDriver()
+    extractor = DomExtractor(DAUM_ITEMS_JS)
+
+    # 선택자가 안 맞아 새 페이지에서 아무것도 못 찾음
+    driver.load()
+    assert extractor.collect(driver, fresh=True) is None
+    # 같은 페이지를 다시 훑은 빈 결과는 정상
+    assert extractor.collect(driver) == []
+
+    pool = BrowserPool(FakeDriver)
+    crawler = GoogleSeleniumMovingElementLocation("q", 1, pool, GooglePagingConfig())
+    crawler.extract_news_urls = lambda html: [{"url": html}]
+    assert crawler.page_items(driver, extractor) == [{"url": "<html></html>"}]
+
+
+class SlowGoogleDriver(FakeDriver):
+    """페이지 로드에 0.2초 걸리고 start 오프셋마다 다른 결과를 주는 구글 결과 페이지"""
+
+    load_seconds = 0.2
+
+    def execute_script(self, script, *args):
+        if script != GOOGLE_ITEMS_JS:
+            return super().execute_script(script, *args)
+        start = int(self.current_url.rsplit("start=", 1)[1])
+        # 다음 페이지 첫 기사는 앞 페이지 마지막 기사와 같음 (중복)
+        urls = [f"https://news.example.com/{n}" for n in range(start, start + 11)]
+        return [[url, url, "기사", "1시간 전"] for url in urls]
+
+
+@pytest.mark.asyncio
+async def test_google_offset_pages_load_in_parallel_and_merge_in_order():
+    # 기본 풀 모양 (브라우저 2개 × 탭 4개) 에서 6 페이지
+    config = BrowserPoolConfig(size=2, tabs_per_browser=4, health_check_interval=60)
+    with BrowserPool(SlowGoogleDriver, config) as pool:
+        crawler = GoogleSeleniumMovingElementLocation("q", 6, pool, GooglePagingConfig())
+        started = asyncio.get_running_loop().time()
+        pages = await crawler.collect_pages()
+        elapsed = asyncio.get_running_loop().time() - started
+
+    assert list(pages) == ["1", "2", "3", "4", "5", "6"]
+    assert [page[0]["url"][-2:] for page in pages.values()] == ["/0", "11", "21", "31", "41", "51"]
+    assert sum(map(len, pages.values())) == 61
+    assert elapsed < 0.6  # 차례로 열면 1.2초 이상
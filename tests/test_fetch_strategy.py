@@ -0,0 +1,89 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import pytest
+
+from crawlers.strategy import (
+    AdaptiveNewsDriver,
+    FetchStrategy,
+    FetchStrategyConfig,
+    StrategyBook,
+)
+
+
+def fake_fetch(name: str, results: dict[str, list], calls: list[str]):
+    async def fetch(target: str, count: int):
+        calls.append(name)
+        result = results[name]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_adaptive_driver_prefers_cheap_and_demotes_failures():
+    calls: list[str] = []
+    results = {
+        "api": ConnectionError("quota"),
+        "html": [{"url": "a"}],
+        "browser": [{"url": str(i)} for i in range(10)],
+    }
+    book = StrategyBook(
+        "daum",
+        [
+            FetchStrategy("browser", 2, fake_fetch("browser", results, calls)),
+            FetchStrategy("api", 0, fake_fetch("api", results, calls)),
+            FetchStrategy("html", 1, fake_fetch("html", results, calls)),
+        ],
+        FetchStrategyConfig(min_attempts=3, demote_below=0.7, probe_every=0),
+    )
+
+    class Driver(AdaptiveNewsDriver):
+        home = "daum"
+
+    # 브라우저 평균을 모르는 동안은 HTML 1건도 충분한 결과
+    assert await Driver("q", 1, book).news_collector() == [{"url": "a"}]
+    assert calls == ["api", "html"]
+
+    # 브라우저가 10건을 모은 뒤로는 HTML 1건은 부족 → 브라우저까지
+    results["html"] = []
+    await Driver("q", 1, book).news_collector()
+    results["html"] = [{"url": "a"}]
+    calls.clear()
+    assert len(await Driver("q", 1, book).news_collector()) == 10
+    assert calls == ["api", "html", "browser"]
+
+    # 계속 실패한 api/html 은 강등되어 브라우저부터 시도
+    calls.clear()
+    assert len(await Driver("q", 1, book).news_collector()) == 10
+    assert calls == ["browser"]
+    summary = book.summary()
+    assert summary["api"]["demoted"] and summary["html"]["demoted"]
+    assert not summary["browser"]["demoted"]
+
+
+@pytest.mark.asyncio
+async def test_probe_retries_demoted_strategy_and_skips_unavailable():
+    calls: list[str] = []
+    results = {"api": [], "html": [{"url": "a"}], "browser": [{"url": "b"}]}
+    book = StrategyBook(
+        "google",
+        [
+            FetchStrategy("api", 0, fake_fetch("api", results, calls)),
+            FetchStrategy("html", 1, fake_fetch("html", results, calls)),
+            FetchStrategy("browser", 2, fake_fetch("browser", results, calls), lambda: False),
+        ],
+        FetchStrategyConfig(min_attempts=1, demote_below=0.9, probe_every=3),
+    )
+
+    class Driver(AdaptiveNewsDriver):
+        home = "google"
+
+    for _ in range(3):
+        await Driver("q", 1, book).news_collector()
+    # 1회차: api 실패 → 강등, 2회차: html 먼저, 3회차: 원래 순서로 api 재시도
+    assert calls == ["api", "html", "html", "api", "html"]
+    assert "browser" not in calls
@@ -0,0 +1,26 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import pytest
+
+from databases.keyword_generator import canonicalization_report, iter_canonical_pairs
+
+
+@pytest.mark.parametrize(
+    "left, right, expected",
+    [
+        (["Ai", "ai ", "LLM", "llm"], None, [("ai", "llm")]),
+        (["Ai", "딥러닝"], ["AI", "의료"], [("ai", "의료"), ("딥러닝", "ai"), ("딥러닝", "의료")]),
+        (["인공 지능", "인공지능", "LLM"], None, [("인공지능", "llm")]),
+    ],
+)
+def test_canonical_pairs_drop_redundant_queries(left, right, expected):
+    synonyms = {"인공 지능": "인공지능"}
+
+    pairs = list(iter_canonical_pairs(left, right, synonyms))
+    report = canonicalization_report(left, right, synonyms)
+
+    assert pairs == expected
+    assert report.queries_after == len(expected)
+    assert report.eliminated == report.queries_before - len(expected)
@@ -0,0 +1,39 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import json
+import logging
+import threading
+
+from common.logger import LogHub, LoggingConfig, enqueue
+
+
+def test_log_hub_shares_one_listener_and_caches_loggers(tmp_path):
+    before = threading.active_count()
+    hub = LogHub(LoggingConfig(batch_size=64, console=False))
+    crawl_log = str(tmp_path / "google" / "google_crawling.log")
+    selenium_log = str(tmp_path / "google" / "selenium_google.log")
+
+    # 같은 대상이라도 파일이 다르면 로거가 달라 서로의 핸들러를 덮어쓰지 않음
+    crawl = hub.logger("google", crawl_log)
+    selenium = hub.logger("google", selenium_log)
+    assert crawl is not selenium
+    assert all(hub.logger("google", crawl_log) is crawl for _ in range(1000))
+    assert threading.active_count() == before + 1
+
+    for i in range(500):
+        enqueue(crawl, logging.INFO, "page", {"page": i})
+    selenium.warning("%s 실패", "tab")
+    assert hub.flush()
+
+    lines = [json.loads(line) for line in open(crawl_log, encoding="utf-8")]
+    assert [line["page"] for line in lines] == list(range(500))
+    assert lines[0]["logger"] == "AsyncLogger-google.google_crawling"
+    assert json.load(open(selenium_log, encoding="utf-8"))["message"] == "tab 실패"
+
+    stats = hub.stats()
+    assert stats["written"] == 501 and stats["files"] == 2
+    assert stats["max_batch"] <= 64  # batch_size 단위로 기록
+    hub.stop()
+    assert threading.active_count() == before
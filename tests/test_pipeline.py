@@ -0,0 +1,232 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import json
+import asyncio
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from pymongo.errors import AutoReconnect
+from pipelines.mongo_sink import MongoSink, MongoSinkConfig
+from pipelines.scoring_cascade import (
+    SETTINGS_PATH,
+    CascadeConfig,
+    ScoringCascade,
+    StageConfig,
+    calibrate_thresholds,
+)
+from utils.keyword_matcher import KeywordMatcher
+
+
+class FakeEvaluator:
+    def __init__(self) -> None:
+        self.documents = []
+
+    async def evaluate_many(self, documents):
+        self.documents.extend(documents)
+        return [json.dumps({"종합 점수": 80}) for _ in documents]
+
+
+def articles() -> pd.DataFrame:
+    topics = ["의료", "금융", "교육", "제조업", "물류"]
+    rows = [
+        f"{t} AI 모델 발표. {t} 기업의 AI 반도체. LLM 경쟁 {t}. AI 투자 {t}. LLM 서비스"
+        for t in topics
+    ]
+    rows += [rows[0]]  # 중복
+    rows += [f"{i}일 날씨 맑음. 기온 {i * 3}도 예상, 강수 {i}%" for i in range(20)]
+    now = datetime(2025, 1, 1)
+    return pd.DataFrame(
+        {"content": rows, "published_date": now, "timestamp": now, "source": "naver"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_cascade_gates_llm_on_heuristics():
+    evaluator = FakeEvaluator()
+    cascade = ScoringCascade(
+        CascadeConfig(heuristic=StageConfig(threshold=0.5)),
+        evaluator=evaluator,
+        matcher=KeywordMatcher(["AI", "LLM"]),
+        seed=0,
+    )
+
+    result = await cascade.run(articles())
+    report = cascade.report().set_index("stage")
+
+    assert len(evaluator.documents) == 5
+    assert result["dropped_at"].value_counts().to_dict() == {
+        "heuristic": 20,
+        "dedupe": 1,
+    }
+    assert result.loc[result["llm_candidate"], "llm_score"].tolist() == [80.0] * 5
+    assert report.loc["heuristic", "pass_rate"] == 5 / 25
+    assert evaluator.documents[0].signature_keywords == ("AI", "LLM")
+
+
+@pytest.mark.asyncio
+async def test_shipped_heuristic_threshold_drops_fresh_off_topic_articles():
+    config = CascadeConfig.from_yaml(SETTINGS_PATH)
+    config.llm.enabled = False
+    cascade = ScoringCascade(config, matcher=KeywordMatcher(["AI", "LLM"]), seed=0)
+
+    result = await cascade.run(articles())
+
+    # 날씨 기사도 날짜 가중치 0.4 는 받지만 기준을 넘지 못함 (샘플링된 것만 다음 단계로)
+    assert config.heuristic.threshold > 0.4
+    assert cascade.stats["heuristic"].passed == 5
+    assert result["heuristic_score"].dropna().min() >= 0.4
+
+
+def test_calibration_keeps_target_recall():
+    frame = articles()
+    frame["relevant"] = frame["content"].str.contains("AI")
+    cascade = ScoringCascade(
+        CascadeConfig(llm=StageConfig(enabled=False)),
+        matcher=KeywordMatcher(["AI", "LLM"]),
+    )
+
+    calibrated = calibrate_thresholds(frame, target_recall=1.0, cascade=cascade)
+
+    assert calibrated["expected_recall"] == 1.0
+    assert calibrated["llm_fraction"] == 5 / 26
+    assert calibrated["heuristic_threshold"] > 0.4
+
+
+class FakeCollection:
+    """canonical_url 고유 인덱스만 흉내 낸 메모리 컬렉션 (첫 호출은 일시적 오류)"""
+
+    def __init__(self) -> None:
+        self.documents: dict[str, dict] = {}
+        self.indexes = []
+        self.calls = 0
+
+    async def create_indexes(self, indexes):
+        self.indexes.extend(indexes)
+
+    async def bulk_write(self, requests, ordered=True):
+        self.calls += 1
+        if self.calls == 1:
+            raise AutoReconnect("primary stepped down")
+        upserted = 0
+        for request in requests:
+            key = request._filter["canonical_url"]
+            upserted += key not in self.documents
+            document = self.documents.setdefault(key, dict(request._doc["$setOnInsert"]))
+            document.update(request._doc["$set"])
+        return type("Result", (), {"upserted_count": upserted, "modified_count": len(requests) - upserted})
+
+
+@pytest.mark.asyncio
+async def test_mongo_sink_upserts_canonical_urls_in_batches():
+    collection = FakeCollection()
+    config = MongoSinkConfig(batch_size=3, flush_interval=0.05, max_queue=2)
+    records = [
+        {"url": "https://News.example.com/a/?utm_source=x", "title": "1"},
+        {"url": "https://news.example.com/a", "title": "2"},
+        {"url": "https://news.example.com/b#top", "title": "3"},
+        {"url": "news.example.com/c", "title": "4"},
+        {"url": "", "title": "URL 없음"},
+    ]
+
+    async with MongoSink(collection, config) as sink:
+        await sink.put_many(records)
+
+    assert sorted(collection.documents) == [
+        "https://news.example.com/a",
+        "https://news.example.com/b",
+        "https://news.example.com/c",
+    ]
+    assert collection.documents["https://news.example.com/a"]["title"] == "2"
+    assert "first_seen" in collection.documents["https://news.example.com/c"]
+    assert len(collection.indexes) == 2
+    assert (sink.stats.received, sink.stats.upserted, sink.stats.failed) == (4, 3, 0)
+
+
+@pytest.mark.asyncio
+async def test_mongo_sink_skips_malformed_urls_and_keeps_flushing():
+    collection = FakeCollection()
+    collection.calls = 1  # 일시적 오류 없이
+    config = MongoSinkConfig(batch_size=2, flush_interval=0.01, max_queue=1)
+    records = [{"url": "http://[bad/x", "title": "잘못된 URL"}] + [
+        {"url": f"https://news.example.com/{i}", "title": str(i)} for i in range(6)
+    ]
+
+    sink = MongoSink(collection, config)
+    await sink.start()
+    # 저장 태스크가 죽으면 가득 찬 큐에서 put 이 끝나지 않음
+    await asyncio.wait_for(sink.put_many(records), timeout=2)
+    await sink.close()
+
+    assert len(collection.documents) == 6
+    assert (sink.stats.received, sink.stats.upserted, sink.stats.failed) == (7, 6, 1)
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_partitions_compacts_and_prunes(tmp_path):
+    pytest.importorskip("pyarrow")
+    from pipelines.parquet_export import (
+        ParquetExportConfig,
+        ParquetExporter,
+        compact,
+        read_articles,
+    )
+
+    config = ParquetExportConfig(root=str(tmp_path), row_group_size=4)
+    records = [
+        {"url": f"https://n.com/{i}", "title": str(i), "timestamp": f"2025-01-0{1 + i % 2}", "source": s}
+        for i in range(10)
+        for s in ("naver", "daum")
+    ]
+    async with ParquetExporter(config) as exporter:
+        for record in records:  # 크롤링 결과처럼 조금씩 도착
+            await exporter.put_many([record])
+
+    assert len(exporter.files) == 8  # 4개 파티션 x (4건 + 남은 1건)
+    report = compact(config)
+    assert (report.partitions, report.files_before, report.files_after) == (4, 8, 4)
+
+    frame = read_articles(
+        tmp_path,
+        columns=["title", "source"],
+        filters=[("source", "=", "naver"), ("crawl_date", "=", "2025-01-01")],
+    )
+    assert sorted(frame["title"]) == ["0", "2", "4", "6", "8"]
+    assert list(frame.columns) == ["title", "source"]
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_keeps_rows_with_bad_urls_and_failed_writes(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    from pipelines import parquet_export
+    from pipelines.parquet_export import ParquetExportConfig, ParquetExporter, read_articles
+
+    config = ParquetExportConfig(root=str(tmp_path), row_group_size=3)
+    records = [
+        {"url": "https://n.com/1", "title": "1", "timestamp": "2025-01-01", "source": "naver"},
+        {"url": "http://[bad/x", "title": "잘못된 URL", "timestamp": "2025-01-01", "source": "naver"},
+        {"url": "https://n.com/3", "title": "3", "timestamp": "2025-01-01", "source": "naver"},
+    ]
+    write = parquet_export.write_partition
+    calls = []
+
+    def flaky(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise OSError("disk full")
+        return write(*args)
+
+    monkeypatch.setattr(parquet_export, "write_partition", flaky)
+    exporter = ParquetExporter(config)
+    await exporter.put_many(records)  # 첫 기록은 실패해도 예외 없이 버퍼 유지
+    assert exporter.buffered == 3 and not exporter.files
+    await exporter.close()
+
+    frame = read_articles(tmp_path, columns=["title", "canonical_url"])
+    assert sorted(frame["title"]) == ["1", "3", "잘못된 URL"]
+    assert frame.set_index("title")["canonical_url"].isna().to_dict() == {
+        "1": False, "잘못된 URL": True, "3": False,
+    }
+    assert exporter.buffered == 0 and not exporter.buffers
@@ -0,0 +1,139 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import re
+import json
+import asyncio
+
+import openai
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from utils.promt import LLMDocument, LLMEvaluationService, TokenBudget
+
+SCORE = {"키워드 중요도": 3, "AI 트렌드 관련도": 4, "출처 신뢰도": 2, "종합 점수": 70}
+
+
+@pytest_asyncio.fixture
+async def stub_openai():
+    """OpenAI chat completions API 를 흉내내는 로컬 서버"""
+    state = {"calls": 0, "active": 0, "peak": 0}
+
+    async def completions(request: web.Request) -> web.Response:
+        body = await request.json()
+        prompt = body["messages"][-1]["content"]
+        state["calls"] += 1
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+
+        batch = re.search(r"문서 (\d+)건", prompt)
+        if batch:
+            content = [{"id": i, **SCORE} for i in range(int(batch.group(1)))]
+        else:
+            content = SCORE
+        return web.json_response(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {
+                            "role": "assistant",
+                            "content": json.dumps(content, ensure_ascii=False),
+                        },
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    client = openai.AsyncOpenAI(api_key="stub", base_url=f"http://127.0.0.1:{port}/v1")
+    yield client, state
+    await client.close()
+    await runner.cleanup()
+
+
+def article(i: int, length: int = 200) -> LLMDocument:
+    text = f"{i}번 기사 " + " ".join(f"단어{i}-{j}" for j in range(length // 8))
+    return LLMDocument(
+        text=text, source="naver", date="2025-01-01", signature_keywords=("AI",)
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_batches_caches_and_deduplicates(stub_openai):
+    client, state = stub_openai
+    service = LLMEvaluationService(client=client, max_batch_size=4)
+
+    docs = [article(i) for i in range(8)] + [article(0)]
+    results = await service.evaluate_many(docs)
+
+    assert all(json.loads(result) == SCORE for result in results)
+    assert state["calls"] == 2
+    assert service.stats.deduplicated == 0
+    assert service.budget.used == 30
+
+    await service.evaluate_many(docs)
+    assert state["calls"] == 2
+    assert service.stats.cache_hits == len(docs)
+
+
+@pytest.mark.asyncio
+async def test_service_bounds_concurrency_and_budget(stub_openai):
+    client, state = stub_openai
+    service = LLMEvaluationService(
+        client=client,
+        max_concurrency=2,
+        batch_char_limit=10,
+        budget=TokenBudget(limit=10**6),
+    )
+
+    near = article(1, length=2000)
+    similar = LLMDocument(
+        near.text + " 추가", near.source, near.date, near.signature_keywords
+    )
+    results = await service.evaluate_many(
+        [article(i, length=2000) for i in range(2, 8)] + [near, similar]
+    )
+
+    assert all(results)
+    assert service.stats.deduplicated == 1
+    assert state["calls"] == 7
+    assert state["peak"] <= 2
+
+    broke = LLMEvaluationService(client=client, budget=TokenBudget(limit=10))
+    assert await broke.evaluate(article(99)) is None
+    assert broke.stats.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_service_does_not_merge_same_text_across_sources(stub_openai):
+    client, state = stub_openai
+    service = LLMEvaluationService(client=client, batch_char_limit=10)
+
+    naver = article(1, length=2000)
+    daum = LLMDocument(naver.text, "daum", naver.date, naver.signature_keywords)
+    later = LLMDocument(naver.text, naver.source, "2025-01-02", naver.signature_keywords)
+    results = await service.evaluate_many([naver, daum, later])
+
+    assert all(results)
+    assert service.stats.deduplicated == 0
+    assert state["calls"] == 3
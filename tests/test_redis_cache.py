@@ -0,0 +1,444 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import json
+import time
+import asyncio
+
+import pytest
+from redis.crc import key_slot
+from redis.exceptions import MovedError, ResponseError
+
+from databases.cache.async_redis_cluster_manager import AsyncRedisClusterManager
+from databases.cache.codec import MSGPACK, MSGPACK_ZSTD, ValueCodec
+from databases.cache import node_router
+from databases.cache.local_cache import MISSING, LocalCache, TrackingInvalidator
+from databases.cache.redis_cluster_manager import RedisClusterManager
+from configs.settings import RedisNode
+from pipelines.stream_sink import StreamConsumer, StreamSink, StreamSinkConfig
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeAsyncCluster") -> None:
+        self.client = client
+        self.ops: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+    async def execute(self) -> list:
+        ops, self.ops = self.ops, []
+        return [await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in ops]
+
+
+class FakeAsyncCluster:
+    """슬롯 라우팅 없이 명령 결과만 흉내내는 in-memory 클러스터"""
+
+    def __init__(self) -> None:
+        self.store: dict = {}
+
+    def pipeline(self) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def set(self, key, value):
+        self.store[key] = value
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def mset_nonatomic(self, mapping):
+        self.store.update(mapping)
+
+    async def mget_nonatomic(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def sadd(self, key, *values):
+        self.store.setdefault(key, set()).update(values)
+
+    async def sscan(self, key, cursor=0, count=10):
+        items = sorted(self.store.get(key, ()))
+        page = items[cursor : cursor + count]
+        return (cursor + count if cursor + count < len(items) else 0), page
+
+    async def xadd(self, stream, fields, maxlen=None, approximate=True):
+        entries = self.store.setdefault(stream, [])
+        self.store[("last", stream)] = self.store.get(("last", stream), 0) + 1
+        entry_id = f"{self.store[('last', stream)]}-0".encode()
+        entries.append((entry_id, {k.encode(): v for k, v in fields.items()}))
+        del entries[: max(len(entries) - (maxlen or len(entries)), 0)]
+        return entry_id
+
+    async def xgroup_create(self, stream, group, id="$", mkstream=False):
+        groups = self.store.setdefault(("groups", stream), {})
+        if group in groups:
+            raise ResponseError("BUSYGROUP Consumer Group name already exists")
+        groups[group] = {"delivered": self.store.get(("last", stream), 0), "pending": set()}
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        reply = []
+        for stream in streams:
+            state = self.store[("groups", stream)][group]
+            entries = [
+                entry for entry in self.store.get(stream, [])
+                if int(entry[0].split(b"-")[0]) > state["delivered"]
+            ][:count]
+            if entries:
+                state["delivered"] = int(entries[-1][0].split(b"-")[0])
+            state["pending"].update(entry_id.decode() for entry_id, _ in entries)
+            if entries:
+                reply.append([stream.encode(), entries])
+        return reply
+
+    async def xack(self, stream, group, *ids):
+        pending = self.store[("groups", stream)][group]["pending"]
+        acked = pending & set(ids)
+        pending -= acked
+        return len(acked)
+
+    async def aclose(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_async_manager_batches_and_streams_shards():
+    async with AsyncRedisClusterManager(cluster_client=FakeAsyncCluster()) as manager:
+        await manager.store_many({"a": {"x": 1}, "b": "plain"})
+        assert await manager.fetch_many(["a", "b", "missing"]) == {
+            "a": {"x": 1},
+            "b": "plain",
+            "missing": None,
+        }
+
+        pairs = [[f"k{i}", f"c{i % 7}"] for i in range(500)]
+        await manager.store_sharded("combination", pairs, partitions=6, chunk_size=50)
+        pages = [page async for page in manager.iter_sharded("combination", count=40)]
+
+    assert sorted(pair for page in pages for pair in page) == sorted(pairs)
+    assert max(len(page) for page in pages) <= 40
+
+
+@pytest.mark.asyncio
+async def test_stream_sink_fans_out_by_source_to_consumer_group():
+    cluster = FakeAsyncCluster()
+    config = StreamSinkConfig(maxlen=3, count=10)
+    async with AsyncRedisClusterManager(cluster_client=cluster) as manager:
+        consumer = StreamConsumer(manager, "scoring", "worker-1", ["naver", "daum"], config)
+        await consumer.start()
+        await consumer.start()  # 이미 있는 그룹은 그대로 사용
+
+        sink = StreamSink(manager, config)
+        now = time.time()
+        await sink.put_many(
+            [{"url": f"https://n.com/{i}", "source": "naver", "fetched_at": now} for i in range(5)]
+            + [{"url": "https://d.com/1", "source": "daum", "fetched_at": now}]
+        )
+        batches = consumer.batches()
+        batch = await anext(batches)
+        await batches.aclose()
+
+    assert sink.published == {"naver": 5, "daum": 1}
+    assert len(cluster.store["articles:naver"]) == 3  # MAXLEN ~ 로 정리
+    assert sorted(item.record["url"] for item in batch) == [
+        "https://d.com/1", "https://n.com/2", "https://n.com/3", "https://n.com/4",
+    ]
+    assert consumer.latency.summary()["count"] == 4
+    assert cluster.store[("groups", "articles:naver")]["scoring"]["pending"] == {"3-0", "4-0", "5-0"}
+
+
+class BlockingFakeCluster(FakeAsyncCluster):
+    """새 항목이 없으면 block ms 동안 기다리는 XREADGROUP (스트림마다 요청 하나)"""
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        deadline = time.monotonic() + (block or 0) / 1000
+        while True:
+            reply = await super().xreadgroup(group, consumer, streams, count, block)
+            if reply or time.monotonic() >= deadline:
+                return reply
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_stream_consumer_does_not_wait_for_idle_streams():
+    cluster = BlockingFakeCluster()
+    config = StreamSinkConfig(count=10, block_ms=500)
+    async with AsyncRedisClusterManager(cluster_client=cluster) as manager:
+        consumer = StreamConsumer(manager, "scoring", "worker-1", ["naver", "daum"], config)
+        await consumer.start()
+        sink = StreamSink(manager, config)
+        await sink.put_many([{"url": "https://n.com/1", "source": "naver"}])
+
+        started = time.perf_counter()
+        first = await consumer.read()
+        first_elapsed = time.perf_counter() - started
+
+        # 조용하던 daum 요청은 계속 기다리던 중이라 새 항목을 바로 받음
+        await sink.put_many([{"url": "https://d.com/1", "source": "daum"}])
+        started = time.perf_counter()
+        second = await consumer.read()
+        second_elapsed = time.perf_counter() - started
+        await consumer.close()
+
+    assert [item.record["url"] for item in first] == ["https://n.com/1"]
+    assert first_elapsed < 0.25
+    assert [item.record["url"] for item in second] == ["https://d.com/1"]
+    assert second_elapsed < 0.25
+    assert consumer._reads == {}
+
+
+class FailingStreamFakeCluster(FakeAsyncCluster):
+    """daum 스트림의 XREADGROUP 만 실패"""
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        if "articles:daum" in streams:
+            raise ConnectionError("daum node down")
+        return await super().xreadgroup(group, consumer, streams, count, block)
+
+
+@pytest.mark.asyncio
+async def test_stream_consumer_keeps_entries_when_another_stream_fails():
+    cluster = FailingStreamFakeCluster()
+    config = StreamSinkConfig(count=10, block_ms=None)
+    async with AsyncRedisClusterManager(cluster_client=cluster) as manager:
+        consumer = StreamConsumer(manager, "scoring", "worker-1", ["naver", "daum"], config)
+        await consumer.start()
+        await StreamSink(manager, config).put_many(
+            [{"url": f"https://n.com/{i}", "source": "naver"} for i in range(2)]
+        )
+        batch = await consumer.read()
+        await consumer.ack(batch)
+        # 읽은 항목이 없으면 실패를 그대로 올림
+        with pytest.raises(ConnectionError):
+            await consumer.read()
+        await consumer.close()
+
+    assert [item.record["url"] for item in batch] == ["https://n.com/0", "https://n.com/1"]
+    assert cluster.store[("groups", "articles:naver")]["scoring"]["pending"] == set()
+
+
+class FakeNodePipeline:
+    def __init__(self, node: "FakeNode") -> None:
+        self.node = node
+        self.ops: list[tuple[str, object]] = []
+
+    def mset(self, mapping):
+        self.ops.append(("mset", mapping))
+
+    def mget(self, keys):
+        self.ops.append(("mget", keys))
+
+    def execute(self, raise_on_error=True):
+        self.node.round_trips += 1
+        replies = []
+        for name, arg in self.ops:
+            keys = list(arg)
+            if any(key in self.node.cluster.moved for key in keys):
+                replies.append(MovedError("1 127.0.0.1:7001"))
+            elif any(key in self.node.cluster.broken for key in keys):
+                replies.append(ResponseError("OOM"))
+            elif name == "mset":
+                self.node.cluster.store.update(arg)
+                replies.append(True)
+            else:
+                replies.append([self.node.cluster.store.get(key) for key in keys])
+        return replies
+
+
+class FakeNode:
+    def __init__(self, cluster: "FakeSyncCluster", name: str) -> None:
+        self.cluster = cluster
+        self.name = name
+        self.round_trips = 0
+        self.redis_connection = self
+
+    def pipeline(self, transaction=False):
+        return FakeNodePipeline(self)
+
+
+class FakeSyncCluster:
+    """슬롯을 3개 노드에 나눠 담당하는 동기 클러스터 흉내"""
+
+    def __init__(self) -> None:
+        self.store: dict = {}
+        self.moved: set = set()
+        self.broken: set = set()
+        self.node_list = [FakeNode(self, f"127.0.0.1:{7000 + i}") for i in range(3)]
+        self.nodes_manager = self
+        self.slots_cache: dict = {}
+
+    def keyslot(self, key):
+        return key_slot(key.encode())
+
+    def get_node_from_slot(self, slot):
+        return self.node_list[slot * 3 // 16384]
+
+    def set(self, key, value):
+        self.store[key] = value
+        return True
+
+    def get(self, key):
+        return self.store.get(key)
+
+
+def test_store_many_groups_by_node_and_reports_key_errors():
+    cluster = FakeSyncCluster()
+    manager = RedisClusterManager(cluster_client=cluster)
+    items = {f"key:{i}": {"i": i} for i in range(3000)}
+    cluster.moved = {"key:1"}
+    cluster.broken = {"key:2"}
+
+    stored = manager.store_many(items, chunk_size=100)
+    fetched = manager.fetch_many(items)
+
+    assert set(stored.errors) == {"key:2"} | {
+        key for key in items if key_slot(key.encode()) == key_slot(b"key:2")
+    }
+    assert stored.values["key:1"] is True
+    assert fetched.values["key:1"] == {"i": 1}
+    assert fetched.values["key:2999"] == {"i": 2999}
+    assert all(node.round_trips == 2 for node in cluster.node_list)
+
+
+def test_local_cache_ttl_lru_and_invalidation():
+    now = [0.0]
+    cache = LocalCache(max_size=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", {"v": 1})
+    cache.set("b", 2)
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", 3)  # b 가 가장 오래 안 쓰임
+
+    assert cache.get("b") is MISSING
+    now[0] = 11
+    assert cache.get("a") is MISSING
+
+    cache.set("d", 4)
+    TrackingInvalidator(cache, client=None, prefixes=["d"]).handle_message(
+        ["message", "__redis__:invalidate", ["d"]]
+    )
+    assert cache.get("d") is MISSING
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+    assert (cache.stats.evictions, cache.stats.expirations) == (1, 1)
+
+
+def test_invalidation_during_load_is_not_overwritten_by_stale_value():
+    cache = LocalCache(max_size=8, ttl=60)
+
+    def stale_loader():
+        cache.invalidate(["KR:config"])  # 원본을 읽는 사이에 다른 클라이언트가 씀
+        return {"keywords": ["old"]}
+
+    assert cache.get_or_load("KR:config", stale_loader) == {"keywords": ["old"]}
+    assert cache.get("KR:config") is MISSING
+    assert cache.get_or_load("KR:config", lambda: {"keywords": ["new"]}) == {"keywords": ["new"]}
+    assert cache.get("KR:config") == {"keywords": ["new"]}
+    assert cache._loading == {}
+
+
+def test_tracking_requires_prefixes_and_sends_them():
+    class FakeConnection:
+        def __init__(self, sent):
+            self.sent = sent
+
+        def send_command(self, *args):
+            self.sent.append(args)
+
+        def read_response(self):
+            return 7
+
+        def can_read(self, timeout):
+            return False
+
+        def disconnect(self):
+            pass
+
+    class FakeClient:
+        def __init__(self):
+            self.sent = []
+            self.connection_pool = self
+
+        def make_connection(self):
+            return FakeConnection(self.sent)
+
+    cache = LocalCache()
+    with pytest.raises(ValueError):
+        TrackingInvalidator(cache, client=None, prefixes=[])
+    with pytest.raises(ValueError):
+        RedisClusterManager(cluster_client=FakeSyncCluster()).enable_local_cache()
+
+    client = FakeClient()
+    invalidator = TrackingInvalidator(cache, client, prefixes=["KR:"], poll_interval=0.01)
+    assert invalidator.start()
+    invalidator.stop()
+    assert client.sent[-1] == ("CLIENT", "TRACKING", "ON", "REDIRECT", 7, "BCAST", "PREFIX", "KR:")
+
+
+def test_fetch_data_reads_through_local_cache():
+    cluster = FakeSyncCluster()
+    cluster.store["KR:config"] = '{"keywords": ["ai"]}'
+    manager = RedisClusterManager(cluster_client=cluster)
+    cache = manager.enable_local_cache(tracking=False)
+
+    first = manager.fetch_data("KR:config")
+    cluster.store["KR:config"] = '{"keywords": []}'
+
+    assert manager.fetch_data("KR:config") is first
+    manager.store_data("KR:config", {"keywords": ["llm"]})
+    assert manager.fetch_data("KR:config") == {"keywords": ["llm"]}
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_reads_go_to_reader_replicas_and_writes_to_primary():
+    # database.yaml: 7000 reader, 7001 writer, 7002 backup
+    cluster = FakeSyncCluster()
+    reader, writer, backup = cluster.node_list
+    cluster.slots_cache = {slot: [writer, reader, backup] for slot in range(16384)}
+    cluster.get_node_from_slot = lambda slot: writer
+    manager = RedisClusterManager(cluster_client=cluster)
+    items = {f"key:{i}": str(i) for i in range(200)}
+
+    manager.store_many(items)
+    fetched = manager.fetch_many(items)
+    manager.store_data("direct", "x", port=7000)
+
+    assert fetched.values["key:7"] == "7"
+    assert (writer.round_trips, reader.round_trips, backup.round_trips) == (1, 1, 0)
+    assert "direct" not in cluster.store
+    assert manager.fetch_data("key:1", port=7002) is None
+    assert set(manager.node_stats()) == {writer.name, reader.name}
+
+
+@pytest.mark.parametrize(
+    "value, header",
+    [
+        (["인공지능", "의료"], MSGPACK),
+        ({"questions": ["인공지능 기술이 의료 산업에 미치는 영향은?"] * 50}, MSGPACK_ZSTD),
+    ],
+)
+def test_codec_roundtrip_and_legacy_json(value, header):
+    codec = ValueCodec()
+    encoded = codec.encode(value)
+
+    assert encoded[:1] == header
+    assert codec.decode(encoded) == value
+    assert codec.decode(json.dumps(value, ensure_ascii=False).encode()) == value
+    assert codec.decode(b"plain text") == "plain text"
+
+
+def test_replica_reads_fall_back_without_load_balancing_strategy(monkeypatch):
+    nodes = [
+        RedisNode(id="w", host="127.0.0.1", port=7001),
+        RedisNode(id="r", host="127.0.0.1", port=7002, role="reader"),
+    ]
+    assert node_router.replica_read_options(nodes[:1]) == {}
+    if node_router.LoadBalancingStrategy is not None:
+        assert node_router.replica_read_options(nodes) == {
+            "load_balancing_strategy": node_router.LoadBalancingStrategy.ROUND_ROBIN_REPLICAS
+        }
+
+    # redis-py 5.3 미만 (poetry.lock 의 5.2.1) 에는 LoadBalancingStrategy 가 없음
+    monkeypatch.setattr(node_router, "LoadBalancingStrategy", None)
+    assert node_router.replica_read_options(nodes) == {"read_from_replicas": True}
@@ -0,0 +1,81 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import re
+import random
+from collections import Counter
+
+import pytest
+from utils.keyword_matcher import KeywordMatcher
+
+
+KEYWORDS = ["인공지능", "AI", "ai", "딥러닝", "LLM", "생성형 인공지능", "a.i", "_x"]
+TOKENS = KEYWORDS + ["은", "는", " ", " ", ".", "..", ",", "모델", "x", "_", "1"]
+
+
+def regex_reference(content: str, keywords: list[str]) -> tuple[dict, int, int]:
+    """기존 re.findall / any(in) 구현"""
+    found = Counter(
+        word
+        for keyword in keywords
+        for word in re.findall(rf"\b{re.escape(keyword)}\b", content)
+    )
+    sentences = content.split(".")
+    valid = sum(1 for s in sentences if any(k in s for k in keywords))
+    return dict(found), valid, len(sentences)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_scan_matches_regex(seed):
+    rng = random.Random(seed)
+    content = "".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 60)))
+
+    scan = KeywordMatcher(KEYWORDS).scan(content)
+    counts, valid, total = regex_reference(content, KEYWORDS)
+
+    assert scan.counts == counts
+    assert scan.valid_sentence_count == valid
+    assert scan.sentence_count == total
+    for keyword, starts in scan.positions.items():
+        assert all(content.startswith(keyword, start) for start in starts)
+
+
+def test_batch_total_weight_matches_per_article():
+    from datetime import datetime, timedelta
+    from utils.search_util import NewsWeightScoring
+
+    rng = random.Random(7)
+    matcher = KeywordMatcher(KEYWORDS)
+    now = datetime(2025, 1, 1, 12)
+    contents = [
+        "".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 400)))
+        for _ in range(300)
+    ]
+    published = [now - timedelta(hours=rng.randint(-48, 24 * 600)) for _ in contents]
+    timestamps = [now] * len(contents)
+
+    expected = [
+        NewsWeightScoring(c, p, t, matcher=matcher).calculate_total_weight()
+        for c, p, t in zip(contents, published, timestamps)
+    ]
+    batch = NewsWeightScoring.batch_total_weight(
+        contents, published, timestamps, matcher=matcher
+    )
+
+    assert batch.tolist() == expected
+
+
+def test_relevance_index_ranks_topic_articles_online():
+    from utils.relevance import IncrementalRelevanceIndex
+
+    index = IncrementalRelevanceIndex(
+        topics={"llm": "LLM", "deep": "딥러닝"}, n_features=2**12
+    )
+    first = index.score_batch(["딥러닝 모델이 의료 산업에", "오늘 날씨는 맑음"])
+    second = index.score_batch(["LLM 서비스 출시", "주식 시장 마감"])
+
+    assert first["topic"].fillna("").tolist() == ["deep", ""]
+    assert second["topic"].fillna("").tolist() == ["llm", ""]
+    assert index.document_count == 4
+    assert index.document_frequency.shape == (2**12,)
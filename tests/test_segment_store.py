@@ -0,0 +1,82 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import zlib
+import asyncio
+import threading
+
+import pytest
+
+from databases.segment_store import FRAME, SegmentStore, SegmentStoreConfig
+
+
+def record(i: int, **extra) -> dict:
+    return {
+        "url": f"https://news.example.com/{i}?utm_source=x",
+        "title": str(i),
+        "timestamp": f"2025-01-0{1 + i % 2}",
+        **extra,
+    }
+
+
+def test_segment_store_lookup_rotation_and_crash_recovery(tmp_path):
+    config = SegmentStoreConfig(root=str(tmp_path), segment_bytes=2000, initial_capacity=8)
+    store = SegmentStore(config)
+    for i in range(100):
+        store.put(record(i), body="<p>본문</p>" * 50 if i == 7 else None)
+    store.put(record(5, title="수정"))
+
+    assert len(store) == 100
+    assert len(store.segments()) > 1
+    assert store.index.capacity > 8
+    assert store.get("https://NEWS.example.com/5/")["title"] == "수정"
+    assert store.get("https://news.example.com/7", with_body=True)["body"].startswith("<p>본문")
+    assert "body" not in store.get("https://news.example.com/7")
+    assert store.get("https://news.example.com/missing") is None
+
+    # close 없이 종료 + 마지막 기록이 잘린 상황
+    store.sync()
+    with open(store._segment_path(store.segment), "ab") as file:
+        file.write(b"\x40\x00\x00\x00\x00\x00\x00\x00partial")
+
+    with SegmentStore(config) as reopened:
+        assert len(reopened) == 100
+        assert reopened.get("https://news.example.com/5")["title"] == "수정"
+        day = [r["title"] for r in reopened.replay("2025-01-02")]
+        assert len(day) == 50 and "5" not in day and "수정" in day
+        assert len(list(reopened.replay("2025-01-02", latest_only=False))) == 51
+
+
+@pytest.mark.asyncio
+async def test_put_many_writes_off_the_event_loop(tmp_path):
+    config = SegmentStoreConfig(root=str(tmp_path), sync_every=1)
+    threads: set[str] = set()
+    async with SegmentStore(config) as store:
+        put = store.put
+        store.put = lambda *args: (threads.add(threading.current_thread().name), put(*args))
+        await asyncio.gather(*(store.put_many([record(i), {}]) for i in range(20)))
+        assert len(store) == 20
+        assert store.get("https://news.example.com/3")["title"] == "3"
+    assert threading.current_thread().name not in threads
+
+
+@pytest.mark.asyncio
+async def test_malformed_urls_are_skipped_and_do_not_break_recovery(tmp_path):
+    config = SegmentStoreConfig(root=str(tmp_path))
+    store = SegmentStore(config)
+    bad = [{"url": "http://[bad/x"}, {"url": "https://news.example.com:99999/x"}]
+    await store.put_many([record(0), *bad, record(1)])
+    assert len(store) == 2 and store.skipped == 2
+    assert [r["title"] for r in store.replay()] == ["0", "1"]
+
+    # 검증 전에 쓰인 프레임이 남아 있고 정상 종료되지 않은 경우
+    payload = store.codec.encode(bad[0])
+    store._active.write(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+    store.put(record(2))
+    store.sync()
+
+    with SegmentStore(config) as reopened:
+        assert len(reopened) == 3
+        assert [r["title"] for r in reopened.replay()] == ["0", "1", "2"]
+        assert reopened.get("https://news.example.com/2")["title"] == "2"
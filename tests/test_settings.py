@@ -0,0 +1,41 @@
+import sys
+
+[sys.path.append(i) for i in [".", ".."]]
+
+import os
+
+from configs.settings import ApiSettings, SettingsRegistry, read_url_conf, read_yaml
+
+
+def test_env_overrides_url_conf(tmp_path, monkeypatch):
+    conf = tmp_path / "url.conf"
+    conf.write_text(
+        "[naver]\nX-Naver-Client-Id = file-id\nX-Naver-Client-Secret = s\n"
+        "NAVER_URL = https://naver\n[daum]\nDAUM_URL = https://daum\n"
+        "Authorization = a\n[Mongo]\nuri = mongodb://file\n"
+    )
+    monkeypatch.setenv("CRAWLER_NAVER__CLIENT_ID", "env-id")
+
+    settings = ApiSettings(**read_url_conf(conf))
+
+    assert settings.naver.client_id == "env-id"
+    assert settings.naver.url == "https://naver"
+    assert settings.mongo.uri == "mongodb://file"
+
+
+def test_registry_loads_once_and_reloads_on_mtime(tmp_path):
+    path = tmp_path / "keyword.yaml"
+    path.write_text("value: 1\n")
+    registry = SettingsRegistry(check_interval=0)
+    registry.register("keyword", lambda: read_yaml(path), path)
+
+    assert registry.get("keyword") == {"value": 1}
+    assert registry.get("keyword") is registry.get("keyword")
+    assert registry.loads("keyword") == 1
+
+    path.write_text("value: 2\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert registry.get("keyword") == {"value": 2}
+    assert registry.loads("keyword") == 2
@@ -0,0 +1,126 @@
+"""공용 헬퍼"""
+
+import re
+import hashlib
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+import numpy as np
+
+
+T = TypeVar("T")
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """공백/대소문자 차이를 제거한 비교용 텍스트"""
+    return " ".join(_WORD_PATTERN.findall(text.lower()))
+
+
+def content_hash(*parts: str) -> str:
+    """여러 문자열을 이어 붙인 sha256 해시
+
+    Returns:
+        str: hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def simhash(text: str) -> int:
+    """문자 3-gram 기반 64bit SimHash (유사 문서 판별용)
+
+    Args:
+        text (str): 본문
+
+    Returns:
+        int: SimHash 지문
+    """
+    normalized = normalize_text(text)
+    shingles = (
+        [normalized[i : i + 3] for i in range(len(normalized) - 2)]
+        if len(normalized) > 3
+        else [normalized]
+    )
+    values = np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+            )
+            for shingle in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    bits = (values[:, None] >> np.arange(64, dtype=np.uint64)) & np.uint64(1)
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 - len(shingles)
+    return sum(1 << bit for bit in np.flatnonzero(votes > 0).tolist())
+
+
+def hamming_distance(left: int, right: int) -> int:
+    """두 지문의 해밍 거리"""
+    return (left ^ right).bit_count()
+
+
+class SimHashIndex:
+    """밴드 분할 기반 SimHash 근접 검색
+
+    64bit 지문을 (distance + 1)개 밴드로 나누면 해밍 거리 distance 이하인 두 지문은
+    비둘기집 원리로 최소 한 밴드가 일치하므로, 같은 밴드 후보만 비교한다.
+    """
+
+    def __init__(self, distance: int = 6) -> None:
+        """
+        Args:
+            distance (int): 같은 문서로 볼 최대 해밍 거리
+        """
+        self.distance = distance
+        bands = distance + 1
+        width = -(-64 // bands)
+        self._bands = [(start, min(width, 64 - start)) for start in range(0, 64, width)]
+        self._buckets: list[dict[int, list[tuple[int, object]]]] = [
+            {} for _ in self._bands
+        ]
+
+    def _keys(self, fingerprint: int) -> list[int]:
+        return [
+            fingerprint >> start & ((1 << width) - 1) for start, width in self._bands
+        ]
+
+    def find(self, fingerprint: int) -> object | None:
+        """해밍 거리 이내로 등록된 값 조회"""
+        for bucket, key in zip(self._buckets, self._keys(fingerprint)):
+            for candidate, value in bucket.get(key, ()):
+                if hamming_distance(candidate, fingerprint) <= self.distance:
+                    return value
+        return None
+
+    def add(self, fingerprint: int, value: object) -> None:
+        """지문 등록"""
+        for bucket, key in zip(self._buckets, self._keys(fingerprint)):
+            bucket.setdefault(key, []).append((fingerprint, value))
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """반복자를 size 개씩 나눈 리스트로 순회 (전체를 메모리에 올리지 않음)"""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def iter_unique(items: Iterable[str]) -> Iterator[str]:
+    """처음 나온 문자열만 흘려보내는 스트리밍 중복 제거
+
+    원문 대신 8바이트 다이제스트만 기억하므로 메모리는 고유 항목 수 x 정수 1개 수준이다.
+    """
+    seen: set[int] = set()
+    for item in items:
+        digest = int.from_bytes(
+            hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        if digest not in seen:
+            seen.add(digest)
+            yield item
@@ -0,0 +1,181 @@
+"""Aho-Corasick 기반 다중 키워드 매칭"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable
+
+import pandas as pd
+
+
+KEYWORD_CSV_PATH = "config/keywords.csv"
+
+
+def _is_word(char: str | None) -> bool:
+    """정규식 ``\\w`` 와 같은 기준의 단어 문자 판별"""
+    return char is not None and (char.isalnum() or char == "_")
+
+
+@dataclass
+class KeywordScan:
+    """본문 한 번 순회로 얻은 키워드 매칭 결과
+
+    Args:
+        counts (dict[str, int]): ``\\b키워드\\b`` 기준 키워드별 개수 (많은 순)
+        positions (dict[str, list[int]]): ``\\b키워드\\b`` 기준 매칭 시작 위치
+        sentence_hits (list[int]): ``"."`` 로 나눈 문장별 키워드 포함 개수 (경계 무시)
+    """
+
+    counts: dict[str, int] = field(default_factory=dict)
+    positions: dict[str, list[int]] = field(default_factory=dict)
+    sentence_hits: list[int] = field(default_factory=list)
+
+    @property
+    def sentence_count(self) -> int:
+        """전체 문장 수 (``content.split(".")`` 길이)"""
+        return len(self.sentence_hits)
+
+    @property
+    def valid_sentence_count(self) -> int:
+        """키워드가 하나라도 포함된 문장 수"""
+        return sum(1 for hit in self.sentence_hits if hit)
+
+    @property
+    def total_count(self) -> int:
+        """경계 기준 전체 키워드 개수"""
+        return sum(self.counts.values())
+
+
+class KeywordMatcher:
+    """키워드 목록을 Aho-Corasick 오토마톤으로 컴파일한 매처"""
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Args:
+            keywords (Iterable[str]): 키워드 목록 (빈 문자열과 중복은 제외)
+        """
+        self.keywords: list[str] = list(
+            dict.fromkeys(keyword for keyword in keywords if keyword)
+        )
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple[int, ...]] = [()]
+        self._build()
+        self._lengths = [len(keyword) for keyword in self.keywords]
+        self._in_sentence = ["." not in keyword for keyword in self.keywords]
+
+    def _build(self) -> None:
+        """트라이 구성 후 BFS로 실패 링크와 출력 집합 연결"""
+        outputs: list[list[int]] = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._output = [tuple(output) for output in outputs]
+
+    def scan(self, content: str) -> KeywordScan:
+        """본문을 한 번 순회하며 개수, 위치, 문장별 매칭을 함께 계산
+
+        Args:
+            content (str): 기사 본문
+
+        Returns:
+            KeywordScan: 매칭 결과
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        lengths, in_sentence = self._lengths, self._in_sentence
+        last_end = [0] * len(self.keywords)
+        positions: dict[int, list[int]] = {}
+        sentence_hits = [0]
+        size = len(content)
+
+        state = 0
+        for end, char in enumerate(content):
+            if char == ".":
+                sentence_hits.append(0)
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for index in output[state]:
+                start = end - lengths[index] + 1
+                # 같은 키워드 안에 "." 이 없다면 현재 문장 안의 매칭
+                if in_sentence[index]:
+                    sentence_hits[-1] += 1
+
+                # re.findall(\b키워드\b) 와 동일한 비중첩/경계 조건
+                if start < last_end[index]:
+                    continue
+                before = content[start - 1] if start > 0 else None
+                after = content[end + 1] if end + 1 < size else None
+                if _is_word(before) == _is_word(content[start]):
+                    continue
+                if _is_word(content[end]) == _is_word(after):
+                    continue
+                last_end[index] = end + 1
+                positions.setdefault(index, []).append(start)
+
+        counts = sorted(
+            (
+                (self.keywords[index], len(found))
+                for index, found in sorted(positions.items())
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return KeywordScan(
+            counts=dict(counts),
+            positions={
+                self.keywords[index]: found for index, found in positions.items()
+            },
+            sentence_hits=sentence_hits,
+        )
+
+
+@lru_cache(maxsize=None)
+def load_keywords(path: str = KEYWORD_CSV_PATH) -> tuple[str, ...]:
+    """키워드 CSV 로드 (헤더 행이 키워드 목록, 실행 중 1회만 읽음)
+
+    Args:
+        path (str): 키워드 CSV 경로
+
+    Returns:
+        tuple[str, ...]: 키워드 목록
+    """
+    return tuple(str(keyword) for keyword in pd.read_csv(path).columns)
+
+
+@lru_cache(maxsize=None)
+def get_keyword_matcher(path: str = KEYWORD_CSV_PATH) -> KeywordMatcher:
+    """실행 전체에서 공유하는 키워드 오토마톤
+
+    Args:
+        path (str): 키워드 CSV 경로
+
+    Returns:
+        KeywordMatcher: 컴파일된 매처
+    """
+    return KeywordMatcher(load_keywords(path))
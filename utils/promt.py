@@ -1,9 +1,15 @@
 import os
+import json
+import asyncio
 import openai
 from pathlib import Path
 from typing import Any
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
+from utils.helpers import SimHashIndex, content_hash, simhash
+from utils.retry_handler import async_retry
+
 
 # 데이터 로드
 key_path = Path(__file__).parent.parent / "configs/.env"
@@ -11,33 +17,37 @@ load_dotenv(key_path)
 
 openai.api_key = os.getenv("API_KEY")
 
+# 프롬프트 문구가 바뀌면 올려서 기존 캐시를 무효화
+PROMPT_VERSION = "v1"
+SYSTEM_PROMPT = "You are an assistant that summarizes data."
+EVALUATION_CRITERIA = """
+    이 문서를 다음 기준으로 평가해주세요:
+    1. 시그니처 키워드의 중요도 (0~5점)
+    2. 문서가 최신 AI 트렌드와 얼마나 관련이 있는지 (0~5점)
+    3. 출처의 신뢰도 점수 (0~5점)
+    4. 종합 점수 (0~100점): 위 기준을 종합해서 부여
 
-def llm_weighted_evaluation(text: str, source: str, date: str, signature_keywords: list) -> str:
-    """
-    LLM에게 문서 가치를 평가하도록 요청.
-    Args:
-        text (str): 문서 본문
-        source (str): 문서 출처
-        date (str): 문서 작성 날짜
-        signature_keywords (list): 시그니처 키워드 리스트
-    Returns:
-        str: LLM 평가 결과 (JSON 형식)
-    """
-    
-    prompt = f"""
+"""
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+def build_evaluation_prompt(
+    text: str, source: str, date: str, signature_keywords: list
+) -> str:
+    """문서 1건 평가 프롬프트"""
+    return f"""
     다음은 뉴스 기사 문서입니다:
     출처: {source}
     날짜: {date}
     본문: "{text}"
 
     시그니처 키워드 목록: {', '.join(signature_keywords)}
-
-    이 문서를 다음 기준으로 평가해주세요:
-    1. 시그니처 키워드의 중요도 (0~5점)
-    2. 문서가 최신 AI 트렌드와 얼마나 관련이 있는지 (0~5점)
-    3. 출처의 신뢰도 점수 (0~5점)
-    4. 종합 점수 (0~100점): 위 기준을 종합해서 부여
-
+{EVALUATION_CRITERIA}
     출력 형식 (JSON):
     {{
         "키워드 중요도": [점수],
@@ -46,16 +56,285 @@ def llm_weighted_evaluation(text: str, source: str, date: str, signature_keyword
         "종합 점수": [점수]
     }}
     """
-    
+
+
+def llm_weighted_evaluation(text: str, source: str, date: str, signature_keywords: list) -> str:
+    """
+    LLM에게 문서 가치를 평가하도록 요청.
+    Args:
+        text (str): 문서 본문
+        source (str): 문서 출처
+        date (str): 문서 작성 날짜
+        signature_keywords (list): 시그니처 키워드 리스트
+    Returns:
+        str: LLM 평가 결과 (JSON 형식)
+    """
+
+    prompt = build_evaluation_prompt(text, source, date, signature_keywords)
+
     response = openai.chat.completions.create(
         model="gpt-4o",  # 사용하려는 모델
         messages=[
-            {"role": "system", "content": "You are an assistant that summarizes data."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ],
         max_tokens=1500
     )
-            
+
     return response.choices[0].message.content.strip()
 
 
+@dataclass(frozen=True)
+class LLMDocument:
+    """LLM 평가 대상 문서"""
+
+    text: str
+    source: str
+    date: str
+    signature_keywords: tuple[str, ...] = ()
+
+    @property
+    def cache_key(self) -> str:
+        """본문 해시 + 프롬프트 버전 기반 캐시 키"""
+        return content_hash(
+            PROMPT_VERSION,
+            self.text,
+            self.source,
+            self.date,
+            ",".join(self.signature_keywords),
+        )
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """토큰 예산 초과"""
+
+
+@dataclass
+class TokenBudget:
+    """요청 전 예상 토큰을 예약하고 응답의 실제 사용량으로 정산
+
+    Args:
+        limit (int | None): 총 토큰 예산 (None이면 무제한)
+    """
+
+    limit: int | None = None
+    reserved: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def used(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @staticmethod
+    def estimate(text: str, max_tokens: int) -> int:
+        """한글 기준 보수적 토큰 추정 (글자당 1토큰 + 응답 상한)"""
+        return len(text) + max_tokens
+
+    def reserve(self, tokens: int) -> None:
+        if self.limit is not None and self.used + self.reserved + tokens > self.limit:
+            raise TokenBudgetExceeded(
+                f"토큰 예산 초과 --> 사용 {self.used}, 예약 {self.reserved}, 요청 {tokens}"
+            )
+        self.reserved += tokens
+
+    def settle(self, reserved: int, usage: Any | None) -> None:
+        self.reserved -= reserved
+        if usage is not None:
+            self.prompt_tokens += usage.prompt_tokens or 0
+            self.completion_tokens += usage.completion_tokens or 0
+        else:
+            self.prompt_tokens += reserved
+
+
+@dataclass
+class EvaluationStats:
+    """평가 서비스 통계"""
+
+    requested: int = 0
+    cache_hits: int = 0
+    deduplicated: int = 0
+    api_calls: int = 0
+    batched_documents: int = 0
+    failures: int = 0
+
+
+@dataclass
+class LLMEvaluationService:
+    """동시성 제한, 캐시, 유사 문서 제거, 소형 문서 배치를 적용한 비동기 LLM 평가
+
+    Args:
+        client (openai.AsyncOpenAI | None): OpenAI 호환 클라이언트 (None이면 API_KEY 사용)
+        model (str): 모델 이름
+        max_concurrency (int): 동시 요청 수
+        max_tokens (int): 문서 1건 응답 토큰 상한
+        budget (TokenBudget): 토큰 예산
+        batch_char_limit (int): 이 길이 이하 문서는 배치 요청 대상
+        max_batch_size (int): 배치 요청 1건의 최대 문서 수
+        similarity_distance (int): 같은 결과를 재사용할 SimHash 해밍 거리
+        cache (dict[str, str]): 캐시 키 -> 평가 결과
+    """
+
+    client: openai.AsyncOpenAI | None = None
+    model: str = "gpt-4o"
+    max_concurrency: int = 8
+    max_tokens: int = 1500
+    budget: TokenBudget = field(default_factory=TokenBudget)
+    batch_char_limit: int = 1500
+    max_batch_size: int = 5
+    similarity_distance: int = 6
+    cache: dict[str, str] = field(default_factory=dict)
+    stats: EvaluationStats = field(default_factory=EvaluationStats)
+
+    def __post_init__(self) -> None:
+        if self.client is None:
+            self.client = openai.AsyncOpenAI(api_key=os.getenv("API_KEY"))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    @async_retry(attempts=4, base_delay=1.0, exceptions=RETRYABLE_ERRORS)
+    async def _complete(self, prompt: str, max_tokens: int) -> str:
+        """동시성/토큰 예산을 적용한 단일 chat completion 호출"""
+        reserved = self.budget.estimate(prompt, max_tokens)
+        self.budget.reserve(reserved)
+        usage = None
+        try:
+            async with self._semaphore:
+                self.stats.api_calls += 1
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=max_tokens,
+                )
+            usage = response.usage
+            return response.choices[0].message.content.strip()
+        finally:
+            self.budget.settle(reserved, usage)
+
+    def _batch_prompt(self, documents: list[LLMDocument]) -> str:
+        """소형 문서 여러 건을 한 번에 평가하는 프롬프트"""
+        body = "\n".join(
+            f"""
+    [{index}]
+    출처: {document.source}
+    날짜: {document.date}
+    본문: "{document.text}"
+    시그니처 키워드 목록: {', '.join(document.signature_keywords)}"""
+            for index, document in enumerate(documents)
+        )
+        return f"""
+    다음은 뉴스 기사 문서 {len(documents)}건입니다:
+{body}
+{EVALUATION_CRITERIA}
+    각 문서를 평가하고 출력 형식 (JSON 배열, 문서 번호 순서):
+    [
+        {{"id": [문서 번호], "키워드 중요도": [점수], "AI 트렌드 관련도": [점수], "출처 신뢰도": [점수], "종합 점수": [점수]}}
+    ]
+    """
+
+    async def _evaluate_single(self, document: LLMDocument) -> str:
+        prompt = build_evaluation_prompt(
+            document.text, document.source, document.date, document.signature_keywords
+        )
+        return await self._complete(prompt, self.max_tokens)
+
+    async def _evaluate_batch(self, documents: list[LLMDocument]) -> list[str]:
+        """배치 평가, 응답이 형식에 맞지 않으면 문서별 요청으로 대체"""
+        if len(documents) == 1:
+            return [await self._evaluate_single(documents[0])]
+
+        content = await self._complete(
+            self._batch_prompt(documents), self.max_tokens * len(documents)
+        )
+        try:
+            items = json.loads(content.removeprefix("```json").strip("`\n "))
+            by_id = {int(item.pop("id")): item for item in items}
+            results = [
+                json.dumps(by_id[index], ensure_ascii=False)
+                for index in range(len(documents))
+            ]
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return list(
+                await asyncio.gather(*(self._evaluate_single(d) for d in documents))
+            )
+        self.stats.batched_documents += len(documents)
+        return results
+
+    def _deduplicate(
+        self, documents: list[LLMDocument]
+    ) -> tuple[list[LLMDocument], dict[str, str]]:
+        """캐시 키 및 SimHash 기준으로 대표 문서만 남김
+
+        출처/날짜도 프롬프트에 들어가 점수(출처 신뢰도 등)가 달라지므로
+        (출처, 날짜, 시그니처 키워드) 가 같은 문서끼리만 본문 유사도로 묶음
+
+        Returns:
+            tuple[list[LLMDocument], dict[str, str]]: (대표 문서, 문서 키 -> 대표 문서 키)
+        """
+        representatives: list[LLMDocument] = []
+        indexes: dict[tuple[str, str, tuple[str, ...]], SimHashIndex] = {}
+        alias: dict[str, str] = {}
+        for document in documents:
+            key = document.cache_key
+            if key in alias:
+                continue
+            index = indexes.setdefault(
+                (document.source, document.date, document.signature_keywords),
+                SimHashIndex(self.similarity_distance),
+            )
+            fingerprint = simhash(document.text)
+            match = index.find(fingerprint)
+            if match is None:
+                representatives.append(document)
+                index.add(fingerprint, document)
+                alias[key] = key
+            else:
+                alias[key] = match.cache_key
+                self.stats.deduplicated += 1
+        return representatives, alias
+
+    async def evaluate_many(self, documents: list[LLMDocument]) -> list[str | None]:
+        """여러 문서 평가
+
+        Args:
+            documents (list[LLMDocument]): 평가 대상
+
+        Returns:
+            list[str | None]: 입력 순서대로의 평가 결과 (JSON 문자열, 실패 시 None)
+        """
+        self.stats.requested += len(documents)
+        pending = [d for d in documents if d.cache_key not in self.cache]
+        self.stats.cache_hits += len(documents) - len(pending)
+
+        representatives, alias = self._deduplicate(pending)
+        small = [d for d in representatives if len(d.text) <= self.batch_char_limit]
+        large = [d for d in representatives if len(d.text) > self.batch_char_limit]
+        groups = [
+            small[i : i + self.max_batch_size]
+            for i in range(0, len(small), self.max_batch_size)
+        ] + [[document] for document in large]
+
+        outcomes = await asyncio.gather(
+            *(self._evaluate_batch(group) for group in groups), return_exceptions=True
+        )
+        for group, outcome in zip(groups, outcomes):
+            if isinstance(outcome, BaseException):
+                self.stats.failures += len(group)
+                continue
+            for document, result in zip(group, outcome):
+                self.cache[document.cache_key] = result
+
+        results: list[str | None] = []
+        for document in documents:
+            key = alias.get(document.cache_key, document.cache_key)
+            result = self.cache.get(key)
+            if result is not None:
+                self.cache.setdefault(document.cache_key, result)
+            results.append(result)
+        return results
+
+    async def evaluate(self, document: LLMDocument) -> str | None:
+        """문서 1건 평가"""
+        return (await self.evaluate_many([document]))[0]
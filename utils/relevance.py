@@ -0,0 +1,172 @@
+"""HashingVectorizer 기반 증분 관련도 인덱스"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from databases.keyword_generator import (
+    BaseCountry,
+    canonical_keywords,
+    load_countries_from_yaml,
+)
+
+
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z]+|\d+")
+# 길이가 긴 조사부터 제거
+JOSA_SUFFIXES = (
+    "에서는", "으로는", "에서", "으로", "에게", "까지", "부터", "보다", "처럼",
+    "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도", "만",
+)  # fmt: skip
+
+
+def korean_tokenizer(text: str) -> list[str]:
+    """한국어 친화 토크나이저
+
+    영문은 소문자 단어, 한글은 조사를 뗀 어절과 음절 bigram 으로 분리한다.
+    형태소 분석기(konlpy) 없이 합성어("생성형인공지능")와 띄어쓰기 변형을 흡수한다.
+
+    Args:
+        text (str): 본문
+
+    Returns:
+        list[str]: 토큰 목록
+            - ex) "인공지능이 바꾼" -> ["인공지능", "인공", "공지", "지능", "바꾼"]
+    """
+    tokens: list[str] = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if "가" <= token[0] <= "힣":
+            for suffix in JOSA_SUFFIXES:
+                if len(token) > len(suffix) + 1 and token.endswith(suffix):
+                    token = token[: -len(suffix)]
+                    break
+            tokens.append(token)
+            if len(token) > 2:
+                tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def load_keyword_topics(
+    countries: dict[str, BaseCountry] | None = None,
+) -> dict[str, str]:
+    """keyword.yaml 의 core_keywords 를 관련도 토픽으로 변환 (정규화된 키워드 기준)
+
+    Returns:
+        dict[str, str]: {"KR:인공지능": "인공지능", ~}
+    """
+    countries = countries or load_countries_from_yaml()
+    return {
+        f"{code}:{keyword}": keyword
+        for code, country in countries.items()
+        for keyword in canonical_keywords(country.core_keywords, country.synonyms)
+    }
+
+
+class IncrementalRelevanceIndex:
+    """스트리밍 기사 배치의 토픽 관련도 계산기
+
+    어휘 학습 없이 해싱 공간(n_features)에서 문서 빈도(df)만 누적하므로
+    메모리는 n_features 에 고정되고, 배치 비용은 배치의 토큰 수에 비례한다.
+    """
+
+    def __init__(
+        self,
+        topics: dict[str, str] | None = None,
+        n_features: int = 2**18,
+        decay: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            topics (dict[str, str] | None): 토픽 이름 -> 토픽 텍스트 (None이면 keyword.yaml)
+            n_features (int): 해싱 공간 크기
+            decay (float): 배치마다 과거 문서 빈도에 곱하는 감쇠율 (1.0이면 누적)
+        """
+        self.topics = topics if topics is not None else load_keyword_topics()
+        self.decay = decay
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            tokenizer=korean_tokenizer,
+            token_pattern=None,
+            lowercase=False,
+            alternate_sign=False,
+            norm=None,
+        )
+        self.document_frequency = np.zeros(n_features, dtype=np.float64)
+        self.document_count = 0.0
+        self._topic_counts = self.vectorizer.transform(list(self.topics.values()))
+
+    def idf(self) -> np.ndarray:
+        """현재까지 누적된 문서 빈도로 계산한 smooth idf"""
+        return (
+            np.log((1.0 + self.document_count) / (1.0 + self.document_frequency)) + 1.0
+        )
+
+    def partial_fit(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """배치의 문서 빈도를 누적 (재학습 없음)
+
+        Args:
+            texts (Iterable[str]): 기사 본문 배치
+
+        Returns:
+            sparse.csr_matrix: 배치의 해싱 tf 행렬
+        """
+        counts = self.vectorizer.transform(texts)
+        if self.decay != 1.0:
+            self.document_frequency *= self.decay
+            self.document_count *= self.decay
+        present = counts.copy()
+        present.data[:] = 1.0
+        self.document_frequency += np.asarray(present.sum(axis=0)).ravel()
+        self.document_count += counts.shape[0]
+        return counts
+
+    def _weighted(
+        self, counts: sparse.csr_matrix, idf: np.ndarray
+    ) -> sparse.csr_matrix:
+        """tf-idf 가중 후 L2 정규화"""
+        weighted = counts.multiply(idf).tocsr()
+        return normalize(weighted, norm="l2", copy=False)
+
+    def score_batch(self, texts: Iterable[str], update: bool = True) -> pd.DataFrame:
+        """배치 기사의 토픽별 관련도 (코사인 유사도)
+
+        Args:
+            texts (Iterable[str]): 기사 본문 배치
+            update (bool): 점수 계산 전 문서 빈도 누적 여부
+
+        Returns:
+            pd.DataFrame: 토픽별 점수 + relevance(최댓값), topic(최고 토픽) 컬럼
+        """
+        texts = list(texts)
+        if not texts:
+            return pd.DataFrame(columns=[*self.topics, "relevance", "topic"])
+        if update:
+            counts = self.partial_fit(texts)
+        else:
+            counts = self.vectorizer.transform(texts)
+
+        idf = self.idf()
+        similarity = (
+            self._weighted(counts, idf) @ self._weighted(self._topic_counts, idf).T
+        ).toarray()
+
+        topics = list(self.topics)
+        frame = pd.DataFrame(similarity, columns=topics)
+        if not topics:
+            frame["relevance"], frame["topic"] = 0.0, None
+            return frame
+
+        best = similarity.argmax(axis=1)
+        frame["relevance"] = similarity[np.arange(len(texts)), best]
+        frame["topic"] = np.where(
+            frame["relevance"] > 0, np.asarray(topics, dtype=object)[best], None
+        )
+        return frame
@@ -0,0 +1,59 @@
+"""비동기 재시도 유틸"""
+
+import asyncio
+import random
+import functools
+from typing import Awaitable, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """지수 백오프 + full jitter 지연 시간
+
+    Args:
+        attempt (int): 0부터 시작하는 재시도 횟수
+        base_delay (float): 첫 지연 (초)
+        max_delay (float): 최대 지연 (초)
+
+    Returns:
+        float: 대기할 시간 (초)
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+def async_retry(
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+    exceptions: tuple[type[BaseException], ...] = (Exception,),
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """일시적 오류에 대해 코루틴을 재시도하는 데코레이터
+
+    Args:
+        attempts (int): 최초 호출을 포함한 최대 시도 횟수
+        base_delay (float): 첫 지연 (초)
+        max_delay (float): 최대 지연 (초)
+        exceptions (tuple[type[BaseException], ...]): 재시도 대상 예외
+
+    Returns:
+        - 작성 방식 \n
+            >>> @async_retry(attempts=5, exceptions=(ConnectionError,))
+            ... async def fetch(): ...
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            for attempt in range(attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions:
+                    if attempt == attempts - 1:
+                        raise
+                    await asyncio.sleep(backoff_delay(attempt, base_delay, max_delay))
+
+        return wrapper
+
+    return decorator
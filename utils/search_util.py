@@ -1,7 +1,8 @@
-from collections import Counter
 from datetime import datetime
+from functools import cached_property
+from typing import Iterable
 
-import re
+import numpy as np
 import pandas as pd
 
 import time
@@ -16,9 +17,9 @@ from selenium.common.exceptions import (
     ElementNotInteractableException,
 )
 
-
-from crawling.src.core.types import ChromeDriver
-from crawling.config.setting import WITH_TIME
+from common.types import ChromeDriver
+from common.selenium_utils import WITH_TIME
+from utils.keyword_matcher import KeywordMatcher, KeywordScan, get_keyword_matcher
 
 
 def web_element_clicker(driver: ChromeDriver, xpath: str):
@@ -110,31 +111,32 @@ class NewsWeightScoring:
         content: str,
         published_date: datetime,
         timestamp: datetime,
+        matcher: KeywordMatcher | None = None,
     ) -> None:
         """
         Args:
             content (str): 기사 본문
-            keywords (list[str]): 키워드 (가상화폐 및 관련 카테고리)
             published_date (datetime): 기사 생성 날짜
             timestamp (datetime): 현재 날짜
+            matcher (KeywordMatcher | None): 키워드 오토마톤 (None이면 공유 오토마톤 사용)
         """
         self.content = content
-        self.keywords = pd.read_csv("config/keywords.csv")
+        self.matcher = matcher or get_keyword_matcher()
+        self.keywords = self.matcher.keywords
         self.published_date = published_date
         self.current_date = timestamp
 
+    @cached_property
+    def keyword_scan(self) -> KeywordScan:
+        """본문 1회 순회 결과 (개수, 위치, 문장별 매칭)"""
+        return self.matcher.scan(self.content)
+
     def find_keywords(self) -> dict[str, int]:
         """
         Returns:
             dict: 발견된 키워드와 그 개수를 포함하는 딕셔너리
         """
-        found_keywords = (
-            keyword
-            for keyword in self.keywords
-            for keyword in re.findall(rf"\b{re.escape(keyword)}\b", self.content)
-        )
-        keyword_count = Counter(found_keywords)
-        return keyword_count.most_common()
+        return self.keyword_scan.counts
 
     def calculate_length_weight(self) -> float:
         """
@@ -150,13 +152,8 @@ class NewsWeightScoring:
         Returns:
             float: 문장당 키워드 개수에 대한 가중치 (최대 0.3점)
         """
-        sentences = self.content.split(".")
-        valid_sentence_count = sum(
-            1
-            for sentence in sentences
-            if any(keyword in sentence for keyword in self.keywords)
-        )
-        total_sentences = len(sentences)
+        valid_sentence_count = self.keyword_scan.valid_sentence_count
+        total_sentences = self.keyword_scan.sentence_count
         weight = 0.0
 
         if total_sentences > 0:
@@ -171,8 +168,7 @@ class NewsWeightScoring:
         Returns:
             float: 유효 키워드 개수 및 비율에 대한 가중치 (최대 0.2점)
         """
-        keyword_count = self.find_keywords()
-        valid_keyword_count = sum(keyword_count.values())
+        valid_keyword_count = self.keyword_scan.total_count
         total_word_count = len(self.content.split())
         weight = 0.0
 
@@ -213,3 +209,104 @@ class NewsWeightScoring:
         )
 
         return min(total_weight, 1.0)  # 최대 가중치는 1.0
+
+    @classmethod
+    def batch_total_weight(
+        cls,
+        contents: Iterable[str],
+        published_dates: Iterable[datetime],
+        timestamps: Iterable[datetime],
+        matcher: KeywordMatcher | None = None,
+    ) -> np.ndarray:
+        """여러 기사의 총 가중치를 한 번에 계산 (calculate_total_weight 와 동일 결과)
+
+        Args:
+            contents (Iterable[str]): 기사 본문 배열
+            published_dates (Iterable[datetime]): 기사 생성 날짜 배열
+            timestamps (Iterable[datetime]): 현재 날짜 배열
+            matcher (KeywordMatcher | None): 키워드 오토마톤 (None이면 공유 오토마톤 사용)
+
+        Returns:
+            np.ndarray: 기사별 총 가중치 점수
+        """
+        matcher = matcher or get_keyword_matcher()
+        contents = list(contents)
+
+        # 본문 순회는 기사당 1회 (단어 수 + 키워드 스캔)
+        word_count = np.fromiter(
+            (len(content.split()) for content in contents), dtype=np.int64
+        )
+        scans = [matcher.scan(content) for content in contents]
+        sentence_total = np.fromiter(
+            (scan.sentence_count for scan in scans), dtype=np.int64
+        )
+        sentence_valid = np.fromiter(
+            (scan.valid_sentence_count for scan in scans), dtype=np.int64
+        )
+        keyword_total = np.fromiter(
+            (scan.total_count for scan in scans), dtype=np.int64
+        )
+
+        # 길이 가중치 (최대 0.1점)
+        length_weight = np.minimum((word_count / 1000) * 0.01, 0.1)
+
+        # 날짜 가중치 (최대 0.4점)
+        elapsed = pd.to_datetime(pd.Series(list(timestamps))) - pd.to_datetime(
+            pd.Series(list(published_dates))
+        )
+        quarters_passed = elapsed.dt.days.to_numpy(dtype=np.int64) // 90
+        date_weight = np.maximum(0.4 - (quarters_passed * 0.1), 0.0)
+
+        # 문장당 키워드 가중치 (최대 0.3점)
+        keyword_ratio = sentence_valid / sentence_total
+        sentence_keyword_weight = np.where(
+            sentence_valid >= 4, 0.3 * np.minimum(keyword_ratio * 1.0, 1.0), 0.0
+        )
+
+        # 유효 키워드 가중치 (최대 0.2점)
+        keyword_percentage = np.divide(
+            keyword_total,
+            word_count,
+            out=np.zeros(len(contents), dtype=np.float64),
+            where=word_count > 0,
+        )
+        valid_keyword_weight = np.where(keyword_total >= 30, 0.1, 0.0) + (
+            keyword_percentage * 0.1
+        )
+
+        total_weight = (
+            length_weight + sentence_keyword_weight + valid_keyword_weight + date_weight
+        )
+        return np.minimum(total_weight, 1.0)
+
+    @classmethod
+    def score_frame(
+        cls,
+        frame: pd.DataFrame,
+        content_column: str = "content",
+        published_column: str = "published_date",
+        timestamp_column: str = "timestamp",
+        score_column: str = "score",
+        matcher: KeywordMatcher | None = None,
+    ) -> pd.DataFrame:
+        """DataFrame 단위 가중치 계산
+
+        Args:
+            frame (pd.DataFrame): 기사 DataFrame
+            content_column (str): 본문 컬럼
+            published_column (str): 기사 생성 날짜 컬럼
+            timestamp_column (str): 현재 날짜 컬럼
+            score_column (str): 결과 점수 컬럼
+            matcher (KeywordMatcher | None): 키워드 오토마톤
+
+        Returns:
+            pd.DataFrame: 점수 컬럼이 추가된 DataFrame 사본
+        """
+        scored = frame.copy()
+        scored[score_column] = cls.batch_total_weight(
+            frame[content_column],
+            frame[published_column],
+            frame[timestamp_column],
+            matcher=matcher,
+        )
+        return scored